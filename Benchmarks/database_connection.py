@@ -0,0 +1,89 @@
+"""
+Micro-benchmark comparing the old connection handling (open/commit/close a new connection per call) with the pooled one
+(`Code/Utilities/database_connection_sqlite3.py`) for 10k single-row updates of the Players's table.
+
+Run from the repository root:
+    python -m Benchmarks.database_connection
+"""
+import os
+import sqlite3
+import tempfile
+import time
+
+from Code.Utilities import database_connection_sqlite3 as database
+
+N_PLAYERS = 1000
+N_UPDATES = 10_000
+RANKS = ['A', 'B', 'C', 'D', 'F']
+
+
+def _create_database(db_path: str) -> None:
+    """Create the Players's table (same schema as `Database/init.py`) filled with `N_PLAYERS` players."""
+    conn = sqlite3.connect(db_path)
+    conn.execute('''
+    CREATE TABLE IF NOT EXISTS players (
+        id INTEGER PRIMARY KEY NOT NULL,
+        amq TEXT UNIQUE NOT NULL,
+        rank TEXT DEFAULT 'None',
+        is_banned BOOLEAN DEFAULT 0,
+        is_list_banned BOOLEAN DEFAULT 0
+    );
+    ''')
+    conn.executemany('INSERT INTO players (id, amq) VALUES (?, ?)', [(i, f'player_{i}') for i in range(N_PLAYERS)])
+    conn.commit()
+    conn.close()
+
+
+def _old_connection_manager(db_path: str) -> callable:
+    """Connection manager as it was before the pool: a new connection is opened (and closed) for every call."""
+    def decorator(func: callable) -> callable:
+        def wrapper(*args, **kwargs):
+            conn = sqlite3.connect(db_path)
+            cur = conn.cursor()
+            try:
+                result = func(*args, **kwargs, cur=cur)
+                conn.commit()
+            except Exception as e:
+                conn.rollback()
+                raise e
+            finally:
+                cur.close()
+                conn.close()
+            return result
+        return wrapper
+    return decorator
+
+
+def _change_player_rank(discord_id: int, new_rank: str, cur: sqlite3.Cursor = None) -> None:
+    cur.execute('UPDATE players SET rank = ? WHERE id = ?', (new_rank, discord_id))
+
+
+def _run(change_player_rank: callable) -> float:
+    """Return the seconds needed to apply `N_UPDATES` rank changes with `change_player_rank`."""
+    start = time.perf_counter()
+    for i in range(N_UPDATES):
+        change_player_rank(i % N_PLAYERS, RANKS[i % len(RANKS)])
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    with tempfile.TemporaryDirectory() as directory:
+        old_db_path = os.path.join(directory, 'old.db')
+        new_db_path = os.path.join(directory, 'new.db')
+        _create_database(old_db_path)
+        _create_database(new_db_path)
+
+        old_elapsed = _run(_old_connection_manager(old_db_path)(_change_player_rank))
+
+        database.configure_connection_pool(db_path=new_db_path)
+        new_elapsed = _run(database.connection_manager(_change_player_rank))
+        database.close_connection_pool()
+
+    print(f'{N_UPDATES} single-row updates')
+    print(f'- Connect/close per call: {old_elapsed:.3f}s ({N_UPDATES / old_elapsed:,.0f} updates/s)')
+    print(f'- Pooled connection:      {new_elapsed:.3f}s ({N_UPDATES / new_elapsed:,.0f} updates/s)')
+    print(f'- Speedup: x{old_elapsed / new_elapsed:.1f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,69 @@
+"""
+Micro-benchmark comparing `difflib.get_close_matches` over the whole catalog (how `Players_Controller._get_player_by_name` used to work)
+with `Fuzzy_Index.get_closest` (`Code/Utilities/fuzzy_index.py`) for 10k and 100k registered players.\n
+Queries are registered names with a typo (a character removed, replaced or added), the usual input of `/tour_players_add` and alike.
+
+Run from the repository root:
+    python -m Benchmarks.fuzzy_index
+"""
+import random
+import string
+import difflib
+import time
+
+from Code.Utilities.fuzzy_index import Fuzzy_Index
+
+CATALOG_SIZES = [10_000, 100_000]
+N_QUERIES = 50
+SEED = 0
+
+
+def _random_name(rng: random.Random) -> str:
+    return ''.join(rng.choices(string.ascii_lowercase + string.digits + '_', k=rng.randint(4, 14)))
+
+
+def _typo(rng: random.Random, name: str) -> str:
+    """Return `name` with a character removed, replaced or added at a random position."""
+    i = rng.randrange(len(name))
+    match rng.randrange(3):
+        case 0:
+            return name[:i] + name[i+1:]
+        case 1:
+            return name[:i] + rng.choice(string.ascii_lowercase) + name[i+1:]
+        case _:
+            return name[:i] + rng.choice(string.ascii_lowercase) + name[i:]
+
+
+def _difflib_closest(query: str, names: list[str]) -> str | None:
+    matches = difflib.get_close_matches(query, names)
+    return matches[0] if matches else None
+
+
+def main() -> None:
+    rng = random.Random(SEED)
+
+    for size in CATALOG_SIZES:
+        names = list({_random_name(rng) for _ in range(size)})
+        queries = [_typo(rng, rng.choice(names)) for _ in range(N_QUERIES)]
+
+        start = time.perf_counter()
+        index = Fuzzy_Index(names)
+        build_elapsed = time.perf_counter() - start
+
+        start = time.perf_counter()
+        expected = [_difflib_closest(query, names) for query in queries]
+        difflib_elapsed = time.perf_counter() - start
+
+        start = time.perf_counter()
+        results = [index.get_closest(query) for query in queries]
+        index_elapsed = time.perf_counter() - start
+
+        agreement = sum(result == exp for result, exp in zip(results, expected)) / N_QUERIES
+        print(f'{len(names)} players, {N_QUERIES} queries with a typo (index built in {build_elapsed:.2f}s)')
+        print(f'- difflib.get_close_matches: {difflib_elapsed / N_QUERIES * 1000:8.2f}ms/query')
+        print(f'- Fuzzy_Index.get_closest:   {index_elapsed / N_QUERIES * 1000:8.2f}ms/query')
+        print(f'- Speedup: x{difflib_elapsed / index_elapsed:.0f}, same result as difflib: {agreement:.0%}')
+
+
+if __name__ == '__main__':
+    main()
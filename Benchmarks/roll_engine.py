@@ -0,0 +1,68 @@
+"""
+Micro-benchmark comparing how the catalogs used to be rolled (`random.choice` over a copy of the catalog made on every roll) with the
+`Roll_Engine` (`Code/Rolls/roll_engine.py`), which samples an `Alias_Table` built once per catalogs's version.\n
+It also checks that a weighted `Alias_Table` rolls each entry with the expected frequency.
+
+Run from the repository root:
+    python -m Benchmarks.roll_engine
+"""
+import random
+import time
+from copy import copy
+from collections import Counter
+
+from Code.Rolls.roll_engine import Alias_Table, Roll_Engine
+
+CATALOG_SIZES = (100, 1_000, 10_000)
+N_ROLLS = 200_000
+N_WEIGHTED_ROLLS = 1_000_000
+SEED = 0
+
+
+def _benchmark_catalog(size: int) -> None:
+    catalog = [f'Entry {i}' for i in range(size)]
+    engine = Roll_Engine()
+    engine.no_repeat_window = 0
+
+    start = time.perf_counter()
+    for _ in range(N_ROLLS):
+        random.choice(copy(catalog))
+    old_elapsed = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for _ in range(N_ROLLS):
+        engine.roll(size, 1, lambda: catalog)
+    new_elapsed = time.perf_counter() - start
+
+    engine.no_repeat_window = 5
+    start = time.perf_counter()
+    for _ in range(N_ROLLS):
+        engine.roll(size, 1, lambda: catalog, guild_id=0)
+    no_repeat_elapsed = time.perf_counter() - start
+
+    print(f'- {size:>6} entries: copy + choice {N_ROLLS / old_elapsed:12,.0f} rolls/s | '
+          f'engine {N_ROLLS / new_elapsed:12,.0f} rolls/s (x{old_elapsed / new_elapsed:.1f}) | '
+          f'engine + no-repeat window {N_ROLLS / no_repeat_elapsed:12,.0f} rolls/s')
+
+
+def _check_weighted_table(rng: random.Random) -> None:
+    weights = [rng.choice([0, 1, 2, 5, 10]) for _ in range(50)]
+    table = Alias_Table(range(len(weights)), weights)
+    counts = Counter(table.sample(rng) for _ in range(N_WEIGHTED_ROLLS))
+    total = sum(weights)
+    max_error = max(abs(counts[i] / N_WEIGHTED_ROLLS - weight / total) for i, weight in enumerate(weights))
+    never_rolled = all(counts[i] == 0 for i, weight in enumerate(weights) if weight == 0)
+    print(f'Weighted table ({len(weights)} entries, {N_WEIGHTED_ROLLS} rolls): max frequency error {max_error:.5f}, '
+          f'0 weight entries never rolled: {never_rolled}')
+
+
+def main() -> None:
+    random.seed(SEED)
+    print(f'{N_ROLLS} rolls per catalog size')
+    for size in CATALOG_SIZES:
+        _benchmark_catalog(size)
+    _check_weighted_table(random.Random(SEED))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,72 @@
+"""
+Micro-benchmark comparing how `Roll.roll_gamemode` used to work (filtering all the gamemodes with a list comprehension on every roll)
+with the precomputed buckets of `Gamemode_Roll_Index` (`Code/Gamemodes/Gamemodes/roll_index.py`), over every `Roll_Gamemode` type.
+
+Run from the repository root:
+    python -m Benchmarks.roll_gamemode
+"""
+import random
+import time
+
+from Code.Rolls.enums import Roll_Gamemode
+from Code.Gamemodes.Gamemodes.gamemode import Gamemode
+from Code.Gamemodes.Gamemodes.roll_index import Gamemode_Roll_Index, _FILTERS
+
+N_GAMEMODES = 200
+N_ROLLS = 200_000
+SEED = 0
+
+
+def _create_gamemodes(rng: random.Random) -> list[Gamemode]:
+    """Return `N_GAMEMODES` gamemodes with random sizes and song selections (some of them being spotlight modes)."""
+    gamemodes = []
+    for i in range(N_GAMEMODES):
+        watched = rng.random() < 0.5
+        gamemodes.append(Gamemode(
+            gamemode_id=i,
+            gamemode_name=f'Gamemode {i}' + (' Spotlight' if rng.random() < 0.1 else ''),
+            gamemode_size=rng.choice([1, 1, 2, 2, 3, 4]),
+            gamemode_code='',
+            watched_song_selection=watched,
+            random_song_distribution=watched,
+            weighted_song_distribution=False,
+            equal_song_distribution=False,
+            gamemode_info=''
+        ))
+    return gamemodes
+
+
+def _old_roll_gamemode(gamemodes: list[Gamemode], type: Roll_Gamemode) -> Gamemode:
+    """`Roll.roll_gamemode` as it was before the index: the controller's list is copied and filtered on every roll."""
+    gamemode_filter = _FILTERS[type]
+    return random.choice([gamemode for gamemode in list(gamemodes) if gamemode_filter(gamemode)])
+
+
+def _new_roll_gamemode(index: Gamemode_Roll_Index, type: Roll_Gamemode) -> Gamemode:
+    return random.choice(index.get(type))
+
+
+def main() -> None:
+    rng = random.Random(SEED)
+    gamemodes = _create_gamemodes(rng)
+    index = Gamemode_Roll_Index(gamemodes)
+    types = [rng.choice(list(Roll_Gamemode)) for _ in range(N_ROLLS)]
+
+    start = time.perf_counter()
+    for type in types:
+        _old_roll_gamemode(gamemodes, type)
+    old_elapsed = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for type in types:
+        _new_roll_gamemode(index, type)
+    new_elapsed = time.perf_counter() - start
+
+    print(f'{N_ROLLS} gamemode rolls over {N_GAMEMODES} gamemodes (random Roll_Gamemode type per roll)')
+    print(f'- Filter on every roll: {N_ROLLS / old_elapsed:12,.0f} rolls/s')
+    print(f'- Precomputed buckets:  {N_ROLLS / new_elapsed:12,.0f} rolls/s')
+    print(f'- Speedup: x{old_elapsed / new_elapsed:.0f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,128 @@
+"""
+Check of the spreadsheets loading (`Sheet_Controller.get_all_data`) against a fake gspread client (the requests to Google's API only
+wait for a simulated latency), so it can be run without credentials nor network.\n
+It checks that every spreadsheet is read through a single `values_batch_get` request, that the three spreadsheets are requested
+concurrently (the total time is close to the one of the slowest spreadsheet rather than the sum of all of them) and that each worker
+thread uses its own client. The snapshot is written into a temporary directory instead of the `Database` one.\n
+The same is checked for the fingerprint used by the sheets sync (`Sheet_Controller.get_fingerprint`), comparing the bytes it receives
+with the ones of the full retrieval.
+
+Run from the repository root:
+    python -m Benchmarks.sheet_batch
+"""
+import os
+import time
+import tempfile
+import threading
+
+import Code.Gamemodes.Sheet.controller as sheet_controller
+from Code.Gamemodes.Sheet.controller import Sheet_Controller
+from Code.Gamemodes.Sheet.snapshot import save_snapshot
+from Code.Gamemodes.Sheet.sheet_batch import get_received_bytes
+
+API_LATENCY = 0.2           # Seconds that a simulated request to Google's API takes
+NUM_ROWS = 50               # Rows (header excluded) of every worksheet
+NUM_COLUMNS = 10            # Columns of every row
+SPREADSHEETS = {            # Key -> number of worksheets (as the sheet modules read them)
+    '1VxqdLA3T_coSpoFXhSnaNgAk3BZ2XQ7drvNgcUf6OXQ': 8,     # Gamemodes
+    '155CSxnOt54M16DvY7vNeBuKnup1WVfX8ARoOqSFcCZ0': 3,     # Global players
+    '1x1a-9tLyfJLjatqv5EU5ne6LuoIfPLsN8__AUw3bYy4': 10,    # Spotlight
+}
+
+
+class _Fake_Worksheet:
+    def __init__(self, title: str) -> None:
+        self.title = title
+
+
+class _Fake_Spreadsheet:
+    def __init__(self, key: str, num_worksheets: int) -> None:
+        self.key = key
+        self._worksheets = [_Fake_Worksheet(f'Sheet {i}') for i in range(num_worksheets)]
+        self._lock = threading.Lock()
+        self.batch_gets = 0
+
+    def worksheets(self) -> list[_Fake_Worksheet]:
+        return self._worksheets
+
+    def values_batch_get(self, ranges: list[str], params: dict | None = None) -> dict:
+        with self._lock:
+            self.batch_gets += 1
+        time.sleep(API_LATENCY)
+        header = [f'Column {j}' for j in range(NUM_COLUMNS)]
+        rows = [[f'{i}-{j}' for j in range(NUM_COLUMNS)] for i in range(NUM_ROWS)]
+        all_values = [header] + rows
+        value_ranges = []
+        for range_name in ranges:
+            if range_name.endswith('!1:1'):
+                values = [header]
+            elif range_name.endswith('!A:A'):
+                values = [row[:1] for row in all_values]
+            else:
+                values = all_values
+            value_ranges.append({'range': range_name, 'values': values})
+        return {'valueRanges': value_ranges}
+
+
+class _Fake_Client:
+    def __init__(self, spreadsheets: dict[str, _Fake_Spreadsheet]) -> None:
+        self.spreadsheets = spreadsheets
+        self.threads: set[int] = set()
+
+    def open_by_key(self, key: str) -> _Fake_Spreadsheet:
+        self.threads.add(threading.get_ident())
+        return self.spreadsheets[key]
+
+
+def _check_requests(spreadsheets: dict[str, _Fake_Spreadsheet], clients: list[_Fake_Client], elapsed: float) -> None:
+    """Check that each spreadsheet was read through a single batch request, concurrently and with its own client."""
+    for key, spreadsheet in spreadsheets.items():
+        assert spreadsheet.batch_gets == 1, f'{key} was read through {spreadsheet.batch_gets} batch requests'
+        spreadsheet.batch_gets = 0
+    worker_clients = [client for client in clients if client.threads]
+    assert len(worker_clients) == len(SPREADSHEETS), f'{len(worker_clients)} clients used for {len(SPREADSHEETS)} spreadsheets'
+    assert all(len(client.threads) == 1 for client in worker_clients), 'a client was shared between threads'
+    assert len(set.union(*(client.threads for client in worker_clients))) == len(SPREADSHEETS), 'the spreadsheets were not requested concurrently'
+    assert elapsed < API_LATENCY * len(SPREADSHEETS), f'the spreadsheets were not requested concurrently ({elapsed:.2f}s)'
+    clients.clear()
+
+
+def main() -> None:
+    spreadsheets = {key: _Fake_Spreadsheet(key, num_worksheets) for key, num_worksheets in SPREADSHEETS.items()}
+    clients: list[_Fake_Client] = []
+
+    def get_client() -> _Fake_Client:
+        client = _Fake_Client(spreadsheets)
+        clients.append(client)
+        return client
+
+    # NOTE skipping `_set_data` (it needs the credentials) and handing out fake clients instead
+    controller = object.__new__(Sheet_Controller)
+    controller._get_client = get_client
+
+    with tempfile.TemporaryDirectory() as directory:
+        snapshot_path = os.path.join(directory, 'sheets_snapshot.json.gz')
+        sheet_controller.save_snapshot = lambda all_data: save_snapshot(all_data, snapshot_path)
+
+        start, start_bytes = time.perf_counter(), get_received_bytes()
+        sheet_data, global_players, spotlight_data = controller.get_all_data()
+        elapsed, full_bytes = time.perf_counter() - start, get_received_bytes() - start_bytes
+        assert os.path.exists(snapshot_path)
+    _check_requests(spreadsheets, clients, elapsed)
+
+    start, start_bytes = time.perf_counter(), get_received_bytes()
+    fingerprint = controller.get_fingerprint()
+    fingerprint_elapsed, fingerprint_bytes = time.perf_counter() - start, get_received_bytes() - start_bytes
+    _check_requests(spreadsheets, clients, fingerprint_elapsed)
+    assert controller.get_fingerprint() == fingerprint, 'the fingerprint of unchanged spreadsheets changed'
+    assert fingerprint_bytes < full_bytes
+
+    print(f'{len(SPREADSHEETS)} spreadsheets loaded in {elapsed:.2f}s (simulated latency {API_LATENCY:.2f}s per request), '
+          f'one batch request and client per spreadsheet')
+    print(f'Gamemodes descriptions: {len(sheet_data[0])}, global players: {len(global_players[0])}, spotlight groups: {len(spotlight_data)}')
+    print(f'Full retrieval: {full_bytes / 1024:.1f} KiB received | fingerprint: {fingerprint_bytes / 1024:.1f} KiB received '
+          f'in {fingerprint_elapsed:.2f}s (x{full_bytes / fingerprint_bytes:.1f} smaller)')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,64 @@
+"""
+Benchmark comparing the strength difference (strongest team total - weakest team total), the balance objective (`Teams_Roll._teams_objective`)
+and the time per split of the `OPTIMAL` and `BALANCED_LOCAL_SEARCH` teams criteria (`Code/Rolls/teams.py`) with the `BALANCED_SNAKE` and
+`BALANCED_GREEDY` ones, for 8-64 players (with random ranks) split into 2-8 teams.
+
+Run from the repository root:
+    python -m Benchmarks.teams_balance
+"""
+import random
+import time
+
+from Code.Rolls.enums import Roll_Teams
+from Code.Rolls.teams import Teams_Roll
+from Code.Players.player import Player
+from Code.Players.main_ranking import Ranking
+
+NUM_PLAYERS = (8, 16, 32, 64)
+NUM_TEAMS = (2, 4, 8)
+SPLITS = 20
+SEED = 0
+CRITERIA = (Roll_Teams.BALANCED_SNAKE, Roll_Teams.BALANCED_GREEDY, Roll_Teams.OPTIMAL, Roll_Teams.BALANCED_LOCAL_SEARCH)
+
+
+def _create_players(rng: random.Random, num_players: int) -> list[Player]:
+    """Return `num_players` players with random ranks."""
+    rank_names = Ranking().rank_names
+    return [Player(discord_id=i, amq_name=f'Player {i}', rank=rng.choice(rank_names)) for i in range(num_players)]
+
+
+def _strength_diff(teams: list[list[Player]]) -> int:
+    totals = [sum(player.rank.value for player in team) for team in teams]
+    return max(totals) - min(totals)
+
+
+def main() -> None:
+    rng = random.Random(SEED)
+    print(f'Average strength difference / balance objective (and time per split) over {SPLITS} splits')
+    print(f'{"players":>7} {"teams":>5} | ' + ' | '.join(f'{criteria.name:>30}' for criteria in CRITERIA))
+
+    for num_players in NUM_PLAYERS:
+        for num_teams in NUM_TEAMS:
+            if num_players < 2 * num_teams:
+                continue
+
+            diffs = {criteria: 0 for criteria in CRITERIA}
+            objectives = {criteria: 0.0 for criteria in CRITERIA}
+            elapsed = {criteria: 0.0 for criteria in CRITERIA}
+            for _ in range(SPLITS):
+                players = _create_players(rng, num_players)
+                for criteria in CRITERIA:
+                    start = time.perf_counter()
+                    teams, _ = Teams_Roll.roll_teams(criteria, players, num_teams, rng)
+                    elapsed[criteria] += time.perf_counter() - start
+                    diffs[criteria] += _strength_diff(teams)
+                    objectives[criteria] += Teams_Roll._teams_objective(teams)
+
+            print(f'{num_players:>7} {num_teams:>5} | ' + ' | '.join(
+                f'{diffs[criteria] / SPLITS:>5.2f} / {objectives[criteria] / SPLITS:>6.2f} ({elapsed[criteria] / SPLITS * 1000:>7.2f} ms)'
+                for criteria in CRITERIA
+            ))
+
+
+if __name__ == '__main__':
+    main()
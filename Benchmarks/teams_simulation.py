@@ -0,0 +1,53 @@
+"""
+Offline run of the teams fairness simulator (`Code/Rolls/simulation.py`) over a synthetic rank distribution, for several tour sizes.\n
+The simulated snake/greedy gaps are first checked against `Teams_Roll` (a few splits rolled one by one), then the distributions of the
+strength gaps and the time per split of each criteria are printed.
+
+Run from the repository root:
+    python -m Benchmarks.teams_simulation
+"""
+import numpy as np
+
+from Code.Rolls.enums import Roll_Teams
+from Code.Rolls.teams import Teams_Roll
+from Code.Rolls.simulation import simulate_teams, synthetic_rank_values, _team_totals_snake, _team_totals_greedy
+from Code.Players.player import Player
+from Code.Players.main_ranking import Ranking
+
+CONFIGURATIONS = ((8, 2), (16, 2), (16, 4), (32, 4), (64, 8))
+SPLITS = 100_000
+CHECKED_SPLITS = 200
+SEED = 0
+
+
+def _check_against_teams_roll(rng: np.random.Generator) -> None:
+    """Check that the simulated snake/greedy team totals match the ones of the teams rolled by `Teams_Roll`."""
+    rank_names_by_values = {}
+    for rank_name in reversed(Ranking().rank_names):
+        rank_names_by_values.setdefault(Ranking().get_rank(rank_name).value, rank_name)
+
+    for type, team_totals in ((Roll_Teams.BALANCED_SNAKE, _team_totals_snake), (Roll_Teams.BALANCED_GREEDY, _team_totals_greedy)):
+        mismatches = 0
+        for _ in range(CHECKED_SPLITS):
+            values = synthetic_rank_values(16, rng)
+            players = [Player(discord_id=i, amq_name=f'Player {i}', rank=rank_names_by_values[value]) for i, value in enumerate(values)]
+            teams, _ = Teams_Roll.roll_teams(type, players, num_teams=4)
+            expected = sorted(sum(player.rank.value for player in team) for team in teams)
+            simulated = sorted(team_totals(values.reshape(1, -1), 4, rng)[0])
+            mismatches += expected != simulated
+        print(f'{type.name}: {mismatches} mismatches with Teams_Roll over {CHECKED_SPLITS} splits')
+
+
+def main() -> None:
+    rng = np.random.default_rng(SEED)
+    _check_against_teams_roll(rng)
+
+    rank_values = synthetic_rank_values(rng=rng)
+    for num_players, num_teams in CONFIGURATIONS:
+        print(f'\n{SPLITS} splits of {num_players} players into {num_teams} teams (synthetic distribution of {len(rank_values)} players)')
+        for result in simulate_teams(rank_values, num_players, num_teams, SPLITS, seed=SEED):
+            print(f'- {result}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,142 @@
+"""
+Load test of the tour's players's list / queue under a storm of concurrent join / leave interactions (and some host edits of the max size),
+against a fake Discord client (the requests to Discord only wait for a simulated latency).\n
+After every operation the roster invariants are checked (no duplicated players, nobody in both the players's list and the queue, the
+players's list never exceeds the max size and the queue is only used when it is full), and the response time of the operations
+(from the interaction arriving to the roster being updated) and the edits of the players message are reported.
+
+Run from the repository root:
+    python -m Benchmarks.tour_join_storm
+"""
+import time
+import random
+import asyncio
+
+from Code.Tours.tour import Tour
+from Code.Players.player import Player
+
+NUM_USERS = 500
+NUM_OPERATIONS = 5_000
+STORM_DURATION = 2.0        # Seconds in which all the operations arrive
+API_LATENCY = 0.05          # Max seconds that a simulated request to Discord takes
+EDIT_PROBABILITY = 0.02     # Probability of an operation being a host edit of the max size (the rest are 60% joins, 40% leaves)
+MAX_SIZES = (20, 40, 80, 120)
+SEED = 0
+
+
+class _Fake_Guild:
+    def __init__(self, id: int) -> None:
+        self.id = id
+        self.name = 'Fake Guild'
+
+    def get_member(self, player_id: int) -> None:
+        return None
+
+
+class _Fake_Client:
+    def __init__(self, guild: _Fake_Guild) -> None:
+        self.guild = guild
+
+    def get_guild(self, guild_id: int) -> _Fake_Guild:
+        return self.guild
+
+
+class _Fake_User:
+    def __init__(self, rng: random.Random) -> None:
+        self.rng = rng
+        self.name = 'Fake Host'
+
+    async def send(self, *args, **kwargs) -> None:
+        await asyncio.sleep(self.rng.uniform(0, API_LATENCY))
+
+
+class _Fake_Message:
+    def __init__(self, rng: random.Random) -> None:
+        self.rng = rng
+        self.content = ''
+        self.jump_url = 'https://discord.com/channels/0/0/0'
+
+    async def edit(self, content: str) -> None:
+        await asyncio.sleep(self.rng.uniform(0, API_LATENCY))
+        self.content = content
+
+
+def _check_invariants(tour: Tour) -> list[str]:
+    """Return the roster invariants that the tour breaks."""
+    errors = []
+    players_ids = [player.discord_id for player in tour.players]
+    queue_ids = [player.discord_id for player in tour.queue]
+    if len(set(players_ids)) != len(players_ids):
+        errors.append('duplicated players in the players\'s list')
+    if len(set(queue_ids)) != len(queue_ids):
+        errors.append('duplicated players in the queue')
+    if set(players_ids) & set(queue_ids):
+        errors.append('players in both the players\'s list and the queue')
+    if tour.max_players_size is not None and len(players_ids) > tour.max_players_size:
+        errors.append('players\'s list exceeding the max size')
+    if queue_ids and tour.max_size_restriction_ok:
+        errors.append('players in queue while there is space in the players\'s list')
+    return errors
+
+
+async def _run_storm(rng: random.Random) -> None:
+    guild = _Fake_Guild(0)
+    client = _Fake_Client(guild)
+    tour = Tour(tour_id=0, host=_Fake_User(rng), guild=guild, max_players_size=MAX_SIZES[0])
+    tour.join_message = _Fake_Message(rng)
+    tour.players_message = _Fake_Message(rng)
+    users = [Player(discord_id=i, amq_name=f'Player {i}') for i in range(NUM_USERS)]
+
+    latencies = []
+    errors = []
+    counts = {'join': 0, 'leave': 0, 'edit': 0}
+
+    async def operation(arrival: float, player: Player, kind: str) -> None:
+        await asyncio.sleep(arrival)
+        start = time.perf_counter()
+        # NOTE simulating the interaction's defer before the roster is modified
+        await asyncio.sleep(rng.uniform(0, API_LATENCY))
+        if kind == 'join':
+            await tour.add_player(player)
+        elif kind == 'leave':
+            await tour.remove_player(client, player)
+        else:
+            tour.max_players_size = rng.choice(MAX_SIZES)
+            await tour.fit_players_list(client)
+        tour.update_players_message()
+        latencies.append(time.perf_counter() - start)
+        counts[kind] += 1
+
+        async with tour.lock:
+            errors.extend(f'after {kind}: {error}' for error in _check_invariants(tour))
+
+    operations = []
+    for _ in range(NUM_OPERATIONS):
+        value = rng.random()
+        kind = 'edit' if value < EDIT_PROBABILITY else 'join' if value < EDIT_PROBABILITY + 0.6 * (1 - EDIT_PROBABILITY) else 'leave'
+        operations.append(operation(rng.uniform(0, STORM_DURATION), rng.choice(users), kind))
+
+    start = time.perf_counter()
+    await asyncio.gather(*operations)
+    await tour.players_message_updater.flush()
+    elapsed = time.perf_counter() - start
+
+    latencies.sort()
+    p50, p99 = latencies[len(latencies) // 2], latencies[int(len(latencies) * 0.99)]
+    print(f'{NUM_OPERATIONS} operations ({counts["join"]} joins, {counts["leave"]} leaves, {counts["edit"]} edits) from {NUM_USERS} users in {elapsed:.2f}s')
+    print(f'Response time: p50 {p50 * 1000:.1f} ms, p99 {p99 * 1000:.1f} ms, max {latencies[-1] * 1000:.1f} ms')
+    print(f'Final roster: {len(tour.players)} players, {len(tour.queue)} in queue (max size {tour.max_players_size})')
+    print(f'Players message: {tour.players_message_updater}')
+    print(f'Invariants broken: {len(errors)}')
+    for error in errors[:10]:
+        print(f'- {error}')
+    if tour.players_message.content != tour.display_tour_players_and_queue():
+        print('The players message does not display the final roster!')
+
+
+def main() -> None:
+    asyncio.run(_run_storm(random.Random(SEED)))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,113 @@
+"""
+Micro-benchmark comparing how the tour's players's list, queue and teams used to be stored (lists, so `in`, `remove` and `pop(0)` are O(n))
+with the `Roster` (`Code/Tours/roster.py`) and the player -> team index used by `Tour` now, for big open lobbies.\n
+Each lobby is filled with joins (half of the players end up in the queue), then emptied with leaves in a random order (promoting the
+first player of the queue after each leave from the players's list), and the players not in a team are listed with the players split
+into teams (the way `Tour.get_players_not_in_team` does it).
+
+Run from the repository root:
+    python -m Benchmarks.tour_roster
+"""
+import random
+import time
+
+from Code.Tours.roster import Roster
+from Code.Players.player import Player
+
+LOBBY_SIZES = (100, 500, 2_000)
+NUM_TEAMS = 8
+NOT_IN_TEAM_LOOKUPS = 100
+SEED = 0
+
+
+def _run_lists(players: list[Player], leaves: list[Player], max_size: int) -> list[Player]:
+    players_list, queue = [], []
+    for player in players:
+        if player in players_list or player in queue:
+            continue
+        (players_list if len(players_list) < max_size else queue).append(player)
+    for player in leaves:
+        if player in queue:
+            queue.remove(player)
+        elif player in players_list:
+            players_list.remove(player)
+            if queue:
+                players_list.append(queue.pop(0))
+    return players_list
+
+
+def _run_rosters(players: list[Player], leaves: list[Player], max_size: int) -> list[Player]:
+    players_list, queue = Roster(), Roster()
+    for player in players:
+        if player in players_list or player in queue:
+            continue
+        (players_list if len(players_list) < max_size else queue).append(player)
+    for player in leaves:
+        if player in queue:
+            queue.remove(player)
+        elif player in players_list:
+            players_list.remove(player)
+            if queue:
+                players_list.append(queue.pop_first())
+    return list(players_list)
+
+
+def _not_in_team_lists(players: list[Player], teams: list[list[Player]]) -> list[Player]:
+    not_in_team = []
+    for player in players:
+        if not any(player in team for team in teams):
+            not_in_team.append(player)
+    return not_in_team
+
+
+def _not_in_team_index(players: Roster, teams_by_player_id: dict[int, int]) -> list[Player]:
+    return [player for player in players if player.discord_id not in teams_by_player_id]
+
+
+def _benchmark_lobby(size: int, rng: random.Random) -> None:
+    players = [Player(discord_id=i, amq_name=f'Player {i}') for i in range(size)]
+    joins = players + rng.sample(players, size // 10)    # Some players press the Join button more than once
+    leaves = rng.sample(players, size)
+    max_size = size // 2
+
+    start = time.perf_counter()
+    lists_result = _run_lists(joins, leaves, max_size)
+    lists_elapsed = time.perf_counter() - start
+
+    start = time.perf_counter()
+    rosters_result = _run_rosters(joins, leaves, max_size)
+    rosters_elapsed = time.perf_counter() - start
+    assert lists_result == rosters_result
+
+    # 3 / 4 of the players in a team
+    in_team = rng.sample(players, size * 3 // 4)
+    teams = [in_team[i::NUM_TEAMS] for i in range(NUM_TEAMS)]
+    team_rosters = [Roster(team) for team in teams]
+    teams_by_player_id = {player.discord_id: i for i, team in enumerate(teams) for player in team}
+    players_roster = Roster(players)
+
+    start = time.perf_counter()
+    for _ in range(NOT_IN_TEAM_LOOKUPS):
+        lists_not_in_team = _not_in_team_lists(players, teams)
+    lists_lookup_elapsed = (time.perf_counter() - start) / NOT_IN_TEAM_LOOKUPS
+
+    start = time.perf_counter()
+    for _ in range(NOT_IN_TEAM_LOOKUPS):
+        index_not_in_team = _not_in_team_index(players_roster, teams_by_player_id)
+    index_lookup_elapsed = (time.perf_counter() - start) / NOT_IN_TEAM_LOOKUPS
+    assert lists_not_in_team == index_not_in_team
+    assert all(player in team_roster for team, team_roster in zip(teams, team_rosters) for player in team)
+
+    print(f'- {size:>5} players: joins + leaves lists {lists_elapsed * 1000:8.2f} ms | rosters {rosters_elapsed * 1000:8.2f} ms '
+          f'(x{lists_elapsed / rosters_elapsed:.1f}) || not in team lists {lists_lookup_elapsed * 1000:8.3f} ms | '
+          f'index {index_lookup_elapsed * 1000:8.3f} ms (x{lists_lookup_elapsed / index_lookup_elapsed:.1f})')
+
+
+def main() -> None:
+    rng = random.Random(SEED)
+    for size in LOBBY_SIZES:
+        _benchmark_lobby(size, rng)
+
+
+if __name__ == '__main__':
+    main()
@@ -1,5 +1,6 @@
 from Code.Gamemodes.Artists.og_artist import OG_Artist
 from Code.Gamemodes.Artists.cq_artist import CQ_Artist
+from Code.Utilities.catalog_diff import Catalog_Changes, apply_rows
 
 class Artist_Controller:
     """Controller to encapsule the Artist Logic from the rest of the application."""
@@ -13,14 +14,25 @@ class Artist_Controller:
         Constructor of the Artist class.\n
         Requires as argument the lists with the Artists information (the ones retrieved from the sheet).
         """
-        self.og_artists = {
-            og_artist[0]: OG_Artist(*og_artist)
-            for og_artist in og_artists
-        }
-        self.cq_artists = {
-            cq_artist[0]: CQ_Artist(*cq_artist)
-            for cq_artist in cq_artists
-        }
+        self.og_artists: dict[str, OG_Artist] = {}
+        self.cq_artists: dict[str, CQ_Artist] = {}
+        self._og_artists_hashes: dict[str, int] = {}
+        self._cq_artists_hashes: dict[str, int] = {}
+        self.update(og_artists, cq_artists)
+
+    def update(
+        self,
+        og_artists: list[tuple[str, str, str, str, str, str]],
+        cq_artists: list[tuple[str, str, str, str, str]]
+    ) -> list[Catalog_Changes]:
+        """
+        Update the Artists catalogs with the lists provided (the ones retrieved from the sheet), keeping the Artists that didn't change.\n
+        Return the summary of the changes applied into each catalog.
+        """
+        return [
+            apply_rows('OG Artists', self.og_artists, self._og_artists_hashes, og_artists, OG_Artist),
+            apply_rows('CQ Artists', self.cq_artists, self._cq_artists_hashes, cq_artists, CQ_Artist)
+        ]
 
 
     def get_artists_OG(self) -> list[OG_Artist]:
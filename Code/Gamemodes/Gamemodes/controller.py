@@ -1,8 +1,11 @@
-import difflib
-
 from Code.Utilities.error_handler import print_exception
+from Code.Utilities.fuzzy_index import Fuzzy_Index
+from Code.Utilities.catalog_diff import Catalog_Changes
+from Code.Utilities.database_executor import Database_Executor
 from Code.Gamemodes.Gamemodes.database_sqlite3 import Gamemodes_Database
 from Code.Gamemodes.Gamemodes.gamemode import Gamemode
+from Code.Gamemodes.Gamemodes.roll_index import Gamemode_Roll_Index
+from Code.Rolls.enums import Roll_Gamemode
 
 class Gamemodes_Controller:
     """Controller to encapsule the Gamemodes Logic from the rest of the application."""
@@ -11,6 +14,7 @@ class Gamemodes_Controller:
         """Retrieve all the Gamemodes from the Database and load them into memory through the Gamemodes's Catalogs (by id and name)."""
         self.gamemodes_by_ids: dict[int, Gamemode] = {}
         self.gamemodes_by_names: dict[str, Gamemode] = {}
+        self.gamemodes_names_index = Fuzzy_Index()
 
         for gamemode_data in Gamemodes_Database.get_all_gamemodes():
             name = gamemode_data[0]
@@ -19,6 +23,8 @@ class Gamemodes_Controller:
             if not description:
                 print(f'Description for gamemode {name} couldn\'t be retrieved from the sheet!')
 
+        self.roll_index = Gamemode_Roll_Index(self.gamemodes_by_ids.values())
+
 
     def _add_gamemode_to_catalogs(
         self,
@@ -52,14 +58,96 @@ class Gamemodes_Controller:
         
         self.gamemodes_by_ids[gamemode_id] = new_gamemode
         self.gamemodes_by_names[gamemode_name.lower()] = new_gamemode
+        self.gamemodes_names_index.add(gamemode_name.lower())
+
+    def _remove_gamemode_from_catalogs(self, gamemode: Gamemode) -> None:
+        """Remove the gamemode from the Gamemodes catalogs (by id and name (lowercase))."""
+        del self.gamemodes_by_ids[gamemode.id]
+        del self.gamemodes_by_names[gamemode.name.lower()]
+        self.gamemodes_names_index.remove(gamemode.name.lower())
+
+
+    @staticmethod
+    def _get_gamemode_row(gamemode: Gamemode) -> tuple[str, int, str, bool, bool, bool, bool, int]:
+        """Return the gamemode's data as the Database row it was built from (see `Gamemodes_Database.get_all_gamemodes`)."""
+        return (
+            gamemode.name,
+            gamemode.size,
+            gamemode.code,
+            gamemode.watched_song_selection,
+            gamemode.random_song_distribution,
+            gamemode.weighted_song_distribution,
+            gamemode.equal_song_distribution,
+            gamemode.id
+        )
+
+
+    def update_descriptions(self, gamemodes_descriptions: dict[str, str]) -> Catalog_Changes:
+        """
+        Update (in place) the description of the gamemodes whose description changed in the `gamemodes_descriptions` provided (the one retrieved from the sheet).\n
+        Return the summary of the changes applied.
+        """
+        changes = Catalog_Changes('Gamemodes Descriptions')
+        for name, gamemode in self.gamemodes_by_names.items():
+            new_description = gamemodes_descriptions.get(name, '')
+            if (gamemode.info or '') != new_description:
+                gamemode.info = new_description
+                changes.updated.append(gamemode.name)
+        return changes
+
+    def reload(
+        self,
+        gamemodes_rows: list[tuple[str, int, str, bool, bool, bool, bool, int]],
+        gamemodes_descriptions: dict[str, str]
+    ) -> Catalog_Changes:
+        """
+        Update (in place) the Gamemodes catalogs with the `gamemodes_rows` provided (the ones retrieved from the Database, so changes made in it
+        outside of the bot are applied) and their descriptions with the `gamemodes_descriptions` provided (the ones retrieved from the sheet).\n
+        Only the new gamemodes and the ones whose row changed are built again, the rest of them keep being the same objects (just updating
+        their description if it changed) and the ones no longer in the Database are deleted.\n
+        Return the summary of the changes applied.
+        """
+        changes = Catalog_Changes('Gamemodes')
+        new_rows = {gamemode_data[-1]: gamemode_data for gamemode_data in gamemodes_rows}
+
+        for gamemode in list(self.gamemodes_by_ids.values()):
+            if gamemode.id not in new_rows:
+                self._remove_gamemode_from_catalogs(gamemode)
+                changes.deleted.append(gamemode.name)
+
+        for gamemode_id, gamemode_data in new_rows.items():
+            name = gamemode_data[0]
+            description = gamemodes_descriptions.get(name.lower(), '')
+            gamemode = self.gamemodes_by_ids.get(gamemode_id)
+
+            if gamemode is None:
+                self._add_gamemode_to_catalogs(*gamemode_data, description)
+                if gamemode_id in self.gamemodes_by_ids:
+                    changes.added.append(name)
+
+            elif self._get_gamemode_row(gamemode) != gamemode_data:
+                self._remove_gamemode_from_catalogs(gamemode)
+                self._add_gamemode_to_catalogs(*gamemode_data, description)
+                changes.updated.append(name)
+
+            elif (gamemode.info or '') != description:
+                gamemode.info = description
+                changes.updated.append(name)
+
+        if changes.added or changes.deleted or changes.updated:
+            self.roll_index.rebuild(self.gamemodes_by_ids.values())
+        return changes
 
 
     def _get_gamemode_by_name(self, gamemode_name: str) -> Gamemode | None:
         """Return the gamemode which name is the most similar to the `gamemode_name` provided as argument (or None if a not close enough match was found)."""
-        closest_matches = difflib.get_close_matches(gamemode_name.lower(), self.gamemodes_by_names.keys())
-        closest_match = closest_matches[0] if closest_matches else None
+        closest_match = self.gamemodes_names_index.get_closest(gamemode_name.lower())
         return self.gamemodes_by_names.get(closest_match) if closest_match is not None else None
     
+    def complete_gamemode_names(self, gamemode_name: str) -> list[str]:
+        """Return the names of the gamemodes to suggest while `gamemode_name` is being typed (see `Fuzzy_Index.complete`)."""
+        return [self.gamemodes_by_names[name].name for name in self.gamemodes_names_index.complete(gamemode_name.lower())]
+    
     def get_gamemode(self, gamemode: int | str) -> Gamemode | None:
         """
         Return the gamemode based on either the name or the id provided as argument.\n
@@ -80,6 +168,13 @@ class Gamemodes_Controller:
     def get_all_gamemodes(self) -> list[Gamemode]:
         """Return a list containing all the gamemodes."""
         return list(self.gamemodes_by_ids.values())
+    
+    def get_rollable_gamemodes(self, type: Roll_Gamemode, max_size: int | None = None) -> tuple[Gamemode, ...]:
+        """
+        Return the gamemodes that can be rolled with the `type` provided (precomputed, see `Gamemode_Roll_Index`).\n
+        If `max_size` is provided, only the ones requiring `max_size` players per team or less are returned.
+        """
+        return self.roll_index.get(type, max_size)
 
 
     def list_all_gamemodes(self) -> list[str]:
@@ -119,7 +214,7 @@ class Gamemodes_Controller:
         return watched_song_selection, random_song_distribution, weighted_song_distribution, equal_song_distribution
 
 
-    def add_gamemode(
+    async def add_gamemode(
         self,
         gamemode_name: str,
         gamemode_size: int,
@@ -148,7 +243,8 @@ class Gamemodes_Controller:
         )
 
         # Add the gamemode to the database
-        gamemode_id = Gamemodes_Database.add_gamemode(
+        gamemode_id = await Database_Executor().run(
+            Gamemodes_Database.add_gamemode,
             name=gamemode_name,
             size=gamemode_size,
             code=gamemode_code,
@@ -171,21 +267,23 @@ class Gamemodes_Controller:
             is_equal_dist_rollable=is_equal_dist_rollable
         )
 
+        self.roll_index.rebuild(self.gamemodes_by_ids.values())
+
         # Get the log message (information about the gamemode created)
         gamemode = self.gamemodes_by_ids.get(gamemode_id)
         log_message = gamemode.display_all_details()
         return True, log_message
 
 
-    def delete_gamemode(self, gamemode: Gamemode) -> bool:
+    async def delete_gamemode(self, gamemode: Gamemode) -> bool:
         """
         Delete the gamemode provided as argument from the database and the catalogs.\n
         Return `True` if the gamemode was deleted successfully, `False` otherwise.
         """
         try:
-            Gamemodes_Database.delete_gamemode(gamemode.name)
-            del self.gamemodes_by_ids[gamemode.id]
-            del self.gamemodes_by_names[gamemode.name.lower()]
+            await Database_Executor().run(Gamemodes_Database.delete_gamemode, gamemode.name)
+            self._remove_gamemode_from_catalogs(gamemode)
+            self.roll_index.rebuild(self.gamemodes_by_ids.values())
             return True
         
         except Exception as error:
@@ -226,7 +324,7 @@ class Gamemodes_Controller:
 
         return invalid, name, code, random, weighted, equal
 
-    def edit_gamemode(
+    async def edit_gamemode(
         self,
         gamemode_name: str,
         new_name: str | None,
@@ -249,7 +347,8 @@ class Gamemodes_Controller:
         new_equal = new_equal if new_equal is not None else gamemode.equal_song_distribution
 
         try:
-            Gamemodes_Database.edit_gamemode(
+            await Database_Executor().run(
+                Gamemodes_Database.edit_gamemode,
                 id=gamemode.id,
                 new_name=new_name,
                 new_code=new_code,
@@ -260,6 +359,7 @@ class Gamemodes_Controller:
 
             # deleting (or modifying the values) from gamemodes_by_ids catalog is not needed
             del self.gamemodes_by_names[gamemode.name.lower()]
+            self.gamemodes_names_index.remove(gamemode.name.lower())
 
             gamemode.name = new_name
             gamemode.code = new_code
@@ -268,6 +368,8 @@ class Gamemodes_Controller:
             gamemode.equal_song_distribution = new_equal
 
             self.gamemodes_by_names[new_name.lower()] = gamemode
+            self.gamemodes_names_index.add(new_name.lower())
+            self.roll_index.rebuild(self.gamemodes_by_ids.values())
             return True
         
         except Exception as error:
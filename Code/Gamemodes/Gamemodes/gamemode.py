@@ -1,4 +1,8 @@
 import random
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from Code.Rolls.special_rolls import Special_Roll_Rule
 
 class Gamemode:
     """Class that instanciates a Gamemode object containing the information that is stored in the database."""
@@ -41,6 +45,8 @@ class Gamemode:
         self._random_song_distribution = random_song_distribution
         self._weighted_song_distribution = weighted_song_distribution
         self._equal_song_distribution = equal_song_distribution
+        self._special_roll_rule = None
+        self._special_roll_rule_resolved = False
 
     
     @property
@@ -55,6 +61,8 @@ class Gamemode:
     @name.setter
     def name(self, new_name: str) -> None:
         self._name = new_name
+        # The special roll rule depends on the name, so it must be resolved again
+        self._special_roll_rule_resolved = False
 
     
     @property
@@ -136,9 +144,22 @@ class Gamemode:
         
         return rollable_distributions
     
-    def roll_distribution(self) -> str:
-        """Return one of the available song distributions of the gamemode."""
-        distribution = random.choice(self._get_rollable_distributions())
+    @property
+    def special_roll_rule(self) -> 'Special_Roll_Rule | None':
+        """
+        Return the rule of the additional roll the gamemode requires (Artistmania, random tag, etc.), or `None` if it doesn't require any.\n
+        The rule is resolved from the gamemode's name the first time it is needed (and again after the gamemode is renamed).
+        """
+        if not self._special_roll_rule_resolved:
+            # Importing inside function to avoid circular import error
+            from Code.Rolls.special_rolls import resolve_special_roll_rule
+            self._special_roll_rule = resolve_special_roll_rule(self.name)
+            self._special_roll_rule_resolved = True
+        return self._special_roll_rule
+
+    def roll_distribution(self, rng: random.Random = random) -> str:
+        """Return one of the available song distributions of the gamemode (rolled with `rng`)."""
+        distribution = rng.choice(self._get_rollable_distributions())
         return f'(Distribution: {distribution})'
 
 
@@ -0,0 +1,75 @@
+from Code.Rolls.enums import Roll_Gamemode
+from Code.Gamemodes.Gamemodes.gamemode import Gamemode
+
+MAX_GAMEMODE_SIZE = 8       # Same limit checked by the `Gamemode` constructor
+
+# Filter that a gamemode must pass to be rollable with each `Roll_Gamemode` type
+_FILTERS: dict[Roll_Gamemode, callable] = {
+    Roll_Gamemode.ALL_GAMEMODES: lambda gamemode: True,
+    Roll_Gamemode.ONLY_1V1: lambda gamemode: gamemode.size == 1,
+    Roll_Gamemode.ONLY_2V2: lambda gamemode: gamemode.size == 2,
+    Roll_Gamemode.ONLY_3V3: lambda gamemode: gamemode.size == 3,
+    Roll_Gamemode.ONLY_4V4: lambda gamemode: gamemode.size == 4,
+    Roll_Gamemode.ONLY_WATCHED: lambda gamemode: gamemode.watched_song_selection,
+    Roll_Gamemode.ONLY_WATCHED_1V1: lambda gamemode: gamemode.watched_song_selection and gamemode.size == 1,
+    Roll_Gamemode.ONLY_WATCHED_2V2: lambda gamemode: gamemode.watched_song_selection and gamemode.size == 2,
+    Roll_Gamemode.ONLY_WATCHED_3V3: lambda gamemode: gamemode.watched_song_selection and gamemode.size == 3,
+    Roll_Gamemode.ONLY_WATCHED_4V4: lambda gamemode: gamemode.watched_song_selection and gamemode.size == 4,
+    Roll_Gamemode.ONLY_RANDOM: lambda gamemode: not gamemode.watched_song_selection,
+    Roll_Gamemode.ONLY_RANDOM_1V1: lambda gamemode: not gamemode.watched_song_selection and gamemode.size == 1,
+    Roll_Gamemode.ONLY_RANDOM_2V2: lambda gamemode: not gamemode.watched_song_selection and gamemode.size == 2,
+    Roll_Gamemode.ONLY_RANDOM_3V3: lambda gamemode: not gamemode.watched_song_selection and gamemode.size == 3,
+    Roll_Gamemode.ONLY_RANDOM_4V4: lambda gamemode: not gamemode.watched_song_selection and gamemode.size == 4,
+    Roll_Gamemode.ONLY_TEAMS_MODES: lambda gamemode: gamemode.size > 1,
+    Roll_Gamemode.ONLY_WATCHED_TEAMS_MODES: lambda gamemode: gamemode.watched_song_selection and gamemode.size > 1,
+    Roll_Gamemode.ONLY_RANDOM_TEAMS_MODES: lambda gamemode: not gamemode.watched_song_selection and gamemode.size > 1,
+    Roll_Gamemode.ONLY_SPOTLIGHT: lambda gamemode: 'spotlight' in gamemode.name.lower()
+}
+
+
+class Gamemode_Roll_Index:
+    """
+    Index with the gamemodes rollable for each `Roll_Gamemode` type, so rolling a gamemode is a single `random.choice` over a
+    precomputed tuple instead of filtering all the gamemodes on every roll.\n
+    Each type also has a bucket per max size (the gamemodes of the type with a size lower or equal than it), so a gamemode that fits
+    the players available can be drawn directly, with the same probability it had before filtering out the ones that don't fit.\n
+    The index must be rebuilt (`rebuild`) whenever a gamemode is added, edited or deleted.
+    """
+
+    def __init__(self, gamemodes: list[Gamemode] = ()) -> None:
+        self._buckets: dict[Roll_Gamemode, tuple[Gamemode, ...]] = {}
+        self._buckets_by_max_size: dict[tuple[Roll_Gamemode, int], tuple[Gamemode, ...]] = {}
+        self.rebuild(gamemodes)
+
+
+    def rebuild(self, gamemodes: list[Gamemode]) -> None:
+        """Rebuild the buckets of the index from the `gamemodes` provided."""
+        gamemodes = tuple(gamemodes)
+        self._buckets = {
+            type: tuple(gamemode for gamemode in gamemodes if gamemode_filter(gamemode))
+            for type, gamemode_filter in _FILTERS.items()
+        }
+        self._buckets_by_max_size = {
+            (type, max_size): tuple(gamemode for gamemode in bucket if gamemode.size <= max_size)
+            for type, bucket in self._buckets.items()
+            for max_size in range(1, MAX_GAMEMODE_SIZE)
+        }
+
+    def get(self, type: Roll_Gamemode, max_size: int | None = None) -> tuple[Gamemode, ...]:
+        """
+        Return the gamemodes rollable with the `type` provided.\n
+        If `max_size` is provided, only the ones with a size (players per team) lower or equal than `max_size` are returned.
+
+        Raises:
+        -----------
+        - `ValueError`: If the `type` provided is not a valid `Roll_Gamemode` value.
+        """
+        try:
+            if max_size is None or max_size >= MAX_GAMEMODE_SIZE:
+                return self._buckets[type]
+            if max_size < 1:
+                _ = self._buckets[type]     # Still validate the type
+                return ()
+            return self._buckets_by_max_size[(type, max_size)]
+        except KeyError:
+            raise ValueError('Invalied "type" value')
@@ -1,4 +1,5 @@
 from Code.Gamemodes.GlobalPlayers.global_players import GlobalPlayer
+from Code.Utilities.catalog_diff import Catalog_Changes, apply_rows
 
 class GlobalPlayer_Controller:
     """Controller to encapsule the Global Player Logic from the rest of the application."""
@@ -8,15 +9,21 @@ class GlobalPlayer_Controller:
         Constructor of the Global Players class.\n
         Requires as argument the lists with the Global Players information (the ones retrieved from the global player's sheet).
         """
-        self.all_global_players = {
-            global_player[0]: GlobalPlayer(*global_player)
-            for global_player in all_global_players
-        }
+        self.all_global_players: dict[str, GlobalPlayer] = {}
+        self.active_global_players: dict[str, GlobalPlayer] = {}
+        self._all_global_players_hashes: dict[str, int] = {}
+        self._active_global_players_hashes: dict[str, int] = {}
+        self.update(all_global_players, active_global_players)
 
-        self.active_global_players = {
-            global_player[0]: GlobalPlayer(*global_player)
-            for global_player in active_global_players
-        }
+    def update(self, all_global_players: list[tuple[str, str, str, str, str]], active_global_players: list[tuple[str, str, str, str, str]]) -> list[Catalog_Changes]:
+        """
+        Update the Global Players catalogs with the lists provided (the ones retrieved from the sheet), keeping the Global Players that didn't change.\n
+        Return the summary of the changes applied into each catalog.
+        """
+        return [
+            apply_rows('All Global Players', self.all_global_players, self._all_global_players_hashes, all_global_players, GlobalPlayer),
+            apply_rows('Active Global Players', self.active_global_players, self._active_global_players_hashes, active_global_players, GlobalPlayer)
+        ]
 
 
     def get_all_global_players(self) -> list[GlobalPlayer]:
@@ -1,16 +1,23 @@
 import os
 import json
+import time
+from typing import Callable, TypeVar
+from concurrent.futures import ThreadPoolExecutor
 
 import dotenv
 import gspread
 from google.oauth2.service_account import Credentials
 
-from Code.Gamemodes.Sheet.sheet_botgius import get_botgius_data
-from Code.Gamemodes.Sheet.sheet_globalplayers import get_global_players_data
-from Code.Gamemodes.Sheet.sheet_spotlight import get_spotlight_groups
+from Code.Gamemodes.Sheet.sheet_botgius import get_botgius_data, get_botgius_fingerprint
+from Code.Gamemodes.Sheet.sheet_globalplayers import get_global_players_data, get_global_players_fingerprint
+from Code.Gamemodes.Sheet.sheet_spotlight import get_spotlight_groups, get_spotlight_fingerprint
+from Code.Gamemodes.Sheet.snapshot import save_snapshot, load_snapshot
+from Code.Utilities.error_handler import print_exception
 
 dotenv.load_dotenv()
 
+T = TypeVar('T')
+
 class Sheet_Controller:
     """Controller to encapsule the Sheet data extraction Logic from the rest of the application."""
     _instance = None
@@ -21,20 +28,26 @@ class Sheet_Controller:
         return cls._instance
 
     def _set_data(self) -> None:
+        self.credentials = self._get_credentials()
         self.client = self._get_client()
 
-    def _get_client(self) -> gspread.Client:
+    def _get_credentials(self) -> Credentials:
         """
-        Method to retrieve the gspread client using the credentials stored in the environment variables.
+        Method to retrieve the Google's credentials stored in the environment variables.
         """
         credentials_info = json.loads(os.getenv('GOOGLE_SHEETS_CREDS'))
         scopes = ['https://www.googleapis.com/auth/spreadsheets.readonly']
-        credentials = Credentials.from_service_account_info(credentials_info, scopes=scopes)
-        gspread_client = gspread.authorize(credentials)
-        return gspread_client
+        return Credentials.from_service_account_info(credentials_info, scopes=scopes)
+
+    def _get_client(self) -> gspread.Client:
+        """
+        Method to retrieve a new gspread client authorized with the stored credentials.\n
+        Each client has its own `requests` session, so a client must not be shared between threads (see `get_all_data`).
+        """
+        return gspread.authorize(self.credentials)
 
 
-    def get_global_players(self) -> tuple[
+    def get_global_players(self, client: gspread.Client | None = None) -> tuple[
         list[tuple[str, str, str, str, str]],
         list[tuple[str, str, str, str, str]]
     ]:
@@ -55,10 +68,10 @@ class Sheet_Controller:
         - Comment: `str`
             A comment that the player has left as additional information.
         """
-        return get_global_players_data(self.client)
+        return get_global_players_data(client if client is not None else self.client)
     
 
-    def get_sheet_data(self) -> tuple[
+    def get_sheet_data(self, client: gspread.Client | None = None) -> tuple[
         dict[str, str],
         list[str],
         list[str],
@@ -95,9 +108,9 @@ class Sheet_Controller:
             A list of tuples with all the special lists information (see _get_cq_specialList docstring for further explanation).
             These are Community Quizes to get only the songs from the composer/shows/whatever rather than all songs from the shows like in OG_SpecialLists.
         """
-        return get_botgius_data(self.client)
+        return get_botgius_data(client if client is not None else self.client)
     
-    def get_spotlight_data(self) -> dict[str, list[tuple[str, str]]]:
+    def get_spotlight_data(self, client: gspread.Client | None = None) -> dict[str, list[tuple[str, str]]]:
         """
         Method to retrieve the information from the spotlight spreadsheet.
 
@@ -114,7 +127,7 @@ class Sheet_Controller:
         - 'communities': A list of tuples with all the Community Spotlights information (see _get_default() docstring for further explanation).
         - 'studios': A list of tuples with all the Studios information (see _get_default() docstring for further explanation).
         """
-        spotlight_info = get_spotlight_groups(self.client)
+        spotlight_info = get_spotlight_groups(client if client is not None else self.client)
         spotlight_dict = {
             'male_artists': spotlight_info[0],
             'male_vas': spotlight_info[1],
@@ -126,4 +139,69 @@ class Sheet_Controller:
             'communities': spotlight_info[7],
             'studios': spotlight_info[8]
         }
-        return spotlight_dict
\ No newline at end of file
+        return spotlight_dict
+    
+
+    def _timed(self, sheet_name: str, get_data: Callable[[], T]) -> T:
+        """Return the result of calling `get_data`, printing how long the `sheet_name` spreadsheet took to be retrieved and parsed."""
+        start = time.perf_counter()
+        data = get_data()
+        print(f'Sheet {sheet_name} loaded in {time.perf_counter() - start:.2f}s')
+        return data
+
+    def get_all_data(self) -> tuple[
+        tuple[dict[str, str], list[str], list[str], list[str], list[tuple], list[tuple], list[tuple], list[tuple]],
+        tuple[list[tuple[str, str, str, str, str]], list[tuple[str, str, str, str, str]]],
+        dict[str, list[tuple[str, str]]]
+    ]:
+        """
+        Method to retrieve the information from the three spreadsheets at once.\n
+        The spreadsheets are requested concurrently (each of them through a single batch request), so the total time is the one of the
+        slowest spreadsheet rather than the sum of all of them.\n
+        NOTE each spreadsheet is requested with its own client (created inside its worker thread), as the `requests` session of a client is
+        not guaranteed to be thread safe. The clients share the credentials: at worst, an expired token is refreshed by more than one of them.\n
+        The data retrieved is also stored in the local snapshot (see `get_snapshot_data`).
+
+        Return:
+        -----------
+        A tuple with the next 3 elements (ordered as follow):
+        - The gamemodes spreadsheet information (see `get_sheet_data` docstring for further explanation).
+        - The global players spreadsheet information (see `get_global_players` docstring for further explanation).
+        - The spotlight spreadsheet information (see `get_spotlight_data` docstring for further explanation).
+        """
+        start = time.perf_counter()
+
+        with ThreadPoolExecutor(max_workers=3, thread_name_prefix='sheets') as executor:
+            sheet_data = executor.submit(self._timed, 'gamemodes', lambda: self.get_sheet_data(self._get_client()))
+            global_players = executor.submit(self._timed, 'global players', lambda: self.get_global_players(self._get_client()))
+            spotlight_data = executor.submit(self._timed, 'spotlight', lambda: self.get_spotlight_data(self._get_client()))
+            all_data = sheet_data.result(), global_players.result(), spotlight_data.result()
+
+        print(f'All sheets loaded in {time.perf_counter() - start:.2f}s')
+
+        try:
+            save_snapshot(all_data)
+        except Exception as error:
+            print_exception(error)
+
+        return all_data
+
+    def get_fingerprint(self) -> str:
+        """
+        Return a fingerprint of the three spreadsheets, which changes whenever a row is added, removed or renamed in any of them
+        (see `get_worksheets_fingerprint`). Each spreadsheet is requested through a single small batch request, concurrently and
+        with its own client (as in `get_all_data`).
+        """
+        with ThreadPoolExecutor(max_workers=3, thread_name_prefix='sheets') as executor:
+            fingerprints = [
+                executor.submit(lambda get_fingerprint=get_fingerprint: get_fingerprint(self._get_client()))
+                for get_fingerprint in (get_botgius_fingerprint, get_global_players_fingerprint, get_spotlight_fingerprint)
+            ]
+            return ''.join(fingerprint.result() for fingerprint in fingerprints)
+
+    def get_snapshot_data(self) -> tuple | None:
+        """
+        Return the data stored in the local snapshot by the last `get_all_data` call (same shape as the data returned by `get_all_data`).\n
+        `None` is returned if there is no valid snapshot to load.
+        """
+        return load_snapshot()
\ No newline at end of file
@@ -0,0 +1,71 @@
+"""
+This is the functionality shared by the sheet modules to load the values of several worksheets of a spreadsheet at once.\n
+Instead of one `worksheet.get_all_values()` request per worksheet, all the worksheets's ranges are requested through a single
+`spreadsheet.values_batch_get()` call.\n
+It also provides a cheap fingerprint of the worksheets (to find out whether they changed without loading all their values) and keeps
+the number of bytes received from the batch requests (see `get_received_bytes`).
+"""
+import json
+import hashlib
+import threading
+
+import gspread
+from gspread.utils import fill_gaps
+
+_received_bytes = 0
+_received_bytes_lock = threading.Lock()    # the spreadsheets are requested from several threads at once
+
+
+def get_received_bytes() -> int:
+    """Return the total size in bytes of the payloads received from the batch requests made since the bot started."""
+    return _received_bytes
+
+def _batch_get(spreadsheet: gspread.Spreadsheet, ranges: list[str]) -> dict:
+    """Return the response of a single `values_batch_get` request of the `ranges` provided, adding the size of its payload to the bytes received."""
+    global _received_bytes
+    response = spreadsheet.values_batch_get(ranges)
+    # NOTE gspread only returns the decoded JSON, so the payload's size is the one of the response serialized back (close to the one transferred)
+    payload_size = len(json.dumps(response, ensure_ascii=False, separators=(',', ':')).encode('utf-8'))
+    with _received_bytes_lock:
+        _received_bytes += payload_size
+    return response
+
+def _get_ranges(spreadsheet: gspread.Spreadsheet, first_worksheet: int, last_worksheet: int) -> list[str]:
+    """Return the ranges (A1 notation) of the whole worksheets in the `[first_worksheet, last_worksheet)` positions of the spreadsheet."""
+    worksheets = spreadsheet.worksheets()[first_worksheet:last_worksheet]
+    # NOTE quoting the titles as they may contain spaces or other special characters
+    return ["'{}'".format(worksheet.title.replace("'", "''")) for worksheet in worksheets]
+
+
+def get_worksheets_values(client: gspread.Client, spreadsheet_key: str, first_worksheet: int, last_worksheet: int) -> list[list[list[str]]]:
+    """
+    Return the values of the worksheets in the `[first_worksheet, last_worksheet)` positions of the `spreadsheet_key` spreadsheet.\n
+    Each worksheet's values are returned as a list of rows (`list[str]`), the same way `worksheet.get_all_values()` would:
+    the API omits the trailing empty cells (and rows), so the rows are padded to have all the same number of columns.
+    """
+    spreadsheet = client.open_by_key(spreadsheet_key)
+    response = _batch_get(spreadsheet, _get_ranges(spreadsheet, first_worksheet, last_worksheet))
+
+    return [
+        fill_gaps(value_range.get('values', [[]]))
+        for value_range in response.get('valueRanges', [])
+    ]
+
+
+def get_worksheets_fingerprint(client: gspread.Client, spreadsheet_key: str, first_worksheet: int, last_worksheet: int) -> str:
+    """
+    Return a hash of the header row and the first column of the worksheets in the `[first_worksheet, last_worksheet)` positions of the
+    `spreadsheet_key` spreadsheet, requested through a single `spreadsheet.values_batch_get()` call.\n
+    The first column holds the key of every row (the gamemode, artist, list... name), so the fingerprint changes whenever a row is added,
+    removed or renamed (or the columns change), at a fraction of the cost of loading all the values.
+
+    NOTE the changes made only in the rest of the columns (i.e. a description) don't change the fingerprint.
+    """
+    spreadsheet = client.open_by_key(spreadsheet_key)
+    ranges = []
+    for worksheet_range in _get_ranges(spreadsheet, first_worksheet, last_worksheet):
+        ranges.extend((f'{worksheet_range}!1:1', f'{worksheet_range}!A:A'))
+    response = _batch_get(spreadsheet, ranges)
+
+    values = [value_range.get('values', []) for value_range in response.get('valueRanges', [])]
+    return hashlib.sha256(json.dumps(values, ensure_ascii=False).encode('utf-8')).hexdigest()
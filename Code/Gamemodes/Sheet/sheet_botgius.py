@@ -4,16 +4,18 @@ Sheet: https://docs.google.com/spreadsheets/d/1VxqdLA3T_coSpoFXhSnaNgAk3BZ2XQ7dr
 """
 import gspread
 
+from Code.Gamemodes.Sheet.sheet_batch import get_worksheets_values, get_worksheets_fingerprint
+
 _MAIN_SHEET_KEY = '1VxqdLA3T_coSpoFXhSnaNgAk3BZ2XQ7drvNgcUf6OXQ'
 
-def _get_gamemodes_description(descriptions_worksheet: gspread.worksheet.Worksheet) -> dict[str, str]:
+def _get_gamemodes_description(descriptions_rows: list[list[str]]) -> dict[str, str]:
     """Return a dictionary with the names of the gamemodes (lowercase) as Keys and their description as Values."""
     return {
         row[0].lower(): row[1]
-        for row in descriptions_worksheet.get_all_values()[1:]
+        for row in descriptions_rows[1:]
     }
 
-def _get_og_artists(og_artists_worksheet: gspread.worksheet.Worksheet) -> list[tuple[str, str, str, str, str, str]]:
+def _get_og_artists(og_artists_rows: list[list[str]]) -> list[tuple[str, str, str, str, str, str]]:
     """
     Return a list of tuples with all the artist information:
     - First Element: `str`
@@ -31,10 +33,10 @@ def _get_og_artists(og_artists_worksheet: gspread.worksheet.Worksheet) -> list[t
     """
     return [
         (row[0], row[1], row[2], row[3], row[4], row[5])
-        for row in og_artists_worksheet.get_all_values()[1:]
+        for row in og_artists_rows[1:]
     ]
 
-def _get_cq_artists(cq_artists_worksheet: gspread.worksheet.Worksheet) -> list[tuple[str, str, str, str, str]]:
+def _get_cq_artists(cq_artists_rows: list[list[str]]) -> list[tuple[str, str, str, str, str]]:
     """
     Return a list of tuples with all the artist information:
     - First Element: `str`
@@ -50,10 +52,10 @@ def _get_cq_artists(cq_artists_worksheet: gspread.worksheet.Worksheet) -> list[t
     """
     return [
         (row[0], row[1], row[2], row[3], row[4])
-        for row in cq_artists_worksheet.get_all_values()[1:]
+        for row in cq_artists_rows[1:]
     ]
 
-def _get_og_specialLists(og_specialLists_worksheet: gspread.worksheet.Worksheet) -> list[tuple[str, str, str, str, str, str, str]]:
+def _get_og_specialLists(og_specialLists_rows: list[list[str]]) -> list[tuple[str, str, str, str, str, str, str]]:
     """
     Return a list of tuples with all the special list information:
         - First Element: `str`
@@ -73,10 +75,10 @@ def _get_og_specialLists(og_specialLists_worksheet: gspread.worksheet.Worksheet)
     """
     return [
         (row[0], row[1], row[2], row[3], row[4], row[5], row[6])
-        for row in og_specialLists_worksheet.get_all_values()[1:]
+        for row in og_specialLists_rows[1:]
     ]
 
-def _get_cq_specialLists(cq_specialLists_worksheet: gspread.worksheet.Worksheet) -> list[tuple[str, str, str, str, str]]:
+def _get_cq_specialLists(cq_specialLists_rows: list[list[str]]) -> list[tuple[str, str, str, str, str]]:
     """
     Return a list of tuples with all the special list information:
     - First Element: `str`
@@ -92,10 +94,10 @@ def _get_cq_specialLists(cq_specialLists_worksheet: gspread.worksheet.Worksheet)
     """
     return [
         (row[0], row[1], row[2], row[3], row[4])
-        for row in cq_specialLists_worksheet.get_all_values()[1:]
+        for row in cq_specialLists_rows[1:]
     ]
 
-def _get_default(worksheet: gspread.worksheet.Worksheet, add_new_line: bool = True) -> list[str]:
+def _get_default(rows: list[list[str]], add_new_line: bool = True) -> list[str]:
     """
     Method to retrieve a default worksheet, which are the ones which contains only 1 column of information per row, which is the first column.\n
     `add_new_line` parameter is used to add (or not) a new line between rows.\n
@@ -104,7 +106,7 @@ def _get_default(worksheet: gspread.worksheet.Worksheet, add_new_line: bool = Tr
     new_line = '\n' if add_new_line else ''
     return [
         f'{row[0]}{new_line}'
-        for row in worksheet.get_all_values()[1:]
+        for row in rows[1:]
     ]
 
 def get_botgius_data(client: gspread.Client) -> tuple[
@@ -144,17 +146,20 @@ def get_botgius_data(client: gspread.Client) -> tuple[
         A list of tuples with all the special lists information (see _get_cq_specialList docstring for further explanation).
         These are Community Quizes to get only the songs from the composer/shows/whatever rather than all songs from the shows like in OG_SpecialLists.
     """
-    spreadsheet = client.open_by_key(_MAIN_SHEET_KEY)
-    all_sheets = spreadsheet.worksheets()
-    descriptions_ws, metronomes_ws, items_ws, tags_ws, og_artists_ws, cq_artists_ws, og_specialLists_ws, cq_specialLists_ws = all_sheets[:8]
+    all_values = get_worksheets_values(client, _MAIN_SHEET_KEY, 0, 8)
+    descriptions_rows, metronomes_rows, items_rows, tags_rows, og_artists_rows, cq_artists_rows, og_specialLists_rows, cq_specialLists_rows = all_values
     
-    descriptions = _get_gamemodes_description(descriptions_ws)
-    metronomes = _get_default(metronomes_ws)
-    items = _get_default(items_ws)
-    tags = _get_default(tags_ws, add_new_line=False)
-    og_artists = _get_og_artists(og_artists_ws)
-    cq_artists = _get_cq_artists(cq_artists_ws)
-    og_specialLists = _get_og_specialLists(og_specialLists_ws)
-    cq_specialLists = _get_cq_specialLists(cq_specialLists_ws)
+    descriptions = _get_gamemodes_description(descriptions_rows)
+    metronomes = _get_default(metronomes_rows)
+    items = _get_default(items_rows)
+    tags = _get_default(tags_rows, add_new_line=False)
+    og_artists = _get_og_artists(og_artists_rows)
+    cq_artists = _get_cq_artists(cq_artists_rows)
+    og_specialLists = _get_og_specialLists(og_specialLists_rows)
+    cq_specialLists = _get_cq_specialLists(cq_specialLists_rows)
+
+    return descriptions, metronomes, items, tags, og_artists, cq_artists, og_specialLists, cq_specialLists
 
-    return descriptions, metronomes, items, tags, og_artists, cq_artists, og_specialLists, cq_specialLists
\ No newline at end of file
+def get_botgius_fingerprint(client: gspread.Client) -> str:
+    """Return the fingerprint of the worksheets read from the gamemodes spreadsheet (see `get_worksheets_fingerprint`)."""
+    return get_worksheets_fingerprint(client, _MAIN_SHEET_KEY, 0, 8)
@@ -4,9 +4,11 @@ Sheet: https://docs.google.com/spreadsheets/d/155CSxnOt54M16DvY7vNeBuKnup1WVfX8A
 """
 import gspread
 
+from Code.Gamemodes.Sheet.sheet_batch import get_worksheets_values, get_worksheets_fingerprint
+
 _MAIN_SHEET_KEY = '155CSxnOt54M16DvY7vNeBuKnup1WVfX8ARoOqSFcCZ0'
 
-def _get_all_players(all_players_worksheet: gspread.worksheet.Worksheet) -> list[tuple[str, str, str, str, str]]:
+def _get_all_players(all_players_rows: list[list[str]]) -> list[tuple[str, str, str, str, str]]:
     """
     Method to retrieve the information from all players in the spreadsheet.
 
@@ -28,7 +30,7 @@ def _get_all_players(all_players_worksheet: gspread.worksheet.Worksheet) -> list
     check_set = {'\xa0', '', None, '#¡REF!'}
 
     # NOTE skipping row 0 as it is the header row
-    for row in all_players_worksheet.get_all_values()[1:]:
+    for row in all_players_rows[1:]:
         """
         row[1] = B Column = AMQ Name
         row[2] = C Column = List Name
@@ -48,7 +50,7 @@ def _get_all_players(all_players_worksheet: gspread.worksheet.Worksheet) -> list
     #print(len(all_players))
     return all_players
 
-def _get_active_players(active_players_worksheet: gspread.worksheet.Worksheet) -> list[tuple[str, str, str, str, str]]:
+def _get_active_players(active_players_rows: list[list[str]]) -> list[tuple[str, str, str, str, str]]:
     """
     Method to retrieve the information from the active players in the spreadsheet.
 
@@ -70,7 +72,7 @@ def _get_active_players(active_players_worksheet: gspread.worksheet.Worksheet) -
     check_set = {'\xa0', '', None, '#REF!'}
 
     # NOTE skipping row 0 as it is the header row
-    for row in active_players_worksheet.get_all_values()[1:]:
+    for row in active_players_rows[1:]:
         """
         row[2] = C Column = AMQ Name
         row[3] = D Column = List Name
@@ -112,14 +114,15 @@ def get_global_players_data(client: gspread.Client) -> tuple[
     - Comment: `str`
         A comment that the player has left as additional information.
     """
-    spreadsheet = client.open_by_key(_MAIN_SHEET_KEY)
-    all_sheets = spreadsheet.worksheets()
     # NOTE skipping worksheet 0 as it is a hidden "Archive" sheet that we will ignore
     # TODO inactive players data?
-    input_data, active_players = all_sheets[1:3]
-    #print(input_data.title, active_players.title)
+    input_data_rows, active_players_rows = get_worksheets_values(client, _MAIN_SHEET_KEY, 1, 3)
     
-    all_players = _get_all_players(input_data)
-    active_players = _get_active_players(active_players)
+    all_players = _get_all_players(input_data_rows)
+    active_players = _get_active_players(active_players_rows)
     
-    return all_players, active_players
\ No newline at end of file
+    return all_players, active_players
+
+def get_global_players_fingerprint(client: gspread.Client) -> str:
+    """Return the fingerprint of the worksheets read from the global players spreadsheet (see `get_worksheets_fingerprint`)."""
+    return get_worksheets_fingerprint(client, _MAIN_SHEET_KEY, 1, 3)
@@ -4,9 +4,11 @@ Sheet: https://docs.google.com/spreadsheets/d/1x1a-9tLyfJLjatqv5EU5ne6LuoIfPLsN8
 """
 import gspread
 
+from Code.Gamemodes.Sheet.sheet_batch import get_worksheets_values, get_worksheets_fingerprint
+
 _MAIN_SHEET_KEY = '1x1a-9tLyfJLjatqv5EU5ne6LuoIfPLsN8__AUw3bYy4'
 
-def _get_default(worksheet: gspread.worksheet.Worksheet) -> list[tuple[str, str]]:
+def _get_default(rows: list[list[str]]) -> list[tuple[str, str]]:
     """
     Method to retrieve a default worksheet, which are the ones which contains only 2 columns of information per row, which is the first column.\n
     The first column contain the name of the artist/group, and the second column contains its community quiz ID.\n
@@ -16,7 +18,7 @@ def _get_default(worksheet: gspread.worksheet.Worksheet) -> list[tuple[str, str]
     check_set = {'\xa0', '', None}
 
     # NOTE skipping row 0 as it is the header row
-    for row in worksheet.get_all_values()[1:]:
+    for row in rows[1:]:
         # Check if it is an empty row
         # NOTE the way the sheet is designed, a field occupies 2 columns instead of one (check 0 and 2 rather than 0 and 1)
         if row[0] in check_set or row[2] in check_set:
@@ -65,19 +67,22 @@ def get_spotlight_groups(client: gspread.Client) -> tuple[
     - Studios: `list[tuple[str, str]]`
         A list of tuples with all the Studios information (see _get_default() docstring for further explanation).
     """
-    spreadsheet = client.open_by_key(_MAIN_SHEET_KEY)
-    all_sheets = spreadsheet.worksheets()
     # NOTE skipping worksheet 0 as it not contain useful information for the bot
-    male_artists_ws, male_vas_ws, female_artists_ws, female_vas_ws, groups_ws, composers_ws, franchises_ws, communities_ws, studios_ws = all_sheets[1:10]
+    all_values = get_worksheets_values(client, _MAIN_SHEET_KEY, 1, 10)
+    male_artists_rows, male_vas_rows, female_artists_rows, female_vas_rows, groups_rows, composers_rows, franchises_rows, communities_rows, studios_rows = all_values
+
+    male_artists = _get_default(male_artists_rows)
+    male_vas = _get_default(male_vas_rows)
+    female_artists = _get_default(female_artists_rows)
+    female_vas = _get_default(female_vas_rows)
+    groups = _get_default(groups_rows)
+    composers = _get_default(composers_rows)
+    franchises = _get_default(franchises_rows)
+    communities = _get_default(communities_rows)
+    studios = _get_default(studios_rows)
 
-    male_artists = _get_default(male_artists_ws)
-    male_vas = _get_default(male_vas_ws)
-    female_artists = _get_default(female_artists_ws)
-    female_vas = _get_default(female_vas_ws)
-    groups = _get_default(groups_ws)
-    composers = _get_default(composers_ws)
-    franchises = _get_default(franchises_ws)
-    communities = _get_default(communities_ws)
-    studios = _get_default(studios_ws)
+    return male_artists, male_vas, female_artists, female_vas, groups, composers, franchises, communities, studios
 
-    return male_artists, male_vas, female_artists, female_vas, groups, composers, franchises, communities, studios
\ No newline at end of file
+def get_spotlight_fingerprint(client: gspread.Client) -> str:
+    """Return the fingerprint of the worksheets read from the spotlight spreadsheet (see `get_worksheets_fingerprint`)."""
+    return get_worksheets_fingerprint(client, _MAIN_SHEET_KEY, 1, 10)
@@ -0,0 +1,85 @@
+"""
+This is the functionality required for persisting the (already parsed) data of the spreadsheets into a local snapshot file, so the bot can
+load its catalogs at boot without waiting for Google's API.\n
+The snapshot is a gzip file containing two lines:
+- A header (JSON) with the snapshot's format version, creation timestamp and the SHA-256 checksum of the payload.
+- The payload (JSON) with the data returned by `Sheet_Controller.get_all_data()`.
+"""
+import os
+import gzip
+import json
+import time
+import hashlib
+
+SNAPSHOT_PATH = os.path.join('Database', 'sheets_snapshot.json.gz')
+SNAPSHOT_VERSION = 1        # Increase it whenever the shape of the data returned by the sheet modules changes
+
+
+def _to_tuples(rows: list[list[str]]) -> list[tuple[str, ...]]:
+    """Return the rows as tuples (JSON stores them as lists), the same type returned by the sheet modules."""
+    return [tuple(row) for row in rows]
+
+
+def save_snapshot(all_data: tuple, snapshot_path: str = SNAPSHOT_PATH) -> None:
+    """
+    Store the data returned by `Sheet_Controller.get_all_data()` into the snapshot file.\n
+    The file is written into a temporary file first and then moved, so a crash while writing never leaves a partial snapshot behind.
+    """
+    sheet_data, global_players_data, spotlight_dict = all_data
+    payload = {
+        'sheet_data': sheet_data,
+        'global_players': global_players_data,
+        'spotlight': spotlight_dict
+    }
+    payload_bytes = json.dumps(payload, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+    header = {
+        'version': SNAPSHOT_VERSION,
+        'created_at': int(time.time()),
+        'checksum': hashlib.sha256(payload_bytes).hexdigest()
+    }
+    header_bytes = json.dumps(header).encode('utf-8')
+
+    temporary_path = f'{snapshot_path}.tmp'
+    with gzip.open(temporary_path, 'wb') as file:
+        file.write(header_bytes + b'\n' + payload_bytes)
+    os.replace(temporary_path, snapshot_path)
+
+
+def load_snapshot(snapshot_path: str = SNAPSHOT_PATH) -> tuple | None:
+    """
+    Return the data stored in the snapshot file, with the same shape returned by `Sheet_Controller.get_all_data()`.\n
+    `None` is returned if there is no snapshot, or if it can't be trusted (unreadable, from another format version, or its checksum
+    doesn't match its content).
+    """
+    if not os.path.exists(snapshot_path):
+        return None
+
+    try:
+        with gzip.open(snapshot_path, 'rb') as file:
+            header_bytes, payload_bytes = file.read().split(b'\n', 1)
+        header = json.loads(header_bytes)
+    except (OSError, EOFError, ValueError):
+        print('Sheets snapshot couldn\'t be read, ignoring it!')
+        return None
+
+    if header.get('version') != SNAPSHOT_VERSION:
+        print(f'Sheets snapshot has version {header.get("version")} (expected {SNAPSHOT_VERSION}), ignoring it!')
+        return None
+
+    if header.get('checksum') != hashlib.sha256(payload_bytes).hexdigest():
+        print('Sheets snapshot checksum doesn\'t match its content, ignoring it!')
+        return None
+
+    payload = json.loads(payload_bytes)
+    descriptions, metronomes, items, tags, og_artists, cq_artists, og_special_lists, cq_special_lists = payload['sheet_data']
+    sheet_data = (
+        descriptions, metronomes, items, tags,
+        _to_tuples(og_artists), _to_tuples(cq_artists), _to_tuples(og_special_lists), _to_tuples(cq_special_lists)
+    )
+    all_global_players, active_global_players = payload['global_players']
+    global_players_data = (_to_tuples(all_global_players), _to_tuples(active_global_players))
+    spotlight_dict = {key: _to_tuples(rows) for key, rows in payload['spotlight'].items()}
+
+    age = int(time.time()) - header.get('created_at', 0)
+    print(f'Sheets snapshot loaded (created {age // 60} minutes ago)')
+    return sheet_data, global_players_data, spotlight_dict
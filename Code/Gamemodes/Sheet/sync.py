@@ -0,0 +1,117 @@
+import os
+import time
+import asyncio
+
+from Code.Gamemodes.Sheet.controller import Sheet_Controller
+from Code.Gamemodes.Sheet.sheet_batch import get_received_bytes
+from Code.Gamemodes.controller import Main_Controller
+from Code.Utilities.error_handler import print_exception
+
+SYNC_INTERVAL = 900.0       # Seconds between two checks of the sheets (overridden by the `SHEETS_SYNC_INTERVAL` environment variable, 0 disables the sync)
+MAX_BACKOFF = 3600.0        # Max seconds to wait before checking the sheets again after consecutive errors
+FULL_SYNC_EVERY = 8         # Checks after which the sheets are fully retrieved even if their fingerprint didn't change (overridden by the `SHEETS_FULL_SYNC_EVERY` environment variable)
+
+
+class Sheet_Sync:
+    """
+    Singleton class that keeps the sheets's catalogs up to date without needing an admin to run `/reset_data`.\n
+    Every `interval` seconds, only the fingerprint of the sheets (their header rows and first columns, see `Sheet_Controller.get_fingerprint`)
+    is retrieved (in a separated thread, so the event loop is never blocked) and compared with the one of the previous check: the sheets are
+    only fully retrieved and the catalogs refreshed (see `Main_Controller.update_data`) when it changed. As the fingerprint misses the changes
+    made only in the rest of the columns, the sheets are also fully retrieved every `full_sync_every` checks.
+    If Google's API fails, the interval is doubled on each consecutive error (up to `MAX_BACKOFF` seconds).\n
+    Metrics about the checks (duration, size in bytes of the payloads received, full retrievals, errors) are kept in `metrics`.
+
+    NOTE The spreadsheets's revision metadata requires the Drive API scope, which the bot's credentials don't have (they are only
+    allowed to read spreadsheets), so the fingerprint is used as change detection.
+    """
+    _instance = None
+    def __new__(cls) -> 'Sheet_Sync':
+        """Override the __new__ method to return the existing instance of the class if it exists or create a new instance if it doesn't exist yet.\n"""
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+            cls._instance._set_data()
+        return cls._instance
+
+    def _set_data(self) -> None:
+        """Load the sync's configuration and initialize its metrics."""
+        self.interval = float(os.getenv('SHEETS_SYNC_INTERVAL', SYNC_INTERVAL))
+        self.full_sync_every = int(os.getenv('SHEETS_FULL_SYNC_EVERY', FULL_SYNC_EVERY))
+        self._task: asyncio.Task | None = None
+        self._last_fingerprint: str | None = None
+        self._checks_since_full_sync = 0
+        self._consecutive_errors = 0
+        self.metrics = {
+            'checks': 0,
+            'refreshes': 0,
+            'errors': 0,
+            'last_duration': 0.0,
+            'last_bytes': 0,
+            'total_bytes': 0
+        }
+
+
+    def start(self) -> None:
+        """Start checking the sheets periodically in a background task (nothing happens if it is disabled or already running)."""
+        if self.interval <= 0 or (self._task is not None and not self._task.done()):
+            return
+        self._task = asyncio.create_task(self._run())
+
+    def stop(self) -> None:
+        """Stop checking the sheets."""
+        if self._task is not None and not self._task.done():
+            self._task.cancel()
+
+
+    def _next_delay(self) -> float:
+        """Return the seconds to wait before the next check, applying an exponential backoff if the last checks failed."""
+        return min(self.interval * 2 ** self._consecutive_errors, max(self.interval, MAX_BACKOFF))
+
+    async def _run(self) -> None:
+        """Loop that checks the sheets every `interval` seconds (more if they are failing) until the task is cancelled."""
+        while True:
+            await asyncio.sleep(self._next_delay())
+            try:
+                await self.sync()
+                self._consecutive_errors = 0
+            except asyncio.CancelledError:
+                raise
+            except Exception as error:
+                self._consecutive_errors += 1
+                self.metrics['errors'] += 1
+                print(f'Sheets sync failed ({self._consecutive_errors} consecutive errors), retrying in {self._next_delay():.0f}s')
+                print_exception(error)
+
+    async def sync(self) -> bool:
+        """
+        Retrieve the fingerprint of the sheets and, if it changed since the last check (or a full retrieval is due), retrieve the sheets and
+        refresh the catalogs.\n
+        Return whether any change was applied into the catalogs.
+        """
+        start = time.perf_counter()
+        start_bytes = get_received_bytes()
+        fingerprint = await asyncio.to_thread(Sheet_Controller().get_fingerprint)
+
+        self._checks_since_full_sync += 1
+        changed = fingerprint != self._last_fingerprint
+        full_sync = changed or self._checks_since_full_sync >= self.full_sync_every
+        if full_sync:
+            all_data = await asyncio.to_thread(Sheet_Controller().get_all_data)
+            changes = Main_Controller().update_data(all_data)
+            self._last_fingerprint = fingerprint
+            self._checks_since_full_sync = 0
+            self.metrics['refreshes'] += 1
+            changed_catalogs = [str(catalog_changes) for catalog_changes in changes if catalog_changes]
+            changed = bool(changed_catalogs)
+            if changed_catalogs:
+                print('Sheets sync applied changes:\n' + '\n'.join(changed_catalogs))
+
+        duration = time.perf_counter() - start
+        received_bytes = get_received_bytes() - start_bytes
+        self.metrics['checks'] += 1
+        self.metrics['last_duration'] = duration
+        self.metrics['last_bytes'] = received_bytes
+        self.metrics['total_bytes'] += received_bytes
+        print(f'Sheets sync: {received_bytes / 1024:.1f} KiB received in {duration:.2f}s '
+              f'({"full retrieval, " if full_sync else ""}{"changed" if changed else "no changes"})')
+        return changed
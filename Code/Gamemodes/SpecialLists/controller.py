@@ -1,5 +1,6 @@
 from Code.Gamemodes.SpecialLists.og_specialList import OG_SpecialList
 from Code.Gamemodes.SpecialLists.cq_specialList import CQ_SpecialList
+from Code.Utilities.catalog_diff import Catalog_Changes, apply_rows
 
 class SpecialList_Controller:
     """Controller to encapsule the SpecialList Logic from the rest of the application."""
@@ -13,14 +14,25 @@ class SpecialList_Controller:
         Constructor of the SpecialList class.\n
         Requires as argument the lists with the Special Lists information (the ones retrieved from the sheet).
         """
-        self.og_special_lists = {
-            og_special_list[0]: OG_SpecialList(*og_special_list)
-            for og_special_list in og_special_lists
-        }
-        self.cq_special_lists = {
-            cq_special_list[0]: CQ_SpecialList(*cq_special_list)
-            for cq_special_list in cq_special_lists
-        }
+        self.og_special_lists: dict[str, OG_SpecialList] = {}
+        self.cq_special_lists: dict[str, CQ_SpecialList] = {}
+        self._og_special_lists_hashes: dict[str, int] = {}
+        self._cq_special_lists_hashes: dict[str, int] = {}
+        self.update(og_special_lists, cq_special_lists)
+
+    def update(
+        self,
+        og_special_lists: list[tuple[str, str, str, str, str, str]],
+        cq_special_lists: list[tuple[str, str, str, str, str]]
+    ) -> list[Catalog_Changes]:
+        """
+        Update the Special Lists catalogs with the lists provided (the ones retrieved from the sheet), keeping the Special Lists that didn't change.\n
+        Return the summary of the changes applied into each catalog.
+        """
+        return [
+            apply_rows('OG Special Lists', self.og_special_lists, self._og_special_lists_hashes, og_special_lists, OG_SpecialList),
+            apply_rows('CQ Special Lists', self.cq_special_lists, self._cq_special_lists_hashes, cq_special_lists, CQ_SpecialList)
+        ]
 
     def get_special_lists_OG(self) -> list[OG_SpecialList]:
         """Return a list with all the special lists (original version)."""
@@ -1,59 +1,48 @@
 from Code.Gamemodes.Spotlight.classes import Male_Artist, Male_VA, Female_Artist, Female_VA, Group, Composer, Franchise, Community, Studio
+from Code.Utilities.catalog_diff import Catalog_Changes, apply_rows
 
 class Spotlight_Controller:
     """Controller to encapsule the Spotlight Logic from the rest of the application."""
 
+    # Spotlight's dictionary key -> (catalog attribute, class of its elements, catalog name)
+    _CATALOGS = {
+        'male_artists': ('males_artists', Male_Artist, 'Spotlight Male Artists'),
+        'male_vas': ('males_vas', Male_VA, 'Spotlight Male VAs'),
+        'female_artists': ('females_artists', Female_Artist, 'Spotlight Female Artists'),
+        'female_vas': ('females_vas', Female_VA, 'Spotlight Female VAs'),
+        'groups': ('groups', Group, 'Spotlight Groups'),
+        'composers': ('composers', Composer, 'Spotlight Composers'),
+        'franchises': ('franchises', Franchise, 'Spotlight Franchises'),
+        'communities': ('communities', Community, 'Spotlight Communities'),
+        'studios': ('studios', Studio, 'Spotlight Studios')
+    }
+
     def __init__(self, spotlight_dict: dict[str, list[tuple[str, str]]]) -> None:
         """
         Constructor of the Spotlight Controller class.\n
         Requires as argument the dictionary with the Spotlight information (the one retrieved from the spotlight's sheet).
         """
-        self.spotlight_dict = spotlight_dict
-
-        self.males_artists = {
-            male_artist[0]: Male_Artist(*male_artist)
-            for male_artist in self.spotlight_dict['male_artists']
-        }
-
-        self.males_vas = {
-            male_va[0]: Male_VA(*male_va)
-            for male_va in self.spotlight_dict['male_vas']
-        }
-
-        self.females_artists = {
-            female_artist[0]: Female_Artist(*female_artist)
-            for female_artist in self.spotlight_dict['female_artists']
-        }
-
-        self.females_vas = {
-            female_va[0]: Female_VA(*female_va)
-            for female_va in self.spotlight_dict['female_vas']
-        }
-
-        self.groups = {
-            group[0]: Group(*group)
-            for group in self.spotlight_dict['groups']
-        }
-
-        self.composers = {
-            composer[0]: Composer(*composer)
-            for composer in self.spotlight_dict['composers']
-        }
-
-        self.franchises = {
-            franchise[0]: Franchise(*franchise)
-            for franchise in self.spotlight_dict['franchises']
-        }
-
-        self.communities = {
-            community[0]: Community(*community)
-            for community in self.spotlight_dict['communities']
-        }
-        
-        self.studios = {
-            studio[0]:  Studio(*studio)
-            for studio in self.spotlight_dict['studios']
-        }
+        self.males_artists: dict[str, Male_Artist] = {}
+        self.males_vas: dict[str, Male_VA] = {}
+        self.females_artists: dict[str, Female_Artist] = {}
+        self.females_vas: dict[str, Female_VA] = {}
+        self.groups: dict[str, Group] = {}
+        self.composers: dict[str, Composer] = {}
+        self.franchises: dict[str, Franchise] = {}
+        self.communities: dict[str, Community] = {}
+        self.studios: dict[str, Studio] = {}
+        self._hashes: dict[str, dict[str, int]] = {key: {} for key in self._CATALOGS}
+        self.update(spotlight_dict)
+
+    def update(self, spotlight_dict: dict[str, list[tuple[str, str]]]) -> list[Catalog_Changes]:
+        """
+        Update the Spotlight catalogs with the dictionary provided (the one retrieved from the spotlight's sheet), keeping the entries that didn't change.\n
+        Return the summary of the changes applied into each catalog.
+        """
+        return [
+            apply_rows(catalog_name, getattr(self, attribute), self._hashes[key], spotlight_dict[key], factory)
+            for key, (attribute, factory, catalog_name) in self._CATALOGS.items()
+        ]
 
 
     def get_all_male_artists(self) -> list[Male_Artist]:
@@ -1,9 +1,13 @@
+import asyncio
+from typing import Any
 from copy import copy
 
 from Code.Gamemodes.enums import InfoType, Genres
 from Code.Gamemodes.Sheet.controller import Sheet_Controller
 from Code.Gamemodes.Gamemodes.controller import Gamemodes_Controller
 from Code.Gamemodes.Gamemodes.gamemode import Gamemode
+from Code.Gamemodes.Gamemodes.database_sqlite3 import Gamemodes_Database
+from Code.Rolls.enums import Roll_Gamemode
 from Code.Gamemodes.Artists.controller import Artist_Controller
 from Code.Gamemodes.Artists.og_artist import OG_Artist
 from Code.Gamemodes.Artists.cq_artist import CQ_Artist
@@ -14,6 +18,9 @@ from Code.Gamemodes.GlobalPlayers.controller import GlobalPlayer_Controller
 from Code.Gamemodes.GlobalPlayers.global_players import GlobalPlayer
 from Code.Gamemodes.Spotlight.controller import Spotlight_Controller
 from Code.Gamemodes.Spotlight.classes import Male_Artist, Male_VA, Female_Artist, Female_VA, Group, Composer, Franchise, Community, Studio
+from Code.Utilities.error_handler import print_exception
+from Code.Utilities.database_executor import Database_Executor
+from Code.Utilities.catalog_diff import Catalog_Changes, apply_values
 
 class Main_Controller:
     """Controller to encapsule the Players Logic from the rest of the application."""
@@ -22,10 +29,10 @@ class Main_Controller:
         """Override the __new__ method to return the existing instance of the class if it exists or create a new instance if it doesn't exist yet.\n"""
         if cls._instance is None:
             cls._instance = super().__new__(cls)
-            cls._instance._set_data()
+            cls._instance._set_data(use_snapshot=True)
         return cls._instance
 
-    def _set_data(self) -> None:
+    def _set_data(self, use_snapshot: bool = False) -> None:
         """
         Method that retrieves the Gamemodes from the database, sheets and yaml files the next info:\n
         - Gamemodes Descriptions
@@ -36,22 +43,104 @@ class Main_Controller:
         - CQ_Artists
         - Special Lists
         - Global Players
-        - Genres
+        - Genres\n
+        If `use_snapshot` is `True` and a valid local snapshot of the sheets exists, the data is loaded from it rather than from the sheets
+        (so the bot doesn't wait for Google's API at boot). In that case `loaded_from_snapshot` is set to `True` and `schedule_refresh` should be
+        called afterwards to update the snapshot's data with the current one.\n
+        NOTE All the catalogs are rebuilt, use `refresh_data` to only apply the changes made in the sheets.
         """
-        gamemodes_descriptions, self.metronomes, self.items, self.tags, og_artists, cq_artists, og_special_lists, cq_special_lists = Sheet_Controller().get_sheet_data()
-        
-        self.gamemodes = Gamemodes_Controller(gamemodes_descriptions)
+        self.catalogs_version = 0       # Increased every time the catalogs change (so the tables built from them know when to be rebuilt)
+        all_data = Sheet_Controller().get_snapshot_data() if use_snapshot else None
+        self.loaded_from_snapshot = all_data is not None
+        if all_data is None:
+            all_data = Sheet_Controller().get_all_data()
 
-        self.artists = Artist_Controller(og_artists, cq_artists)
-        self.special_lists = SpecialList_Controller(og_special_lists, cq_special_lists)
+        self._swap_catalogs(self._build_catalogs(all_data))
 
-        all_global_players, active_global_players = Sheet_Controller().get_global_players()
-        self.global_players = GlobalPlayer_Controller(all_global_players, active_global_players)
+    def _build_catalogs(self, all_data: tuple) -> dict[str, Any]:
+        """Return the catalogs (by attribute name) built from the data returned by `Sheet_Controller.get_all_data()`."""
+        sheet_data, global_players_data, spotlight_dict = all_data
+        gamemodes_descriptions, metronomes, items, tags, og_artists, cq_artists, og_special_lists, cq_special_lists = sheet_data
+        all_global_players, active_global_players = global_players_data
 
-        spotlight_dict = Sheet_Controller().get_spotlight_data()
-        self.spotlight = Spotlight_Controller(spotlight_dict)
+        return {
+            'metronomes': metronomes,
+            'items': items,
+            'tags': tags,
+            'gamemodes': Gamemodes_Controller(gamemodes_descriptions),
+            'artists': Artist_Controller(og_artists, cq_artists),
+            'special_lists': SpecialList_Controller(og_special_lists, cq_special_lists),
+            'global_players': GlobalPlayer_Controller(all_global_players, active_global_players),
+            'spotlight': Spotlight_Controller(spotlight_dict),
+            'genres': [genre.name.replace('_', ' ') for genre in Genres]
+        }
 
-        self.genres = [genre.name.replace('_', ' ') for genre in Genres]
+    def _swap_catalogs(self, catalogs: dict[str, Any]) -> None:
+        """
+        Replace all the current catalogs with the ones provided.\n
+        NOTE `dict.update` is a single operation for the interpreter, so the rest of the application sees either all the old catalogs
+        or all the new ones, never a mix of them.
+        """
+        self.__dict__.update(catalogs)
+        self.catalogs_version += 1
+
+    def update_data(self, all_data: tuple, gamemodes_rows: list[tuple] | None = None) -> list[Catalog_Changes]:
+        """
+        Apply into the catalogs only the changes between their current content and the data returned by `Sheet_Controller.get_all_data()`.\n
+        If the `gamemodes_rows` retrieved from the Database are provided, the gamemodes are also reloaded from them (see `Gamemodes_Controller.reload`),
+        otherwise only their descriptions are updated.\n
+        The entries that didn't change keep being the same objects, so the references held by live tours, views, etc. stay valid.\n
+        Return the summary of the changes applied into each catalog.
+
+        NOTE It must be called from the event loop's thread: as it doesn't await anything, the rest of the application never sees the
+        catalogs half updated.
+        """
+        sheet_data, global_players_data, spotlight_dict = all_data
+        gamemodes_descriptions, metronomes, items, tags, og_artists, cq_artists, og_special_lists, cq_special_lists = sheet_data
+        all_global_players, active_global_players = global_players_data
+
+        changes = [
+            self.gamemodes.update_descriptions(gamemodes_descriptions) if gamemodes_rows is None
+            else self.gamemodes.reload(gamemodes_rows, gamemodes_descriptions),
+            apply_values('Metronomes', self.metronomes, metronomes),
+            apply_values('Items', self.items, items),
+            apply_values('Tags', self.tags, tags),
+            *self.artists.update(og_artists, cq_artists),
+            *self.special_lists.update(og_special_lists, cq_special_lists),
+            *self.global_players.update(all_global_players, active_global_players),
+            *self.spotlight.update(spotlight_dict)
+        ]
+        self.metronomes, self.items, self.tags = metronomes, items, tags
+        self.catalogs_version += 1
+        return changes
+
+    async def refresh_data(self) -> list[Catalog_Changes]:
+        """
+        Retrieve the current data from the sheets and the gamemodes from the Database (in separated threads) and apply the changes into the
+        catalogs (see `update_data`).\n
+        Return the summary of the changes applied into each catalog.
+        """
+        all_data = await asyncio.to_thread(Sheet_Controller().get_all_data)
+        # NOTE reading through the database executor, so the gamemodes changes queued before are already applied
+        gamemodes_rows = await Database_Executor().run(Gamemodes_Database.get_all_gamemodes)
+        changes = self.update_data(all_data, gamemodes_rows)
+        self.loaded_from_snapshot = False
+        return changes
+
+    async def _refresh_snapshot_data(self) -> None:
+        """Update the data loaded from the snapshot at boot with the current one. If the sheets can't be reached, the snapshot's data is kept."""
+        try:
+            changes = await self.refresh_data()
+        except Exception as error:
+            print('Sheets data couldn\'t be refreshed, keeping the snapshot\'s data!')
+            print_exception(error)
+            return
+
+        print(f'Sheets data refreshed ({sum(bool(catalog_changes) for catalog_changes in changes)} catalogs changed since the snapshot)')
+
+    def schedule_refresh(self) -> None:
+        """Run `_refresh_snapshot_data` as a background task (the reference to the task is kept so it isn't garbage collected while running)."""
+        self.refresh_task = asyncio.create_task(self._refresh_snapshot_data())
 
 
     def info(self, type: int) -> list[str]:
@@ -132,10 +221,21 @@ class Main_Controller:
         """
         return self.gamemodes.get_gamemode(gamemode_id_or_name)   
 
+    def complete_gamemode_names(self, gamemode_name: str) -> list[str]:
+        """Return the names of the gamemodes to suggest (autocomplete) while `gamemode_name` is being typed."""
+        return self.gamemodes.complete_gamemode_names(gamemode_name)
+
     def get_gamemodes(self) -> list[Gamemode]:
         """Return a list containing all the gamemodes."""
         return self.gamemodes.get_all_gamemodes()
     
+    def get_rollable_gamemodes(self, type: Roll_Gamemode, max_size: int | None = None) -> tuple[Gamemode, ...]:
+        """
+        Return the gamemodes that can be rolled with the `type` provided (not a copy, do not modify it).\n
+        If `max_size` is provided, only the ones requiring `max_size` players per team or less are returned.
+        """
+        return self.gamemodes.get_rollable_gamemodes(type, max_size)
+    
     def get_artists_OG(self) -> list[OG_Artist]:
         """Return a list with all the artists stored (original version)."""
         return self.artists.get_artists_OG()
@@ -213,7 +313,7 @@ class Main_Controller:
         return copy(self.items)
 
 
-    def add_gamemode(
+    async def add_gamemode(
         self,
         gamemode_name: str,
         gamemode_size: int,
@@ -229,7 +329,7 @@ class Main_Controller:
         - A boolean which is `True` if the gamemode could be stored, `False` otherwise, this is, a gamemode with that name already existed in memory.
         - A log str providing the gamemode's data.
         """
-        return self.gamemodes.add_gamemode(
+        return await self.gamemodes.add_gamemode(
             gamemode_name=gamemode_name,
             gamemode_size=gamemode_size,
             gamemode_code=gamemode_code,
@@ -239,9 +339,9 @@ class Main_Controller:
             is_equal_dist_rollable=is_equal_dist_rollable
         )
 
-    def delete_gamemode(self, gamemode: Gamemode) -> bool:
+    async def delete_gamemode(self, gamemode: Gamemode) -> bool:
         """Delete the gamemode provided as argument. Return `True` if the gamemode was deleted successfully, `False` otherwise."""
-        return self.gamemodes.delete_gamemode(gamemode)
+        return await self.gamemodes.delete_gamemode(gamemode)
     
     
     def get_gamemode_old_values(
@@ -267,7 +367,7 @@ class Main_Controller:
             new_equal=new_equal
         )
 
-    def edit_gamemode(
+    async def edit_gamemode(
         self,
         gamemode_name: str,
         new_name: str | None,
@@ -281,7 +381,7 @@ class Main_Controller:
         If a `new_...` field is `None` it will be ignored, this is, it won't be modified.
         Return `True` if changes could be applied and `False` if an error was raised when applying the changes in the database.
         """
-        return self.gamemodes.edit_gamemode(
+        return await self.gamemodes.edit_gamemode(
             gamemode_name=gamemode_name,
             new_name=new_name,
             new_code=new_code,
@@ -8,6 +8,7 @@ from Code.Utilities.to_chunks import to_chunks
 from Code.Utilities.to_file import send_message_as_file
 from Code.Gamemodes.controller import Main_Controller as Gamemodes_Controller
 from Code.Players.controller import Players_Controller
+from Code.Rolls import simulation
 from Code.Others.channels import Channels
 from Code.Others.roles import Roles
 
@@ -19,18 +20,22 @@ async def reset_data(interaction: discord.Interaction):
     Useful when:
     - Changes in the yaml files are made
     - Changes in the google spreadsheets (main one / global players one) are made
+    - Changes in the gamemodes stored in the database are made (outside of the bot's commands)\n
+    Only the changes made in the sheets and the database are applied (see `Main_Controller.refresh_data`), and a summary of them is sent back.
     """
     await interaction.response.defer(ephemeral=True)
 
-    def reload_all_data():
-        Gamemodes_Controller()._set_data()
+    def reload_yaml_data():
         Channels()._set_data()
         Roles()._set_data()
         Tour_Helpers()._set_data()
 
-    await asyncio.to_thread(reload_all_data)
-    
-    content = 'The lists were updated successfully!'
+    await asyncio.to_thread(reload_yaml_data)
+    changes = await Gamemodes_Controller().refresh_data()
+
+    changed_catalogs = [str(catalog_changes) for catalog_changes in changes if catalog_changes]
+    content = 'The lists were updated successfully!\n'
+    content += '\n'.join(changed_catalogs) if changed_catalogs else 'No changes were found in the sheets nor the gamemodes.'
     await interaction.followup.send(content=content, ephemeral=True)
 
 
@@ -39,7 +44,7 @@ async def ban_player(interaction: discord.Interaction, amq_name: str, is_banned:
     """Interaction to handle the `/ban_player` command. It bans/unbans the `is_banned` field of the player with `name` == `amq_name`."""
     await interaction.response.defer(ephemeral=True)
 
-    player_found, change_applied, player = Players_Controller().change_player_ban(amq_name, is_banned)
+    player_found, change_applied, player = await Players_Controller().change_player_ban(amq_name, is_banned)
     if not player_found:
         content = f'A player with name "{amq_name}" couldn\'t be found'
         await interaction.followup.send(content=content, ephemeral=True)
@@ -61,7 +66,7 @@ async def ban_player_list(interaction: discord.Interaction, amq_name: str, is_li
     """Interaction to handle the `/ban_player_list` command. It bans/unbans the `is_list_banned` field of the player with `name` == `amq_name`."""
     await interaction.response.defer(ephemeral=True)
 
-    player_found, change_applied, player = Players_Controller().change_player_list_ban(amq_name, is_list_banned)
+    player_found, change_applied, player = await Players_Controller().change_player_list_ban(amq_name, is_list_banned)
     if not player_found:
         content = f'A player with name "{amq_name}" couldn\'t be found'
         await interaction.followup.send(content=content, ephemeral=True)
@@ -132,4 +137,32 @@ async def list_watched_banned_players(interaction: discord.Interaction):
         await interaction.followup.send(content=content, ephemeral=True)
 
     except discord.errors.Forbidden:
-        await send_message_as_file(interaction, answer)
\ No newline at end of file
+        await send_message_as_file(interaction, answer)
+
+
+@error_handler_decorator()
+async def simulate_teams(interaction: discord.Interaction, number_of_players: int, number_of_teams: int, splits: int, synthetic: bool):
+    """
+    Interaction to handle the `/simulate_teams` command.\n
+    It simulates `splits` team splits for each teams criteria that can be simulated (see `Code/Rolls/simulation.py`), sampling the players
+    from the registered players's rank distribution (or a synthetic one), and sends a summary of how unbalanced the teams were.
+    """
+    await interaction.response.defer(ephemeral=True)
+
+    if number_of_players % number_of_teams != 0:
+        content = f'{number_of_players} players can\'t be split evenly into {number_of_teams} teams!'
+        await interaction.followup.send(content=content, ephemeral=True)
+        return
+
+    rank_values = [] if synthetic else Players_Controller().get_all_rank_values()
+    distribution = 'registered players'
+    if not rank_values:
+        rank_values = simulation.synthetic_rank_values()
+        distribution = 'synthetic distribution'
+
+    # The simulation is CPU bound, so it is run in a separated thread to not block the event loop
+    results = await asyncio.to_thread(simulation.simulate_teams, rank_values, number_of_players, number_of_teams, splits)
+
+    content = f'**{splits} splits of {number_of_players} players into {number_of_teams} teams** ({distribution}, gap = strongest team total - weakest team total):\n'
+    content += '\n'.join(f'- {result}' for result in results)
+    await interaction.followup.send(content=content, ephemeral=True)
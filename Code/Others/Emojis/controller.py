@@ -5,6 +5,7 @@ import discord
 from Code.Others.Emojis.database import Emojis_Database
 from Code.Others.Emojis.emoji import MyEmoji
 from Code.Utilities.error_handler import print_exception
+from Code.Utilities.database_executor import Database_Executor
 
 class Emojis_Controller:
     """Controller to encapsule the Emojis Logic from the rest of the application."""
@@ -121,7 +122,7 @@ class Emojis_Controller:
     async def _delete_emoji_instance(self, emoji: MyEmoji) -> None:
         """Private core method to delete an emoji from Discord API, Database, and Catalogs at once."""
         await emoji.discord_obj.delete()        
-        Emojis_Database.delete_custom_emoji(emoji.emoji_id)
+        await Database_Executor().run(Emojis_Database.delete_custom_emoji, emoji.emoji_id)
         
         if emoji.emoji_id in self._emojis_by_ids:
             del self._emojis_by_ids[emoji.emoji_id]
@@ -164,7 +165,8 @@ class Emojis_Controller:
             self._emojis_by_ids[new_my_emoji.emoji_id] = new_my_emoji
             self._emojis_by_names[new_my_emoji.emoji_name] = new_my_emoji
 
-            Emojis_Database.add_custom_emoji(
+            await Database_Executor().run(
+                Emojis_Database.add_custom_emoji,
                 new_my_emoji.emoji_id, 
                 new_my_emoji.emoji_name, 
                 new_my_emoji.host_id, 
@@ -3,6 +3,7 @@ import os
 import discord
 
 from Code.Utilities.read_yaml import load_yaml_content
+from Code.Utilities.rate_limiter import Rate_Limiter
 
 class Roles:
     """Class that handle everything role related."""
@@ -32,6 +33,8 @@ class Roles:
 
         self.main_guild_common_ping: str = roles_data['pings']['tour_addicts']
 
+        self.rate_limiter = Rate_Limiter()
+
     
     def _get_team_roles(self, guild: discord.Guild, role_index: int = 0) -> tuple[discord.Role, list[discord.Role]]:
         """
@@ -58,6 +61,29 @@ class Roles:
                 raise ValueError('Invalid Guild ID')
 
 
+    def _get_all_team_roles(self, guild: discord.Guild) -> list[discord.Role]:
+        """
+        Return all the team's roles from the guild, sorted by their role index.
+
+        Raises:
+        -----------
+        - ValueError: if the guild id is not valid.
+        """
+        role, other_roles = self._get_team_roles(guild)
+        return [role] + other_roles
+
+
+    def _get_drafter_role(self, guild: discord.Guild) -> discord.Role | None:
+        """Return the drafter role from the guild (`None` if the guild has no drafter role)."""
+        match guild.id:
+            case self.main_guild_id:
+                return guild.get_role(self.main_guild_drafter_role_id)
+            case self.test_guild_id:
+                return guild.get_role(self.test_guild_drafter_role_id)
+            case _:
+                return None
+
+
     def get_ping_role(self, guild: discord.Guild) -> str:
         """Return a string containing the mention of the common_ping role."""
         match guild.id:
@@ -105,6 +131,83 @@ class Roles:
             print(f'Couldn\'t remove role from player {player_id}: {e}')
 
     
+    async def sync_team_roles(self, guild: discord.Guild, role_indexes: dict[int, int | None], on_progress: callable = None) -> list[int]:
+        """
+        Leave each player (identified by its discord id) from `role_indexes` with only the team role with the index they are mapped to
+        (or without team roles if mapped to `None`) in the guild provided.\n
+        Each member is updated with a single request (only if their team roles change), and the requests run concurrently within the
+        guild's rate limits. If provided, `on_progress` is awaited with the number of members updated and the total after each update.\n
+        Return the discord ids of the players whose roles couldn't be updated.
+
+        Raises:
+        -----------
+        - ValueError: if the guild id is not valid.
+        """
+        team_roles = self._get_all_team_roles(guild)
+        requests = {}
+        failed_ids = []
+
+        for player_id, role_index in role_indexes.items():
+            member = guild.get_member(player_id)
+            if member is None:
+                print(f'Invalid User ID ({player_id}). Player not in Guild ({guild.name if isinstance(guild, discord.Guild) else guild})?')
+                failed_ids.append(player_id)
+                continue
+
+            # NOTE the default role (@everyone) can't be sent within the member roles
+            roles = [role for role in member.roles if not role.is_default() and role not in team_roles]
+            if role_index is not None:
+                roles.append(team_roles[role_index])
+            if set(roles) == {role for role in member.roles if not role.is_default()}:
+                continue
+
+            # NOTE binding member and roles as default values, so each request edits its own member
+            requests[player_id] = (guild.id, lambda member=member, roles=roles: member.edit(roles=roles))
+
+        failures = await self.rate_limiter.run_all(requests, on_progress)
+        for player_id, e in failures.items():
+            print(f'Couldn\'t update team roles of player {player_id}: {e}')
+        return failed_ids + list(failures)
+
+
+    async def remove_tour_roles(self, guild: discord.Guild, player_ids: list[int], on_progress: callable = None) -> list[int]:
+        """
+        Remove the team roles and the drafter role from all the players (identified by their discord ids `player_ids`) in the guild provided.\n
+        Each member is updated with a single request (only if they have any of those roles), and the requests run concurrently within the
+        guild's rate limits (retrying the rate limited ones). If provided, `on_progress` is awaited with the number of members updated and
+        the total after each update.\n
+        Return the discord ids of the players whose roles couldn't be removed.
+
+        Raises:
+        -----------
+        - ValueError: if the guild id is not valid.
+        """
+        tour_roles = set(self._get_all_team_roles(guild))
+        drafter_role = self._get_drafter_role(guild)
+        if drafter_role is not None:
+            tour_roles.add(drafter_role)
+
+        requests = {}
+        failed_ids = []
+        for player_id in player_ids:
+            member = guild.get_member(player_id)
+            if member is None:
+                print(f'Invalid User ID ({player_id}). Player not in Guild ({guild.name if isinstance(guild, discord.Guild) else guild})?')
+                failed_ids.append(player_id)
+                continue
+
+            if not any(role in tour_roles for role in member.roles):
+                continue
+            # NOTE the default role (@everyone) can't be sent within the member roles
+            roles = [role for role in member.roles if not role.is_default() and role not in tour_roles]
+            requests[player_id] = (guild.id, lambda member=member, roles=roles: member.edit(roles=roles))
+
+        failures = await self.rate_limiter.run_all(requests, on_progress)
+        for player_id, e in failures.items():
+            print(f'Couldn\'t remove tour roles from player {player_id}: {e}')
+        return failed_ids + list(failures)
+
+
     async def add_all_team_roles(self, guild: discord.Guild, player_id: int):
         """
         Add all team roles to the player (identified by its discord id `player_id`) in the guild provided.
@@ -138,13 +241,9 @@ class Roles:
         if member is None:
             raise ValueError('Invalid User ID')
         
-        match guild.id:
-            case self.main_guild_id:
-                drafter_role = guild.get_role(self.main_guild_drafter_role_id)
-            case self.test_guild_id:
-                drafter_role = guild.get_role(self.test_guild_drafter_role_id)
-            case _:
-                raise ValueError('Invalid Guild ID')
+        drafter_role = self._get_drafter_role(guild)
+        if drafter_role is None:
+            raise ValueError('Invalid Guild ID')
 
         try:
             await member.add_roles(drafter_role)
@@ -160,13 +259,9 @@ class Roles:
         -----------
         - ValueError: if the player is not valid.
         """
-        match guild.id:
-            case self.main_guild_id:
-                drafter_role = guild.get_role(self.main_guild_drafter_role_id)
-            case self.test_guild_id:
-                drafter_role = guild.get_role(self.test_guild_drafter_role_id)
-            case _:
-                return  # No drafter role to remove
+        drafter_role = self._get_drafter_role(guild)
+        if drafter_role is None:
+            return  # No drafter role to remove
             
         member = guild.get_member(player_id)
         try:
@@ -1,7 +1,10 @@
-import difflib
+import os
 
 from Code.Players.player import Player
 from Code.Players.database_sqlite3 import Players_Database
+from Code.Players.write_behind import Players_Write_Behind
+from Code.Utilities.fuzzy_index import Fuzzy_Index
+from Code.Utilities.database_executor import Database_Executor
 
 class Players_Controller:
     """Controller to encapsule the Players Logic from the rest of the application."""
@@ -14,9 +17,20 @@ class Players_Controller:
         return cls._instance
     
     def _set_data(self) -> None:
-        """Retrieve all the Players from the Database and load them into memory through the Players's Catalogs (by id and amq_name)."""
+        """
+        Retrieve all the Players from the Database and load them into memory through the Players's Catalogs (by id and amq_name).
+
+        If the `PLAYERS_WRITE_BEHIND` environment variable is enabled, the `rank`, `is_banned` and `is_list_banned` changes are batched
+        (see `Players_Write_Behind`), and the changes journaled but not written by a previous run are applied before loading the Players.
+        """
         self.players_by_ids: dict[int, Player] = {}
         self.players_by_amq_name: dict[str, Player] = {}
+        self.players_names_index = Fuzzy_Index()
+
+        self.write_behind: Players_Write_Behind | None = None
+        if os.getenv('PLAYERS_WRITE_BEHIND', '').lower() in ('1', 'true', 'yes'):
+            Players_Write_Behind.replay_journal()
+            self.write_behind = Players_Write_Behind()
 
         players = Players_Database.get_all_players()
         for player_data in players:
@@ -28,14 +42,18 @@ class Players_Controller:
         player = Player(discord_id=discord_id, amq_name=amq_name, rank=rank, is_banned=is_banned, is_list_banned=is_list_banned)
         self.players_by_ids[discord_id] = player
         self.players_by_amq_name[amq_name.lower()] = player
+        self.players_names_index.add(amq_name.lower())
     
 
     def _get_player_by_name(self, amq_name: str) -> Player | None:
         """Return the player which name is the most similar to the `amq_name` provided as argument (or None if a not close enough match was found)."""
-        closest_matches = difflib.get_close_matches(amq_name.lower(), self.players_by_amq_name.keys())
-        closest_match = closest_matches[0] if closest_matches else None
+        closest_match = self.players_names_index.get_closest(amq_name.lower())
         return self.players_by_amq_name.get(closest_match) if closest_match is not None else None
 
+    def complete_player_names(self, amq_name: str) -> list[str]:
+        """Return the amq names of the players to suggest (autocomplete) while `amq_name` is being typed (see `Fuzzy_Index.complete`)."""
+        return [self.players_by_amq_name[name].amq_name for name in self.players_names_index.complete(amq_name.lower())]
+
     def get_player(self, id_or_name: int | str) -> Player | None:
         """
         Return the `Player` object given its `discord_id` or `amq_name`.\n
@@ -56,6 +74,10 @@ class Players_Controller:
             raise ValueError('Invalid `id_or_name` value type!')
 
     
+    def get_all_rank_values(self) -> list[int]:
+        """Return a list with the rank value of every player (so the players's rank distribution can be analyzed)."""
+        return [player.rank.value for player in self.players_by_ids.values()]
+
     def get_all_banned_players(self) -> list[Player]:
         """Return a list wirh all the players that are currently banned."""
         return [player for player in self.players_by_ids.values() if player.is_banned]
@@ -65,7 +87,25 @@ class Players_Controller:
         return [player for player in self.players_by_ids.values() if player.is_list_banned]
 
 
-    def register_player(self, discord_id: int, amq_name: str) -> tuple[bool, str | None]:
+    async def _save_change(self, column: str, discord_id: int, value: str | bool, database_method: callable) -> None:
+        """Queue the change in the write-behind queue if it is enabled, or write it into the Database through `database_method` otherwise."""
+        if self.write_behind is not None:
+            self.write_behind.add_change(column, discord_id, value)
+        else:
+            await Database_Executor().run(database_method, discord_id, value)
+
+    async def flush_pending_changes(self) -> None:
+        """Write into the Database the changes waiting in the write-behind queue (if it is enabled)."""
+        if self.write_behind is not None:
+            await self.write_behind.flush()
+
+    async def close(self) -> None:
+        """Write the pending changes into the Database and close the write-behind queue (if it is enabled)."""
+        if self.write_behind is not None:
+            await self.write_behind.close()
+
+
+    async def register_player(self, discord_id: int, amq_name: str) -> tuple[bool, str | None]:
         """
         Add a player to the Players's Database and Catalogs (by `discord_id` and `amq_name`).\n
         Only `discord_id` and `amq_name` are required as the rest of the Player's fields will be initialized as the default values.\n
@@ -82,12 +122,14 @@ class Players_Controller:
         if other_player is not None:
             return False, other_player.discord_ping
 
+        # Changes on the rest of the columns don't affect the insert, but keep the Database in sync before touching the `amq` unique column
+        await self.flush_pending_changes()
         self._add_player_to_catalogs(discord_id, amq_name)
-        Players_Database.add_player(discord_id, amq_name)
+        await Database_Executor().run(Players_Database.add_player, discord_id, amq_name)
         return True, None
 
 
-    def change_player_amq(self, discord_id: int, new_amq_name: str) -> tuple[bool, str | None]:
+    async def change_player_amq(self, discord_id: int, new_amq_name: str) -> tuple[bool, str | None]:
         """
         Change the player's amq name with `discord_id` to `new_amq_name`.\n
         The method return a tuple which first element is a boolean that can be `False` if:
@@ -109,18 +151,26 @@ class Players_Controller:
         
         # Delete old references (deleting (or modifying the amq name value) from player_by_ids catalog is not needed)
         del self.players_by_amq_name[player.amq_name.lower()]
+        self.players_names_index.remove(player.amq_name.lower())
 
         # Change the name and reinsert the Player in the catalogs with their new name
         old_amq_name = player.amq_name
         player.amq_name = new_amq_name
         self.players_by_amq_name[player.amq_name.lower()] = player
+        self.players_names_index.add(player.amq_name.lower())
+
+        # Importing inside function to avoid circular import error
+        from Code.Tours.controller import Tours_Controller
+        Tours_Controller().reindex_player_name(player)
 
         # Apply the change into the database
-        Players_Database.change_player_amq(player.discord_id, player.amq_name)
+        # NOTE `amq` changes are never write-behind: the unique constraint makes them depend on the order they were applied in
+        await self.flush_pending_changes()
+        await Database_Executor().run(Players_Database.change_player_amq, player.discord_id, player.amq_name)
         return True, old_amq_name
     
 
-    def change_player_rank(self, player_amq_name: str, new_rank: str) -> tuple[bool, Player, str]:
+    async def change_player_rank(self, player_amq_name: str, new_rank: str) -> tuple[bool, Player, str]:
         """
         Change the rank of the player with name == `player_amq_name`.\n
         Returns a boolean telling the user whether the change could be applied.\n
@@ -136,12 +186,12 @@ class Players_Controller:
         player.rank = new_rank
 
         # Update rank in database
-        Players_Database.change_player_rank(player.discord_id, player.rank.name)
+        await self._save_change('rank', player.discord_id, player.rank.name, Players_Database.change_player_rank)
 
         return True, player, old_rank
     
 
-    def change_player_ban(self, player_amq_name: str, new_is_banned: bool) -> tuple[bool, bool, Player | None]:
+    async def change_player_ban(self, player_amq_name: str, new_is_banned: bool) -> tuple[bool, bool, Player | None]:
         """
         Change the `is_banned` value of the player with name == `player_amq_name`.\n
         Returns a tuple:
@@ -162,12 +212,12 @@ class Players_Controller:
         player.is_banned = new_is_banned
 
         # Update is_banned in database
-        Players_Database.change_is_baned(player.discord_id, player.is_banned)
+        await self._save_change('is_banned', player.discord_id, player.is_banned, Players_Database.change_is_baned)
 
         return True, True, player
     
 
-    def change_player_list_ban(self, player_amq_name: str, new_is_list_banned: bool) -> tuple[bool, bool, Player | None]:
+    async def change_player_list_ban(self, player_amq_name: str, new_is_list_banned: bool) -> tuple[bool, bool, Player | None]:
         """
         Change the `is_list_banned` value of the player with name == `player_amq_name`.\n
         Returns a tuple:
@@ -188,6 +238,6 @@ class Players_Controller:
         player.is_list_banned = new_is_list_banned
 
         # Update is_list_banned in database
-        Players_Database.change_is_list_baned(player.discord_id, player.is_list_banned)
+        await self._save_change('is_list_banned', player.discord_id, player.is_list_banned, Players_Database.change_is_list_baned)
 
         return True, True, player
\ No newline at end of file
@@ -85,4 +85,23 @@ class Players_Database:
         """
         change_player_is_list_banned_query = 'UPDATE players SET is_list_banned = ? WHERE id = ?'
         player = (is_list_banned, discord_id)
-        cur.execute(change_player_is_list_banned_query, player)
\ No newline at end of file
+        cur.execute(change_player_is_list_banned_query, player)
+
+    @staticmethod
+    @connection_manager
+    def apply_changes(changes: dict[str, list[tuple[str | bool, int]]], cur: sqlite3.Cursor = None) -> None:
+        """
+        Apply a batch of changes into the Player's Database in a single transaction.\n
+        `changes` maps each column (`rank`, `is_banned` or `is_list_banned`) to the `(new_value, discord_id)` rows to update.
+        Do NOT add a `cur` value, its a placeholder which value will be replaced.
+
+        Raise:
+        ------
+        - `ValueError`:
+            If one of the columns provided can't be updated through this method.
+        """
+        for column, players in changes.items():
+            if column not in ('rank', 'is_banned', 'is_list_banned'):
+                raise ValueError(f'Invalid column provided: {column}!')
+            change_players_column_query = f'UPDATE players SET {column} = ? WHERE id = ?'
+            cur.executemany(change_players_column_query, players)
@@ -0,0 +1,183 @@
+import os
+import json
+import asyncio
+
+from Code.Players.database_sqlite3 import Players_Database
+from Code.Utilities.database_executor import Database_Executor
+
+JOURNAL_PATH = os.path.join('Database', 'players_write_behind.journal')
+FLUSH_INTERVAL = 5.0        # Seconds a change can wait in memory before being written into the Database
+FLUSH_THRESHOLD = 100       # Number of pending (coalesced) changes that triggers a flush without waiting for the timer
+MAX_RETRY_DELAY = 300.0     # Max seconds waited before retrying a failed flush (the delay doubles with every consecutive failure)
+
+
+class Players_Write_Behind:
+    """
+    Write-behind queue for the Players's state changes (`rank`, `is_banned`, `is_list_banned`).\n
+    Changes are acknowledged as soon as they are appended (and fsynced) to a journal file, then coalesced in memory (only the last value
+    of each `(column, discord_id)` pair is kept) and written into the Database in a single `executemany` transaction, either every
+    `flush_interval` seconds or as soon as `flush_threshold` changes are pending.\n
+    If the bot stops before a flush, the journal is replayed the next time the Players are loaded, so no acknowledged change is lost.
+
+    NOTE The journal is rotated (renamed to `<journal_path>.flushing`) right before a batch is sent to the Database and removed once the
+    batch is committed, so the changes acknowledged while a flush is running are never deleted from disk along with the flushed ones.
+    """
+
+    COLUMNS = ('rank', 'is_banned', 'is_list_banned')
+
+    def __init__(self, journal_path: str = JOURNAL_PATH, flush_interval: float = FLUSH_INTERVAL, flush_threshold: int = FLUSH_THRESHOLD) -> None:
+        self.journal_path = journal_path
+        self.flush_interval = flush_interval
+        self.flush_threshold = flush_threshold
+
+        self._pending: dict[tuple[str, int], str | bool] = {}
+        self._journal = open(self.journal_path, 'a', encoding='utf-8')
+        self._flush_lock = asyncio.Lock()
+        self._timer_task: asyncio.Task | None = None
+        self._flush_tasks: set[asyncio.Task] = set()     # flushes triggered by the threshold (referenced until they finish)
+        self._failed_flushes = 0                         # consecutive flushes that failed
+
+
+    @staticmethod
+    def _flushing_path(journal_path: str) -> str:
+        """Return the path the journal is renamed to while its changes are being written into the Database."""
+        return f'{journal_path}.flushing'
+
+    @staticmethod
+    def _read_journal(path: str) -> list[tuple[str, int, str | bool]]:
+        """
+        Return the `(column, discord_id, value)` changes stored in the journal file located at `path` (an empty list if it doesn't exist).\n
+        A malformed last line (the bot stopped while it was being written, so it was never acknowledged) is ignored.
+        """
+        if not os.path.exists(path):
+            return []
+
+        with open(path, 'r', encoding='utf-8') as file:
+            lines = [line for line in file.read().splitlines() if line]
+
+        changes = []
+        for i, line in enumerate(lines):
+            try:
+                column, discord_id, value = json.loads(line)
+            except ValueError:
+                if i == len(lines) - 1:
+                    break
+                raise
+            changes.append((column, discord_id, value))
+        return changes
+
+    @staticmethod
+    def _group_by_column(changes: dict[tuple[str, int], str | bool]) -> dict[str, list[tuple[str | bool, int]]]:
+        """Return the coalesced `changes` grouped by column, as the `(value, discord_id)` rows expected by `Players_Database.apply_changes`."""
+        rows_by_column: dict[str, list[tuple[str | bool, int]]] = {}
+        for (column, discord_id), value in changes.items():
+            rows_by_column.setdefault(column, []).append((value, discord_id))
+        return rows_by_column
+
+    @staticmethod
+    def replay_journal(journal_path: str = JOURNAL_PATH) -> int:
+        """
+        Apply into the Database the changes left in the journal files by a previous run, and delete those files afterwards.\n
+        Meant to be called before the Players are loaded from the Database. Return the number of (coalesced) changes applied.
+        """
+        flushing_path = Players_Write_Behind._flushing_path(journal_path)
+
+        # Older changes (the ones of the interrupted flush) first, so newer values overwrite them while coalescing
+        coalesced: dict[tuple[str, int], str | bool] = {}
+        for path in (flushing_path, journal_path):
+            for column, discord_id, value in Players_Write_Behind._read_journal(path):
+                coalesced[(column, discord_id)] = value
+
+        if coalesced:
+            Players_Database.apply_changes(Players_Write_Behind._group_by_column(coalesced))
+
+        for path in (flushing_path, journal_path):
+            if os.path.exists(path):
+                os.remove(path)
+
+        return len(coalesced)
+
+
+    def add_change(self, column: str, discord_id: int, value: str | bool) -> None:
+        """
+        Journal the change of the `column` value of the player with `discord_id` to `value`, and queue it to be written into the Database.\n
+        Once this method returns, the change survives a crash of the bot.
+
+        Raise:
+        ------
+        - `ValueError`:
+            If the `column` provided is not handled by the write-behind queue.
+        """
+        if column not in Players_Write_Behind.COLUMNS:
+            raise ValueError(f'Invalid `column` value: {column}!')
+
+        self._journal.write(json.dumps([column, discord_id, value]) + '\n')
+        self._journal.flush()
+        os.fsync(self._journal.fileno())
+
+        self._pending[(column, discord_id)] = value
+
+        if len(self._pending) >= self.flush_threshold:
+            task = asyncio.create_task(self._flush_or_retry())
+            self._flush_tasks.add(task)
+            task.add_done_callback(self._flush_tasks.discard)
+        elif self._timer_task is None or self._timer_task.done():
+            self._timer_task = asyncio.create_task(self._flush_later(self.flush_interval))
+
+    async def _flush_later(self, delay: float) -> None:
+        """Flush the pending changes after `delay` seconds."""
+        await asyncio.sleep(delay)
+        await self._flush_or_retry()
+
+    async def _flush_or_retry(self) -> None:
+        """
+        Flush the pending changes. If the flush fails, log the error and schedule a retry (waiting twice as long after every consecutive
+        failure, up to `MAX_RETRY_DELAY` seconds), so the changes are written even if no other change is added.
+        """
+        try:
+            await self.flush()
+        except Exception as e:
+            self._failed_flushes += 1
+            delay = min(self.flush_interval * 2**self._failed_flushes, MAX_RETRY_DELAY)
+            print(f'Couldn\'t write the players changes into the Database ({e}), retrying in {delay:.1f}s')
+
+            # NOTE replacing any pending timer (this method may be running inside it) by the retry one
+            if self._timer_task is not None and self._timer_task is not asyncio.current_task() and not self._timer_task.done():
+                self._timer_task.cancel()
+            self._timer_task = asyncio.create_task(self._flush_later(delay))
+        else:
+            self._failed_flushes = 0
+
+    async def flush(self) -> None:
+        """Write all the pending changes into the Database in a single transaction (through the Database's writer thread)."""
+        async with self._flush_lock:
+            if not self._pending:
+                return
+
+            # Swap the batch and the journal together, so the changes acknowledged from now on go to a new journal file
+            batch, self._pending = self._pending, {}
+            flushing_path = self._flushing_path(self.journal_path)
+            self._journal.close()
+            os.replace(self.journal_path, flushing_path)
+            self._journal = open(self.journal_path, 'a', encoding='utf-8')
+
+            try:
+                await Database_Executor().run(Players_Database.apply_changes, self._group_by_column(batch))
+            except Exception:
+                # Give the batch back (without overwriting the newer values) and merge both journals so the next flush retries it
+                self._pending = {**batch, **self._pending}
+                self._journal.close()
+                with open(flushing_path, 'a', encoding='utf-8') as flushing, open(self.journal_path, 'r', encoding='utf-8') as journal:
+                    flushing.write(journal.read())
+                os.replace(flushing_path, self.journal_path)
+                self._journal = open(self.journal_path, 'a', encoding='utf-8')
+                raise
+            os.remove(flushing_path)
+
+    async def close(self) -> None:
+        """Flush the pending changes and close the journal. Meant to be called when the bot shuts down."""
+        if self._timer_task is not None and not self._timer_task.done():
+            self._timer_task.cancel()
+        await asyncio.gather(*self._flush_tasks, return_exceptions=True)
+        await self.flush()
+        self._journal.close()
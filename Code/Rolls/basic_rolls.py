@@ -2,6 +2,7 @@ import random
 import datetime
 
 from Code.Rolls import enums
+from Code.Rolls.roll_engine import Roll_Engine
 from Code.Gamemodes.controller import Main_Controller
 from Code.Gamemodes.Gamemodes.gamemode import Gamemode
 from Code.Gamemodes.Artists.og_artist import OG_Artist
@@ -15,10 +16,18 @@ class Roll:
     """Static class that contains methods to produce all basic rolls."""
 
     @staticmethod
-    def roll(type: enums.Rolls_Enum, as_str: bool = False) -> str | OG_Artist | CQ_Artist | OG_SpecialList | CQ_SpecialList | GlobalPlayer:
+    def _roll_catalog(catalog: enums.Rolls_Enum | enums.Rolls_Spotlight, get_entries: callable, guild_id: int | None, rng: random.Random) -> object:
+        """Roll an entry of a Gamemodes's catalog through the `Roll_Engine` (`get_entries` is only called when the catalogs changed)."""
+        return Roll_Engine().roll(catalog, Main_Controller().catalogs_version, get_entries, guild_id, rng)
+
+
+    @staticmethod
+    def roll(type: enums.Rolls_Enum, as_str: bool = False, guild_id: int | None = None, rng: random.Random = random) -> str | OG_Artist | CQ_Artist | OG_SpecialList | CQ_SpecialList | GlobalPlayer:
         """
         Roll some stuff (no gamemodes) based on the `type` value\n.
-        Returns the roll itself if `as_str` = False or an string representation of the roll with some additional information if `as_str` = True.
+        Returns the roll itself if `as_str` = False or an string representation of the roll with some additional information if `as_str` = True.\n
+        If the `guild_id` the roll is made for is provided, the catalogs's rolls avoid repeating the last ones made in that guild (see `Roll_Engine`).\n
+        The roll is made with `rng` (the `random` module by default, a `Roll_Session`'s one to make it reproducible).
 
         Example:
         --------
@@ -37,92 +46,92 @@ class Roll:
         match type:
 
             case enums.Rolls_Enum.ARTIST_OG:
-                roll = random.choice(Main_Controller().get_artists_OG())
+                roll = Roll._roll_catalog(type, Main_Controller().get_artists_OG, guild_id, rng)
                 return repr(roll) if as_str else roll
             
             case enums.Rolls_Enum.ARTIST_CQ:
-                roll = random.choice(Main_Controller().get_artists_CQ())
+                roll = Roll._roll_catalog(type, Main_Controller().get_artists_CQ, guild_id, rng)
                 return repr(roll) if as_str else roll
             
             case enums.Rolls_Enum.SPECIAL_LIST_OG:
-                roll = random.choice(Main_Controller().get_special_lists_OG())
+                roll = Roll._roll_catalog(type, Main_Controller().get_special_lists_OG, guild_id, rng)
                 return repr(roll) if as_str else roll
             
             case enums.Rolls_Enum.SPECIAL_LIST_CQ:
-                roll = random.choice(Main_Controller().get_special_lists_CQ())
+                roll = Roll._roll_catalog(type, Main_Controller().get_special_lists_CQ, guild_id, rng)
                 return repr(roll) if as_str else roll
             
             case enums.Rolls_Enum.ALL_GLOBAL_PLAYER:
-                roll = random.choice(Main_Controller().get_all_global_players())
+                roll = Roll._roll_catalog(type, Main_Controller().get_all_global_players, guild_id, rng)
                 return repr(roll) if as_str else roll
             
             case enums.Rolls_Enum.ACTIVE_GLOBAL_PLAYER:
-                roll = random.choice(Main_Controller().get_active_global_players())
+                roll = Roll._roll_catalog(type, Main_Controller().get_active_global_players, guild_id, rng)
                 return repr(roll) if as_str else roll
 
             case enums.Rolls_Enum.GENRE:
-                roll = random.choice(Main_Controller().get_genres())
+                roll = Roll._roll_catalog(type, Main_Controller().get_genres, guild_id, rng)
                 return f'**Genre rolled:** {roll}' if as_str else roll
 
             case enums.Rolls_Enum.TAG:
-                roll = random.choice(Main_Controller().get_tags())
+                roll = Roll._roll_catalog(type, Main_Controller().get_tags, guild_id, rng)
                 return f'**Tag rolled:** {roll}' if as_str else roll
             
             case enums.Rolls_Enum.METRONOME:
-                roll = random.choice(Main_Controller().get_metronomes())
+                roll = Roll._roll_catalog(type, Main_Controller().get_metronomes, guild_id, rng)
                 return f'**Metronome rolled:** {roll}' if as_str else roll
             
             case enums.Rolls_Enum.ITEM:
-                roll = random.choice(Main_Controller().get_items())
+                roll = Roll._roll_catalog(type, Main_Controller().get_items, guild_id, rng)
                 return f'**Item rolled:** {roll}' if as_str else roll
             
             case enums.Rolls_Enum.SONG_SELECTION:
                 selection_names = [selection.name for selection in enums.SongSelections]
-                roll = random.choice(selection_names)
+                roll = rng.choice(selection_names)
                 if not as_str:
                     return roll
                 # We additionally roll distribution if watched or mixed
                 if roll in {enums.SongSelections.MIXED.name, enums.SongSelections.WATCHED.name}:
                     distribution_names = [distribution.name for distribution in enums.Distributions]
-                    distribution_roll = random.choice(distribution_names)
+                    distribution_roll = rng.choice(distribution_names)
                     return f'**Song selection rolled:** {roll.capitalize()} ({distribution_roll.capitalize()} distribution)'
                 else:
                     return f'**Song selection rolled:** {roll.capitalize()}'
             
             case enums.Rolls_Enum.DISTRIBUTION:
                 distribution_names = [distribution.name for distribution in enums.Distributions]
-                roll = random.choice(distribution_names)
+                roll = rng.choice(distribution_names)
                 return f'**Distribution rolled:** {roll.capitalize()}' if as_str else roll.capitalize()
             
             case enums.Rolls_Enum.TYPE_4:
                 type_4_names = [type.name for type in enums.Type_4]
-                roll = random.choice(type_4_names)
+                roll = rng.choice(type_4_names)
                 return f'**Type 4 rolled:** {roll}' if as_str else roll
             
             case enums.Rolls_Enum.TYPE_5:
                 type_5_names = [type.name for type in enums.Type_5]
-                roll = random.choice(type_5_names)
+                roll = rng.choice(type_5_names)
                 return f'**Type 5 rolled:** {roll}' if as_str else roll
             
             case enums.Rolls_Enum.TYPE_7:
                 type_7_names = [type.name for type in enums.Type_7]
-                roll = random.choice(type_7_names)
+                roll = rng.choice(type_7_names)
                 return f'**Type 7 rolled:** {roll}' if as_str else roll
             
             case enums.Rolls_Enum.MASTERY_MODE:
                 mastery_mode_names = [mastery_mode.name.capitalize() for mastery_mode in enums.Mastery_Modes]
-                roll = random.choice(mastery_mode_names)
+                roll = rng.choice(mastery_mode_names)
                 return f'**Mastery mode rolled:** {roll}' if as_str else roll
             
             case enums.Rolls_Enum.YEAR:
                 first_year = 1968       # Previous years do not have enough songs to be rolled (20+); modify if needed
                 last_year = datetime.datetime.now().year
-                roll = random.randint(first_year, last_year)
+                roll = rng.randint(first_year, last_year)
                 return f'**Year rolled:** {roll}' if as_str else roll
             
             case enums.Rolls_Enum.ONE_LIFE_CHALLENGE:
                 one_life_challenge_names = [mode.name.lstrip('_').replace('_', ' ').capitalize() for mode in enums.One_Life_Challenge]
-                roll = random.choice(one_life_challenge_names)
+                roll = rng.choice(one_life_challenge_names)
                 return f'**One Life Challenge rolled:** {roll}' if as_str else roll
             
             case enums.Rolls_Enum.UMA_MUSUME_DISTANCES:
@@ -132,7 +141,7 @@ class Roll:
                     enums.Uma_Musume_Distances.MEDIUM: 80,
                     enums.Uma_Musume_Distances.LONG: 90
                 }
-                roll = random.choice(list(enums.Uma_Musume_Distances))
+                roll = rng.choice(list(enums.Uma_Musume_Distances))
                 value = distances_dict[roll]
                 return f'**Uma Musume distance rolled:** {roll.name.capitalize()} (Points goal {value})' if as_str else f'{roll.name.capitalize()} (Points goal {value})'
             
@@ -143,7 +152,7 @@ class Roll:
                     enums.Uma_Musume_Tracks.SOFT: 'OPEDINs 25-60',
                     enums.Uma_Musume_Tracks.HEAVY: 'OPEDINs 25-100'
                 }
-                roll = random.choice(list(enums.Uma_Musume_Tracks))
+                roll = rng.choice(list(enums.Uma_Musume_Tracks))
                 value = tracks_dict[roll]
                 return f'**Uma Musume track rolled:** {roll.name.capitalize()} ({value})' if as_str else f'{roll.name.capitalize()} ({value})'
 
@@ -152,43 +161,47 @@ class Roll:
 
 
     @staticmethod
-    def roll_spotlight(type: enums.Rolls_Enum, as_str: bool = False) -> Male_Artist | Male_VA | Female_Artist | Female_VA | Group | Composer | Franchise | Community | Studio:
-        """Roll a spotlight artist/group/etc."""
+    def roll_spotlight(type: enums.Rolls_Enum, as_str: bool = False, guild_id: int | None = None, rng: random.Random = random) -> Male_Artist | Male_VA | Female_Artist | Female_VA | Group | Composer | Franchise | Community | Studio:
+        """
+        Roll a spotlight artist/group/etc.\n
+        If the `guild_id` the roll is made for is provided, the roll avoids repeating the last ones made in that guild (see `Roll_Engine`).\n
+        The roll is made with `rng` (the `random` module by default, a `Roll_Session`'s one to make it reproducible).
+        """
         match type:
             case enums.Rolls_Spotlight.MALE_ARTIST:
-                roll = random.choice(Main_Controller().get_spotlight_male_artists())
+                roll = Roll._roll_catalog(type, Main_Controller().get_spotlight_male_artists, guild_id, rng)
                 return repr(roll) if as_str else roll
             
             case enums.Rolls_Spotlight.MALE_VA:
-                roll = random.choice(Main_Controller().get_spotlight_male_VAs())
+                roll = Roll._roll_catalog(type, Main_Controller().get_spotlight_male_VAs, guild_id, rng)
                 return repr(roll) if as_str else roll
             
             case enums.Rolls_Spotlight.FEMALE_ARTIST:
-                roll = random.choice(Main_Controller().get_spotlight_female_artists())
+                roll = Roll._roll_catalog(type, Main_Controller().get_spotlight_female_artists, guild_id, rng)
                 return repr(roll) if as_str else roll
             
             case enums.Rolls_Spotlight.FEMALE_VA:
-                roll = random.choice(Main_Controller().get_spotlight_female_VAs())
+                roll = Roll._roll_catalog(type, Main_Controller().get_spotlight_female_VAs, guild_id, rng)
                 return repr(roll) if as_str else roll
             
             case enums.Rolls_Spotlight.GROUP:
-                roll = random.choice(Main_Controller().get_spotlight_groups())
+                roll = Roll._roll_catalog(type, Main_Controller().get_spotlight_groups, guild_id, rng)
                 return repr(roll) if as_str else roll
             
             case enums.Rolls_Spotlight.COMPOSER:
-                roll = random.choice(Main_Controller().get_spotlight_composers())
+                roll = Roll._roll_catalog(type, Main_Controller().get_spotlight_composers, guild_id, rng)
                 return repr(roll) if as_str else roll
             
             case enums.Rolls_Spotlight.FRANCHISE:
-                roll = random.choice(Main_Controller().get_spotlight_franchises())
+                roll = Roll._roll_catalog(type, Main_Controller().get_spotlight_franchises, guild_id, rng)
                 return repr(roll) if as_str else roll
             
             case enums.Rolls_Spotlight.COMMUNITY:
-                roll = random.choice(Main_Controller().get_spotlight_communities())
+                roll = Roll._roll_catalog(type, Main_Controller().get_spotlight_communities, guild_id, rng)
                 return repr(roll) if as_str else roll
             
             case enums.Rolls_Spotlight.STUDIO:
-                roll = random.choice(Main_Controller().get_spotlight_studios())
+                roll = Roll._roll_catalog(type, Main_Controller().get_spotlight_studios, guild_id, rng)
                 return repr(roll) if as_str else roll
             
             case _:
@@ -196,70 +209,16 @@ class Roll:
             
 
     @staticmethod
-    def roll_gamemode(type: enums.Roll_Gamemode = enums.Roll_Gamemode.ALL_GAMEMODES) -> Gamemode:
-        """Roll a gamemode."""
-        gamemodes = Main_Controller().get_gamemodes()
-
-        match type:
-
-            case enums.Roll_Gamemode.ALL_GAMEMODES:
-                gamemodes = gamemodes
-
-            case enums.Roll_Gamemode.ONLY_1V1:
-                gamemodes = [gamemode for gamemode in gamemodes if gamemode.size == 1]
-
-            case enums.Roll_Gamemode.ONLY_2V2:
-                gamemodes = [gamemode for gamemode in gamemodes if gamemode.size == 2]
-
-            case enums.Roll_Gamemode.ONLY_3V3:
-                gamemodes = [gamemode for gamemode in gamemodes if gamemode.size == 3]
-
-            case enums.Roll_Gamemode.ONLY_4V4:
-                gamemodes = [gamemode for gamemode in gamemodes if gamemode.size == 4]
-                
-            case enums.Roll_Gamemode.ONLY_WATCHED:
-                gamemodes = [gamemode for gamemode in gamemodes if gamemode.watched_song_selection]
-            
-            case enums.Roll_Gamemode.ONLY_WATCHED_1V1:
-                gamemodes = [gamemode for gamemode in gamemodes if gamemode.watched_song_selection and gamemode.size == 1]
-
-            case enums.Roll_Gamemode.ONLY_WATCHED_2V2:
-                gamemodes = [gamemode for gamemode in gamemodes if gamemode.watched_song_selection and gamemode.size == 2]
-
-            case enums.Roll_Gamemode.ONLY_WATCHED_3V3:
-                gamemodes = [gamemode for gamemode in gamemodes if gamemode.watched_song_selection and gamemode.size == 3]
-
-            case enums.Roll_Gamemode.ONLY_WATCHED_4V4:
-                gamemodes = [gamemode for gamemode in gamemodes if gamemode.watched_song_selection and gamemode.size == 4]
-
-            case enums.Roll_Gamemode.ONLY_RANDOM:
-                gamemodes = [gamemode for gamemode in gamemodes if not gamemode.watched_song_selection]
-
-            case enums.Roll_Gamemode.ONLY_RANDOM_1V1:
-                gamemodes = [gamemode for gamemode in gamemodes if not gamemode.watched_song_selection and gamemode.size == 1]
-
-            case enums.Roll_Gamemode.ONLY_RANDOM_2V2:
-                gamemodes = [gamemode for gamemode in gamemodes if not gamemode.watched_song_selection and gamemode.size == 2]
-
-            case enums.Roll_Gamemode.ONLY_RANDOM_3V3:
-                gamemodes = [gamemode for gamemode in gamemodes if not gamemode.watched_song_selection and gamemode.size == 3]
-
-            case enums.Roll_Gamemode.ONLY_RANDOM_4V4:
-                gamemodes = [gamemode for gamemode in gamemodes if not gamemode.watched_song_selection and gamemode.size == 4]
-
-            case enums.Roll_Gamemode.ONLY_TEAMS_MODES:
-                gamemodes = [gamemode for gamemode in gamemodes if gamemode.size > 1]
-
-            case enums.Roll_Gamemode.ONLY_WATCHED_TEAMS_MODES:
-                gamemodes = [gamemode for gamemode in gamemodes if gamemode.watched_song_selection and gamemode.size > 1]
-
-            case enums.Roll_Gamemode.ONLY_RANDOM_TEAMS_MODES:
-                gamemodes = [gamemode for gamemode in gamemodes if not gamemode.watched_song_selection and gamemode.size > 1]
-
-            case enums.Roll_Gamemode.ONLY_SPOTLIGHT:
-                gamemodes = [gamemode for gamemode in gamemodes if 'spotlight' in gamemode.name.lower()]
+    def roll_gamemode(type: enums.Roll_Gamemode = enums.Roll_Gamemode.ALL_GAMEMODES, max_size: int | None = None, rng: random.Random = random) -> Gamemode:
+        """
+        Roll a gamemode (with `rng`).\n
+        If `max_size` is provided, only the gamemodes requiring `max_size` players per team or less can be rolled
+        (each of them keeping the same probability relative to the others).
 
-            case _:
-                raise ValueError('Invalied "type" value')
-            
-        return random.choice(gamemodes)
\ No newline at end of file
+        Raise:
+        ------
+        - `IndexError`: If there is no gamemode that satisfies the constraints.
+        """
+        # NOTE the gamemodes rollable for each type are precomputed by the Gamemodes controller (see `Gamemode_Roll_Index`)
+        gamemodes = Main_Controller().get_rollable_gamemodes(type, max_size)
+        return rng.choice(gamemodes)
\ No newline at end of file
@@ -5,14 +5,16 @@ from Code.Rolls import enums
 from Code.Rolls.basic_rolls import Roll
 from Code.Rolls.match import Match
 from Code.Players.player import Player
+from Code.Gamemodes.controller import Main_Controller
 
 class Blind_Crews:
     """Class that contains the methods to roll a blind crews round given two teams."""
-    def __init__(self, type: enums.Roll_Gamemode, team_1: list[Player], team_2: list[Player]) -> None:
-        """Class constructor"""
+    def __init__(self, type: enums.Roll_Gamemode, team_1: list[Player], team_2: list[Player], rng: random.Random = random) -> None:
+        """Class constructor. All the round's rolls are made with `rng` (the `random` module by default, a `Roll_Session`'s one to make them reproducible)."""
         self.type = type
         self.team_1 = team_1
         self.team_2 = team_2
+        self.rng = rng
         
         self.matches: list[Match] = []             # List of rolled matches
         self.special_rolls_list: list[str] = []    # All the additional rolls for special modes (artistmania, random tag, etc.)
@@ -43,43 +45,30 @@ class Blind_Crews:
         NOTE: `team_1` and `team_2` are the list of players NOT YET SELECTED to play a gamemode.\n
         NOTE: `team_1` and `team_2` lists are modified inside this method (players selected are removed from the lists).
         """
-        # 1. Roll the Gamemode
-        gamemode = Roll.roll_gamemode(self.type)
-
-        # Reroll if the gamemode's size is higher than any of the reamining team's length
-        cont = 0
-        while gamemode.size > len(team_1) or gamemode.size > len(team_2):
-
-            # Fallback just in case...
-            if cont >= 50:
-                print(f'The gamemode has been rerolled {cont} times without finding the desire properties. Most likely there is some mistake here...')
-                print(f'type: {self.type.name}')
-                print(f'team_1 len: {len(team_1)}')
-                print(f'team_2 len: {len(team_2)}')
-                print(f'Last mode rolled before fallback:\n{gamemode.display_all_details()}')
-
-                gamemode = Roll.roll_gamemode(enums.Roll_Gamemode.ONLY_1V1)
-                break
-            
-            gamemode = Roll.roll_gamemode(self.type)
-            cont += 1
+        # 1. Roll the Gamemode (only among the ones whose size fits in both remaining teams)
+        max_size = min(len(team_1), len(team_2))
+        if Main_Controller().get_rollable_gamemodes(self.type, max_size):
+            gamemode = Roll.roll_gamemode(self.type, max_size, self.rng)
+        else:
+            # None of the gamemodes of `self.type` fits the remaining players (e.g. ONLY_4V4 with 3 players left): fallback to a 1v1
+            gamemode = Roll.roll_gamemode(enums.Roll_Gamemode.ONLY_1V1, rng=self.rng)
 
         # 2. Roll the Players from both teams
         selected_team_1, selected_team_2 = [[] for _ in range(2)]
         for _ in range(gamemode.size):
             
             # Team 1
-            player_team_1 = random.choice(team_1)
+            player_team_1 = self.rng.choice(team_1)
             selected_team_1.append(player_team_1)
             team_1.remove(player_team_1)            # Remove the player from the list to prevent them from being rolled again
 
             # Team 2
-            player_team_2 = random.choice(team_2)
+            player_team_2 = self.rng.choice(team_2)
             selected_team_2.append(player_team_2)
             team_2.remove(player_team_2)            # Remove the player from the list to prevent them from being rolled again
 
         # 3. Create the match
-        new_match = Match(gamemode, selected_team_1, selected_team_2)
+        new_match = Match(gamemode, selected_team_1, selected_team_2, self.rng)
 
         # 4. Additional roll if a special gamemode was rolled
         additional_roll = new_match.special_gamemode_additional_roll()
@@ -92,11 +81,15 @@ class Blind_Crews:
     
     def get_round_information(self) -> str:
         """Given the stored set of matches, return a string with the public information about the round rolled."""
-        content = ''
+        return ''.join(self.get_matches_information())
+
+    def get_matches_information(self) -> list[str]:
+        """Given the stored set of matches, return a list with the public information about each match rolled."""
+        matches_information = []
 
         for match in self.matches:
             # 1. Add the gamemode
-            content += f'**Gamemode selected:** {match.gamemode.name}\n'
+            content = f'**Gamemode selected:** {match.gamemode.name}\n'
             
             # 2. Get the rolled distribution (automatically rolled in Match constructor)
             distribution = match.distribution
@@ -112,8 +105,9 @@ class Blind_Crews:
             team_2_names = [player.amq_name for player in match.team_2]
             team_2_names = ' '.join(team_2_names)
             content += f'**Team 2:** {team_2_names}\n\n'
+            matches_information.append(content)
 
-        return content
+        return matches_information
     
 
     def get_results_template(self, duels: bool) -> str:
@@ -151,4 +145,43 @@ class Blind_Crews:
             content += '\n'
 
         content = f'```{content}```'
-        return content
\ No newline at end of file
+        return content
+
+
+def round_robin_pairings(num_teams: int) -> list[list[tuple[int, int]]]:
+    """
+    Return the rounds in which `num_teams` teams face each other once (round robin, circle method).\n
+    Each round is a list of pairings (indexes of the teams) where every team plays once at most: if `num_teams` is odd, one team rests each round.
+    """
+    teams = list(range(num_teams)) + ([None] if num_teams % 2 else [])
+    rounds = []
+    for _ in range(len(teams) - 1):
+        pairings = [(teams[i], teams[-1-i]) for i in range(len(teams) // 2)]
+        rounds.append([(team_1, team_2) for team_1, team_2 in pairings if team_1 is not None and team_2 is not None])
+        # Rotate every team but the first one
+        teams = [teams[0], teams[-1]] + teams[1:-1]
+    return rounds
+
+
+class Blind_Crews_Round_Robin:
+    """Class that contains the methods to roll a blind crews round for every pair of teams, scheduled as a round robin."""
+    def __init__(self, type: enums.Roll_Gamemode, teams: list[list[Player]], rng: random.Random = random) -> None:
+        """Class constructor. All the rolls are made with `rng` (the `random` module by default, a `Roll_Session`'s one to make them reproducible)."""
+        self.type = type
+        self.teams = teams
+        self.rng = rng
+
+        self.rounds: list[list[tuple[int, int, Blind_Crews]]] = []     # Pairings (team indexes and their blind crews) of each round
+
+
+    def roll_blind_crews(self) -> None:
+        """Roll a blind crews round for every pairing of the round robin schedule between `self.teams`."""
+        self.rounds.clear()
+
+        for pairings in round_robin_pairings(len(self.teams)):
+            rolled_pairings = []
+            for team_1, team_2 in pairings:
+                blind_crews = Blind_Crews(self.type, self.teams[team_1], self.teams[team_2], self.rng)
+                blind_crews.roll_blind_crews()
+                rolled_pairings.append((team_1, team_2, blind_crews))
+            self.rounds.append(rolled_pairings)
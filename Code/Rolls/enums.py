@@ -140,4 +140,6 @@ class Roll_Teams(Enum):
     FULL_RANDOM = 0
     BALANCED_SNAKE = 1
     BALANCED_GREEDY = 2
-    GROUPED_BY_STRENGTH = 3
\ No newline at end of file
+    GROUPED_BY_STRENGTH = 3
+    OPTIMAL = 4
+    BALANCED_LOCAL_SEARCH = 5
\ No newline at end of file
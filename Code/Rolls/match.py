@@ -1,18 +1,16 @@
-from Code.Rolls.basic_rolls import Roll
-from Code.Rolls.enums import Rolls_Enum, Rolls_Spotlight
+import random
+
 from Code.Players.player import Player
 from Code.Gamemodes.Gamemodes.gamemode import Gamemode
-from Code.Gamemodes.Artists.cq_artist import CQ_Artist
-from Code.Gamemodes.SpecialLists.cq_specialList import CQ_SpecialList
-from Code.Gamemodes.GlobalPlayers.global_players import GlobalPlayer
 
 class Match:
     """Class to represent a match. Formed by a gamemode and 2 list of players (team 1, team 2)."""
-    def __init__(self, gamemode: Gamemode, team_1: list[Player], team_2: list[Player]) -> None:
-        """Class constructor."""
+    def __init__(self, gamemode: Gamemode, team_1: list[Player], team_2: list[Player], rng: random.Random = random) -> None:
+        """Class constructor. All the match's rolls (distribution and special rolls) are made with `rng`."""
         self.gamemode = gamemode
         self.team_1 = team_1
         self.team_2 = team_2
+        self.rng = rng
         self.distribution = self._roll_distribution()
         self.special_roll = None
 
@@ -24,7 +22,7 @@ class Match:
         """
         if not self.gamemode.watched_song_selection:
             return None
-        return self.gamemode.roll_distribution() 
+        return self.gamemode.roll_distribution(self.rng)
 
 
     def special_gamemode_additional_roll(self) -> str | None:
@@ -32,6 +30,11 @@ class Match:
         For those special gamemodes that requires an additional roll (Artistmania, random tag, etc.), apply that roll.\n
         Return a string representation of the additional roll, or `None` if no additional roll is required for the gamemode.
         """
+        # NOTE the rule is resolved from the gamemode's name only once and cached in the gamemode (see `Code/Rolls/special_rolls.py`)
+        rule = self.gamemode.special_roll_rule
+        if rule is None:
+            return None
+
         team_1_playes = ', '.join([player.amq_name for player in self.team_1])
         team_2_players = ', '.join([player.amq_name for player in self.team_2])
 
@@ -39,147 +42,5 @@ class Match:
         content += f'**Team 1:** {team_1_playes}\n'
         content += f'**Team 2:** {team_2_players}\n\n'
 
-        # NOTE obtaining which gamemodes are the special ones by their names
-        # Not using their ids for flexibility (for instance, a new Artistmania mode is added or a database with different gamemodes ids is used)
-        #
-        # NOTE hardcoding the mode names, might be interesing to create an enum class instead.
-
-        # Artistmania
-        if 'artistmania' in self.gamemode.name.lower():
-            artist: CQ_Artist = Roll.roll(Rolls_Enum.ARTIST_CQ)
-            self.special_roll = f'Artist: {artist.artist_name} (quiz ID: {artist.community_quiz_id})'
-            return content + repr(artist)
-        
-        # Special List
-        elif 'special list' in self.gamemode.name.lower():
-            special_list: CQ_SpecialList = Roll.roll(Rolls_Enum.SPECIAL_LIST_CQ)
-            self.special_roll = f'Special list: {special_list.special_list_name} (quiz ID: {special_list.community_quiz_id})'
-            return content + repr(special_list)
-        
-        # Global Player
-        elif 'global player' in self.gamemode.name.lower() and not 'picked' in self.gamemode.name.lower():
-            global_player: GlobalPlayer = Roll.roll(Rolls_Enum.ACTIVE_GLOBAL_PLAYER) if 'active' in self.gamemode.name.lower() else Roll.roll(Rolls_Enum.ALL_GLOBAL_PLAYER)
-            self.special_roll = f'Player: {global_player.player_name} (list: {global_player.list_name} ({global_player.list_from}))'
-
-            # We roll Type 7 as well for Active Global Players List 1v1 and 2v2
-            if self.gamemode.name.lower() in ['active global players list 1v1', 'active global players list 2v2']:
-                type_7: str = Roll.roll(Rolls_Enum.TYPE_7)
-                self.special_roll += f'\n\nType 7: {type_7}'
-                return content + repr(global_player) + f'\n**Type 7 rolled:** {type_7}'
-
-            return content + repr(global_player)
-
-        # Random Genre
-        elif 'genre' in self.gamemode.name.lower() and not 'picked' in self.gamemode.name.lower():
-            genre: str = Roll.roll(Rolls_Enum.GENRE)
-            self.special_roll = f'Genre: {genre}'
-            return content + f'**Genre rolled:** {genre}'
-
-        # Random Tag
-        elif 'tag' in self.gamemode.name.lower() and not 'picked' in self.gamemode.name.lower():
-            tag: str = Roll.roll(Rolls_Enum.TAG)
-            self.special_roll = f'Tag: {tag}'
-            return content + f'**Tag rolled:** {tag}'
-        
-        # Mastery Modes
-        # NOTE we do not add roll for watched mastery modes
-        elif 'mastery' in self.gamemode.name.lower() and not 'watched' in self.gamemode.name.lower():
-            mastery_mode: str = Roll.roll(Rolls_Enum.MASTERY_MODE)
-            self.special_roll = f'Mastery mode: {mastery_mode}'
-            return content + f'**Mastery mode rolled:** {mastery_mode}'
-        
-        # Type 5 (OP/ED/IN/OPED/OPEDIN)
-        elif 'countdown' in self.gamemode.name.lower() or 'ftf' in self.gamemode.name.lower():
-            type_5: str = Roll.roll(Rolls_Enum.TYPE_5)
-            self.special_roll = f'Type 5: {type_5}'
-            return content + f'**Type 5 rolled:** {type_5}'
-        
-        # Unwatched (1v1, 2v2 or 3v3 exclusively)
-        elif 'unwatched 1v1' in self.gamemode.name.lower() or 'unwatched 2v2' in self.gamemode.name.lower() or 'unwatched 3v3' in self.gamemode.name.lower():
-            type_7: str = Roll.roll(Rolls_Enum.TYPE_7)
-            self.special_roll = f'Type 7: {type_7}'
-            return content + f'**Type 7 rolled:** {type_7}'
-        
-        # Random/Watched Year
-        elif 'year' in self.gamemode.name.lower() and not 'picked' in self.gamemode.name.lower():
-            year: int = Roll.roll(Rolls_Enum.YEAR)
-            self.special_roll = f'Year: {year}'
-            return content + f'**Year rolled:** {year}'
-        
-        # One Life Challenge
-        elif 'one life challenge' in self.gamemode.name.lower():
-            one_life_challenge: str = Roll.roll(Rolls_Enum.ONE_LIFE_CHALLENGE)
-            self.special_roll = f'One Life Challenge: {one_life_challenge}'
-            return content + f'**One Life Challenge mode rolled:** {one_life_challenge}'
-        
-        # Uma musume
-        elif 'uma musume' in self.gamemode.name.lower():
-            uma_musume_distance: str = Roll.roll(Rolls_Enum.UMA_MUSUME_DISTANCES)
-            uma_musume_track: str = Roll.roll(Rolls_Enum.UMA_MUSUME_TRACKS)
-            self.special_roll = f'Uma Musume distance: {uma_musume_distance}\nUma Musume track: {uma_musume_track}'
-            return content + f'**Uma Musume distance rolled:** {uma_musume_distance}\n**Uma Musume track rolled:** {uma_musume_track}'
-
-        # Random Metronome
-        # NOTE not adding self.special_roll for metronomes on purpose
-        # self.special_roll is basically extra info for the host that is particularly useful in crews_duel. For these cases, knowing the metronome beforehand makes no sense
-        elif 'metronome' in self.gamemode.name.lower():
-            # Rolling 1 different metronome per player
-            metronomes = ''
-            # Team 1
-            for player in self.team_1:
-                metronomes += f'**Metronome for {player.amq_name} ->** {Roll.roll(Rolls_Enum.METRONOME, as_str=False)}\n'
-            # Team 2
-            for player in self.team_2:
-                metronomes += f'**Metronome for {player.amq_name} ->** {Roll.roll(Rolls_Enum.METRONOME, as_str=False)}\n'
-            return content + metronomes
-
-        # Spotlight
-        elif 'spotlight' in self.gamemode.name.lower():
-            # NOTE Check female before male as "female" word is included in "male" word, so checking "male" first will include male and female 
-            if 'female artist' in self.gamemode.name.lower():
-                spotlight_roll = Roll.roll_spotlight(Rolls_Spotlight.FEMALE_ARTIST)
-                self.special_roll = f'Spotlight - Female Artist: {spotlight_roll.artist_name} (quiz ID: {spotlight_roll.community_quiz_id})'
-                return content + repr(spotlight_roll)
-            
-            if 'female va' in self.gamemode.name.lower():
-                spotlight_roll = Roll.roll_spotlight(Rolls_Spotlight.FEMALE_VA)
-                self.special_roll = f'Spotlight - Female VA: {spotlight_roll.artist_name} (quiz ID: {spotlight_roll.community_quiz_id})'
-                return content + repr(spotlight_roll)
-            
-            if 'male artist' in self.gamemode.name.lower():
-                spotlight_roll = Roll.roll_spotlight(Rolls_Spotlight.MALE_ARTIST)
-                self.special_roll = f'Spotlight - Male Artist: {spotlight_roll.artist_name} (quiz ID: {spotlight_roll.community_quiz_id})'
-                return content + repr(spotlight_roll)
-            
-            if 'male va' in self.gamemode.name.lower():
-                spotlight_roll = Roll.roll_spotlight(Rolls_Spotlight.MALE_VA)
-                self.special_roll = f'Spotlight - Male VA: {spotlight_roll.artist_name} (quiz ID: {spotlight_roll.community_quiz_id})'
-                return content + repr(spotlight_roll)
-            
-            if 'group' in self.gamemode.name.lower():
-                spotlight_roll = Roll.roll_spotlight(Rolls_Spotlight.GROUP)
-                self.special_roll = f'Spotlight - Group: {spotlight_roll.group_name} (quiz ID: {spotlight_roll.community_quiz_id})'
-                return content + repr(spotlight_roll)
-            
-            if 'composer' in self.gamemode.name.lower():
-                spotlight_roll = Roll.roll_spotlight(Rolls_Spotlight.COMPOSER)
-                self.special_roll = f'Spotlight - Composer: {spotlight_roll.composer_name} (quiz ID: {spotlight_roll.community_quiz_id})'
-                return content + repr(spotlight_roll)
-            
-            if 'franchise' in self.gamemode.name.lower():
-                spotlight_roll = Roll.roll_spotlight(Rolls_Spotlight.FRANCHISE)
-                self.special_roll = f'Spotlight - Franchise: {spotlight_roll.franchise_name} (quiz ID: {spotlight_roll.community_quiz_id})'
-                return content + repr(spotlight_roll)
-            
-            if 'studio' in self.gamemode.name.lower():
-                spotlight_roll = Roll.roll_spotlight(Rolls_Spotlight.STUDIO)
-                self.special_roll = f'Spotlight - Studio: {spotlight_roll.studio_name} (quiz ID: {spotlight_roll.community_quiz_id})'
-                return content + repr(spotlight_roll)
-            
-            if 'community' in self.gamemode.name.lower():
-                spotlight_roll = Roll.roll_spotlight(Rolls_Spotlight.COMMUNITY)
-                self.special_roll = f'Spotlight - Community: {spotlight_roll.community_name} (quiz ID: {spotlight_roll.community_quiz_id})'
-                return content + repr(spotlight_roll)
-
-        # If the gamemode isn't special, we return None
-        return None
\ No newline at end of file
+        self.special_roll, roll_content = rule.roll(self.gamemode.name.lower(), self.team_1 + self.team_2, self.rng)
+        return content + roll_content
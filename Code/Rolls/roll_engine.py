@@ -0,0 +1,124 @@
+import os
+import random
+from collections import deque
+
+NO_REPEAT_WINDOW = 0        # Last rolls (per guild and catalog) that can't be rolled again (overridden by the `ROLLS_NO_REPEAT_WINDOW` environment variable, 0 disables it)
+MAX_REROLLS = 32            # Max draws to find a roll out of the no-repeat window before accepting a repeated one
+
+
+class Alias_Table:
+    """
+    Table to roll an entry of a catalog in O(1), no matter how many entries the catalog has or how they are weighted (Vose's alias method).\n
+    The table is built once (O(n)) from the `entries` and their `weights` (relative, they don't need to add up to 1).
+    If no `weights` are provided (or all of them are the same), every entry has the same probability of being rolled.
+
+    Raise:
+    ------
+    - `ValueError`: If any weight is negative or all of them are 0.
+    """
+
+    def __init__(self, entries: list, weights: list[float] | None = None) -> None:
+        self.entries = tuple(entries)
+        self._probabilities: list[float] | None = None
+        self._aliases: list[int] | None = None
+
+        if weights is None or len(set(weights)) <= 1:
+            return
+        if min(weights) < 0 or sum(weights) <= 0:
+            raise ValueError('Invalid weights')
+
+        n = len(self.entries)
+        total = sum(weights)
+        scaled = [weight * n / total for weight in weights]
+        self._probabilities = [1.0] * n
+        self._aliases = list(range(n))
+
+        small = [i for i, probability in enumerate(scaled) if probability < 1.0]
+        large = [i for i, probability in enumerate(scaled) if probability >= 1.0]
+        while small and large:
+            i, j = small.pop(), large.pop()
+            self._probabilities[i] = scaled[i]
+            self._aliases[i] = j
+            scaled[j] += scaled[i] - 1.0
+            (small if scaled[j] < 1.0 else large).append(j)
+        # NOTE the entries left in any of the lists have a probability of (almost, due to rounding errors) 1.0, which is already set
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def sample(self, rng: random.Random = random) -> object:
+        """
+        Return a random entry of the table.
+
+        Raise:
+        ------
+        - `IndexError`: If the table has no entries.
+        """
+        i = int(rng.random() * len(self.entries))
+        if self._probabilities is not None and rng.random() >= self._probabilities[i]:
+            i = self._aliases[i]
+        return self.entries[i]
+
+
+class Roll_Engine:
+    """
+    Singleton class that rolls the entries of the catalogs (artists, tags, metronomes, spotlights, etc.) through `Alias_Table`s.\n
+    The table of each catalog is built the first time it is rolled after the catalogs changed (this is, once per catalogs's `version`),
+    so rolling never copies the catalog again.\n
+    The entries are weighted by their `weight` attribute (entries without it, like the plain strings, weight 1).\n
+    If `no_repeat_window` is greater than 0, a roll made for a guild can't repeat any of the last `no_repeat_window` rolls of the same
+    catalog in that guild (the window is reduced for small catalogs, so at least half of the entries can always be rolled).
+    """
+    _instance = None
+    def __new__(cls) -> 'Roll_Engine':
+        """Override the __new__ method to return the existing instance of the class if it exists or create a new instance if it doesn't exist yet.\n"""
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+            cls._instance._set_data()
+        return cls._instance
+
+    def _set_data(self) -> None:
+        """Load the engine's configuration and initialize its (empty) tables."""
+        self.no_repeat_window = int(os.getenv('ROLLS_NO_REPEAT_WINDOW', NO_REPEAT_WINDOW))
+        self._tables: dict[object, tuple[int, Alias_Table]] = {}
+        self._recent_rolls: dict[tuple[int, object], deque] = {}
+
+
+    def _get_table(self, catalog: object, version: int, get_entries: callable) -> Alias_Table:
+        """Return the table of the `catalog` for its `version`, building it from `get_entries()` if it wasn't built yet."""
+        cached = self._tables.get(catalog)
+        if cached is not None and cached[0] == version:
+            return cached[1]
+
+        entries = get_entries()
+        weights = [getattr(entry, 'weight', 1.0) for entry in entries]
+        table = Alias_Table(entries, weights)
+        self._tables[catalog] = (version, table)
+        return table
+
+    def roll(self, catalog: object, version: int, get_entries: callable, guild_id: int | None = None, rng: random.Random = random) -> object:
+        """
+        Roll an entry of the `catalog` (any hashable key identifying it, e.g. its `Rolls_Enum` value).\n
+        `get_entries` is only called when the catalog's table has to be (re)built, this is, when `version` differs from the one of the table.\n
+        The no-repeat window is only applied if the `guild_id` the roll is made for is provided.
+
+        Raise:
+        ------
+        - `IndexError`: If the catalog has no entries.
+        """
+        table = self._get_table(catalog, version, get_entries)
+        window = min(self.no_repeat_window, len(table) // 2)
+        if guild_id is None or window <= 0:
+            return table.sample(rng)
+
+        key = (guild_id, catalog)
+        recent_rolls = self._recent_rolls.get(key)
+        if recent_rolls is None or recent_rolls.maxlen != window:
+            recent_rolls = self._recent_rolls[key] = deque(recent_rolls or (), maxlen=window)
+
+        for _ in range(MAX_REROLLS):
+            roll = table.sample(rng)
+            if roll not in recent_rolls:
+                break
+        recent_rolls.append(roll)
+        return roll
@@ -0,0 +1,44 @@
+import random
+
+from Code.Rolls import enums
+from Code.Rolls.blind_crews import Blind_Crews, Blind_Crews_Round_Robin
+from Code.Rolls.teams import Teams_Roll
+from Code.Players.player import Player
+
+MAX_SEED = 2**32
+
+
+class Roll_Session:
+    """
+    Set of rolls made from an explicit `seed`, so they can be replayed exactly (e.g. when a host disputes a roll) by creating a
+    session with the same seed and rolling the same things, in the same order, over the same players and catalogs.\n
+    If no `seed` is provided, a random one is generated (and can be read from `seed`).\n
+    `rng` is the `random.Random` to pass to any roll made through `Roll`, `Match`, `Blind_Crews` or `Teams_Roll` to make it part of the session.
+    """
+
+    def __init__(self, seed: int | None = None) -> None:
+        self.seed = seed if seed is not None else random.randrange(MAX_SEED)
+        self.rng = random.Random(self.seed)
+
+
+    def roll_blind_crews(self, type: enums.Roll_Gamemode, team_1: list[Player], team_2: list[Player], rounds: int = 1) -> list[Blind_Crews]:
+        """Roll `rounds` blind crews rounds between `team_1` and `team_2` with the gamemodes of `type`. Return the rounds in the order they were rolled."""
+        blind_crews_rounds = []
+        for _ in range(rounds):
+            blind_crews = Blind_Crews(type=type, team_1=team_1, team_2=team_2, rng=self.rng)
+            blind_crews.roll_blind_crews()
+            blind_crews_rounds.append(blind_crews)
+        return blind_crews_rounds
+
+    def roll_blind_crews_round_robin(self, type: enums.Roll_Gamemode, teams: list[list[Player]]) -> Blind_Crews_Round_Robin:
+        """Roll a blind crews round for every pairing of a round robin between `teams` with the gamemodes of `type`."""
+        round_robin = Blind_Crews_Round_Robin(type=type, teams=teams, rng=self.rng)
+        round_robin.roll_blind_crews()
+        return round_robin
+
+    def roll_teams(self, type: enums.Roll_Teams, player_list: list[Player], num_teams: int = 2, splits: int = 1) -> list[tuple[list[list[Player]], str]]:
+        """
+        Split the `player_list` into `num_teams` teams `splits` times, following the criteria of `type`.\n
+        Return the result of each split (see `Teams_Roll.roll_teams`) in the order they were rolled.
+        """
+        return [Teams_Roll.roll_teams(type, player_list, num_teams, self.rng) for _ in range(splits)]
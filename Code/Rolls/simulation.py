@@ -0,0 +1,142 @@
+"""
+This is the functionality required for measuring how fair the teams criteria (`Teams_Roll`) are for a given rank distribution, by
+simulating a large number of team splits (Monte Carlo) in vectorized batches.\n
+Each simulated split samples `num_players` rank values from the distribution provided and computes the total rank of every team the same
+way the criteria do, so only the rank values are simulated (no `Player` objects are involved). The criteria that depend on a search
+(`OPTIMAL`, `BALANCED_LOCAL_SEARCH`) or that don't try to balance the teams (`GROUPED_BY_STRENGTH`) are not simulated.
+"""
+import time
+
+import numpy as np
+
+from Code.Rolls.enums import Roll_Teams
+from Code.Players.main_ranking import Ranking
+
+SIMULATED_CRITERIA = (Roll_Teams.FULL_RANDOM, Roll_Teams.BALANCED_SNAKE, Roll_Teams.BALANCED_GREEDY)
+BATCH_SIZE = 10_000         # Splits simulated at once (bounds the memory used by the simulation)
+PERCENTILES = (50, 90, 99)
+SYNTHETIC_POPULATION = 1000 # Players of the synthetic rank distribution
+
+
+class Simulation_Result:
+    """Result of simulating a teams criteria: the strength gap (strongest team total - weakest team total) of each split and the time spent."""
+
+    def __init__(self, criteria: Roll_Teams, gaps: np.ndarray, elapsed: float) -> None:
+        self.criteria = criteria
+        self.gaps = gaps
+        self.elapsed = elapsed
+
+    @property
+    def time_per_split(self) -> float:
+        """Return the average time (in seconds) spent computing each split."""
+        return self.elapsed / len(self.gaps)
+
+    def __str__(self) -> str:
+        """Return a one line summary of the gaps distribution and the time per split."""
+        percentiles = np.percentile(self.gaps, PERCENTILES)
+        percentiles = ', '.join(f'p{p} {value:.0f}' for p, value in zip(PERCENTILES, percentiles))
+        return (
+            f'{self.criteria.name.replace("_", " ").capitalize()}: mean gap {self.gaps.mean():.2f} ({percentiles}, max {self.gaps.max():.0f}), '
+            f'{self.time_per_split * 1e6:.2f} µs/split'
+        )
+
+
+def synthetic_rank_values(num_values: int = SYNTHETIC_POPULATION, rng: np.random.Generator | None = None) -> np.ndarray:
+    """Return `num_values` rank values following a synthetic distribution (most players in the middle ranks, few in the extremes)."""
+    rng = rng if rng is not None else np.random.default_rng()
+    ranks_values = np.array([Ranking().get_rank(rank_name).value for rank_name in Ranking().rank_names], dtype=np.int64)
+    positions = np.rint(rng.normal((len(ranks_values) - 1) / 2, len(ranks_values) / 5, num_values))
+    return ranks_values[np.clip(positions, 0, len(ranks_values) - 1).astype(np.int64)]
+
+
+def _team_indexes_as_matrix(team_indexes: np.ndarray, num_teams: int) -> np.ndarray:
+    """Return the (`num_players`, `num_teams`) matrix that sums the values of each position into the team it is assigned to."""
+    matrix = np.zeros((len(team_indexes), num_teams), dtype=np.int64)
+    matrix[np.arange(len(team_indexes)), team_indexes] = 1
+    return matrix
+
+
+def _team_totals_random(values: np.ndarray, num_teams: int, rng: np.random.Generator) -> np.ndarray:
+    """Return the team totals of each split (row of `values`) following the `FULL_RANDOM` criteria (see `Teams_Roll._roll_teams_random`)."""
+    shuffled_values = rng.permuted(values, axis=1)
+    team_indexes = np.arange(values.shape[1]) % num_teams
+    return shuffled_values @ _team_indexes_as_matrix(team_indexes, num_teams)
+
+
+def _team_totals_snake(values: np.ndarray, num_teams: int, rng: np.random.Generator) -> np.ndarray:
+    """Return the team totals of each split (row of `values`) following the `BALANCED_SNAKE` criteria (see `Teams_Roll._roll_teams_balanced_snake`)."""
+    # NOTE the order of the players with the same rank doesn't change the totals, so no shuffle is needed before sorting
+    sorted_values = -np.sort(-values, axis=1)
+    positions = np.arange(values.shape[1]) % (2 * num_teams)
+    team_indexes = np.where(positions < num_teams, positions, 2 * num_teams - 1 - positions)
+    return sorted_values @ _team_indexes_as_matrix(team_indexes, num_teams)
+
+
+def _team_totals_greedy(values: np.ndarray, num_teams: int, rng: np.random.Generator) -> np.ndarray:
+    """Return the team totals of each split (row of `values`) following the `BALANCED_GREEDY` criteria (see `Teams_Roll._roll_teams_balanced_greedy`)."""
+    sorted_values = -np.sort(-values, axis=1)
+    num_splits, num_players = values.shape
+    max_players_per_team = num_players // num_teams
+    splits = np.arange(num_splits)
+
+    totals = np.zeros((num_splits, num_teams), dtype=np.int64)
+    sizes = np.zeros((num_splits, num_teams), dtype=np.int64)
+    # Players are assigned one by one (in all the splits at once) to the weakest team that isn't full yet
+    for i in range(num_players):
+        available_totals = np.where(sizes < max_players_per_team, totals, np.iinfo(np.int64).max)
+        team_indexes = available_totals.argmin(axis=1)
+        totals[splits, team_indexes] += sorted_values[:, i]
+        sizes[splits, team_indexes] += 1
+    return totals
+
+
+_TEAM_TOTALS: dict[Roll_Teams, callable] = {
+    Roll_Teams.FULL_RANDOM: _team_totals_random,
+    Roll_Teams.BALANCED_SNAKE: _team_totals_snake,
+    Roll_Teams.BALANCED_GREEDY: _team_totals_greedy
+}
+
+
+def simulate_teams(
+    rank_values: list[int],
+    num_players: int,
+    num_teams: int,
+    splits: int = 100_000,
+    criteria: tuple[Roll_Teams, ...] = SIMULATED_CRITERIA,
+    seed: int | None = None
+) -> list[Simulation_Result]:
+    """
+    Simulate `splits` splits of `num_players` players (sampled with replacement from `rank_values`) into `num_teams` teams for each of the
+    `criteria` provided. All the criteria are simulated over the same sampled players.\n
+    Return the result of each criteria.
+
+    Raise:
+    ------
+    - `ValueError`: If `rank_values` is empty, there are no `splits` to simulate, the players can't be split evenly into the teams or a
+    criteria can't be simulated.
+    """
+    if len(rank_values) == 0:
+        raise ValueError('There are no rank values to sample the players from!')
+    if splits < 1:
+        raise ValueError('At least 1 split must be simulated!')
+    if num_teams < 2 or num_players % num_teams != 0:
+        raise ValueError('The players must be split evenly into 2 teams or more!')
+    if any(type not in _TEAM_TOTALS for type in criteria):
+        raise ValueError(f'Only the {", ".join(type.name for type in _TEAM_TOTALS)} criteria can be simulated!')
+
+    rng = np.random.default_rng(seed)
+    population = np.asarray(rank_values, dtype=np.int64)
+    gaps = {type: np.empty(splits, dtype=np.int64) for type in criteria}
+    elapsed = {type: 0.0 for type in criteria}
+
+    for start in range(0, splits, BATCH_SIZE):
+        batch_size = min(BATCH_SIZE, splits - start)
+        values = rng.choice(population, size=(batch_size, num_players))
+
+        for type in criteria:
+            batch_start = time.perf_counter()
+            totals = _TEAM_TOTALS[type](values, num_teams, rng)
+            gaps[type][start:start+batch_size] = totals.max(axis=1) - totals.min(axis=1)
+            elapsed[type] += time.perf_counter() - batch_start
+
+    return [Simulation_Result(type, gaps[type], elapsed[type]) for type in criteria]
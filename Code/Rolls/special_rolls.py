@@ -0,0 +1,137 @@
+import random
+
+from Code.Rolls.basic_rolls import Roll
+from Code.Rolls.enums import Rolls_Enum, Rolls_Spotlight
+from Code.Players.player import Player
+from Code.Gamemodes.Artists.cq_artist import CQ_Artist
+from Code.Gamemodes.SpecialLists.cq_specialList import CQ_SpecialList
+from Code.Gamemodes.GlobalPlayers.global_players import GlobalPlayer
+
+
+class Special_Roll_Rule:
+    """
+    Rule that tells which gamemodes require an additional roll (Artistmania, random tag, etc.) and how to roll it.\n
+    A gamemode matches the rule if its name (lower case) contains all the `contains` patterns, at least one of the `any_of` ones (if any)
+    and none of the `excludes` ones.\n
+    The `handler` receives the gamemode's name (lower case), the players of the match (team 1 first) and the `random.Random` to roll with, and
+    returns a tuple with the special roll to store in the match (extra info for the host, `None` if there isn't) and the roll's content to display.
+    """
+
+    def __init__(
+        self,
+        handler: callable,
+        contains: tuple[str, ...] = (),
+        any_of: tuple[str, ...] = (),
+        excludes: tuple[str, ...] = ()
+    ) -> None:
+        self.handler = handler
+        self.contains = contains
+        self.any_of = any_of
+        self.excludes = excludes
+
+    def matches(self, gamemode_name: str) -> bool:
+        """Return whether the gamemode with name `gamemode_name` (lower case) requires this rule's additional roll."""
+        return all(pattern in gamemode_name for pattern in self.contains) \
+            and (not self.any_of or any(pattern in gamemode_name for pattern in self.any_of)) \
+            and not any(pattern in gamemode_name for pattern in self.excludes)
+
+    def roll(self, gamemode_name: str, players: list[Player], rng: random.Random = random) -> tuple[str | None, str]:
+        """Apply the additional roll. Return the special roll to store in the match (or `None`) and the roll's content to display."""
+        return self.handler(gamemode_name, players, rng)
+
+
+def _roll_artistmania(gamemode_name: str, players: list[Player], rng: random.Random) -> tuple[str | None, str]:
+    artist: CQ_Artist = Roll.roll(Rolls_Enum.ARTIST_CQ, rng=rng)
+    return f'Artist: {artist.artist_name} (quiz ID: {artist.community_quiz_id})', repr(artist)
+
+def _roll_special_list(gamemode_name: str, players: list[Player], rng: random.Random) -> tuple[str | None, str]:
+    special_list: CQ_SpecialList = Roll.roll(Rolls_Enum.SPECIAL_LIST_CQ, rng=rng)
+    return f'Special list: {special_list.special_list_name} (quiz ID: {special_list.community_quiz_id})', repr(special_list)
+
+def _roll_global_player(gamemode_name: str, players: list[Player], rng: random.Random) -> tuple[str | None, str]:
+    global_player: GlobalPlayer = Roll.roll(Rolls_Enum.ACTIVE_GLOBAL_PLAYER if 'active' in gamemode_name else Rolls_Enum.ALL_GLOBAL_PLAYER, rng=rng)
+    special_roll = f'Player: {global_player.player_name} (list: {global_player.list_name} ({global_player.list_from}))'
+
+    # We roll Type 7 as well for Active Global Players List 1v1 and 2v2
+    if gamemode_name in ['active global players list 1v1', 'active global players list 2v2']:
+        type_7: str = Roll.roll(Rolls_Enum.TYPE_7, rng=rng)
+        return special_roll + f'\n\nType 7: {type_7}', repr(global_player) + f'\n**Type 7 rolled:** {type_7}'
+
+    return special_roll, repr(global_player)
+
+def _roll_uma_musume(gamemode_name: str, players: list[Player], rng: random.Random) -> tuple[str | None, str]:
+    uma_musume_distance: str = Roll.roll(Rolls_Enum.UMA_MUSUME_DISTANCES, rng=rng)
+    uma_musume_track: str = Roll.roll(Rolls_Enum.UMA_MUSUME_TRACKS, rng=rng)
+    special_roll = f'Uma Musume distance: {uma_musume_distance}\nUma Musume track: {uma_musume_track}'
+    return special_roll, f'**Uma Musume distance rolled:** {uma_musume_distance}\n**Uma Musume track rolled:** {uma_musume_track}'
+
+def _roll_metronomes(gamemode_name: str, players: list[Player], rng: random.Random) -> tuple[str | None, str]:
+    # NOTE not returning a special roll for metronomes on purpose
+    # The special roll is basically extra info for the host that is particularly useful in crews_duel. For these cases, knowing the metronome beforehand makes no sense
+    # Rolling 1 different metronome per player
+    metronomes = ''
+    for player in players:
+        metronomes += f'**Metronome for {player.amq_name} ->** {Roll.roll(Rolls_Enum.METRONOME, as_str=False, rng=rng)}\n'
+    return None, metronomes
+
+
+def _simple_roll(type: Rolls_Enum, label: str, content_label: str | None = None) -> callable:
+    """Return a handler that rolls `type` and displays it as "`label`: roll" (special roll) and "**`content_label` rolled:** roll" (content)."""
+    content_label = content_label if content_label is not None else label
+
+    def handler(gamemode_name: str, players: list[Player], rng: random.Random) -> tuple[str | None, str]:
+        roll = Roll.roll(type, rng=rng)
+        return f'{label}: {roll}', f'**{content_label} rolled:** {roll}'
+
+    return handler
+
+def _spotlight_roll(type: Rolls_Spotlight, label: str, name_attribute: str) -> callable:
+    """Return a handler that rolls the spotlight `type` and displays the value of its `name_attribute` in the special roll."""
+
+    def handler(gamemode_name: str, players: list[Player], rng: random.Random) -> tuple[str | None, str]:
+        spotlight_roll = Roll.roll_spotlight(type, rng=rng)
+        return f'Spotlight - {label}: {getattr(spotlight_roll, name_attribute)} (quiz ID: {spotlight_roll.community_quiz_id})', repr(spotlight_roll)
+
+    return handler
+
+
+# NOTE obtaining which gamemodes are the special ones by their names
+# Not using their ids for flexibility (for instance, a new Artistmania mode is added or a database with different gamemodes ids is used)
+#
+# NOTE the rules are checked in order and the first one matching the gamemode's name is applied
+SPECIAL_ROLL_RULES: list[Special_Roll_Rule] = [
+    Special_Roll_Rule(_roll_artistmania, contains=('artistmania',)),
+    Special_Roll_Rule(_roll_special_list, contains=('special list',)),
+    Special_Roll_Rule(_roll_global_player, contains=('global player',), excludes=('picked',)),
+    Special_Roll_Rule(_simple_roll(Rolls_Enum.GENRE, 'Genre'), contains=('genre',), excludes=('picked',)),
+    Special_Roll_Rule(_simple_roll(Rolls_Enum.TAG, 'Tag'), contains=('tag',), excludes=('picked',)),
+    # NOTE we do not add roll for watched mastery modes
+    Special_Roll_Rule(_simple_roll(Rolls_Enum.MASTERY_MODE, 'Mastery mode'), contains=('mastery',), excludes=('watched',)),
+    # Type 5 (OP/ED/IN/OPED/OPEDIN)
+    Special_Roll_Rule(_simple_roll(Rolls_Enum.TYPE_5, 'Type 5'), any_of=('countdown', 'ftf')),
+    # Unwatched (1v1, 2v2 or 3v3 exclusively)
+    Special_Roll_Rule(_simple_roll(Rolls_Enum.TYPE_7, 'Type 7'), any_of=('unwatched 1v1', 'unwatched 2v2', 'unwatched 3v3')),
+    Special_Roll_Rule(_simple_roll(Rolls_Enum.YEAR, 'Year'), contains=('year',), excludes=('picked',)),
+    Special_Roll_Rule(_simple_roll(Rolls_Enum.ONE_LIFE_CHALLENGE, 'One Life Challenge', 'One Life Challenge mode'), contains=('one life challenge',)),
+    Special_Roll_Rule(_roll_uma_musume, contains=('uma musume',)),
+    Special_Roll_Rule(_roll_metronomes, contains=('metronome',)),
+    # NOTE Check female before male as "female" word is included in "male" word, so checking "male" first will include male and female
+    Special_Roll_Rule(_spotlight_roll(Rolls_Spotlight.FEMALE_ARTIST, 'Female Artist', 'artist_name'), contains=('spotlight', 'female artist')),
+    Special_Roll_Rule(_spotlight_roll(Rolls_Spotlight.FEMALE_VA, 'Female VA', 'artist_name'), contains=('spotlight', 'female va')),
+    Special_Roll_Rule(_spotlight_roll(Rolls_Spotlight.MALE_ARTIST, 'Male Artist', 'artist_name'), contains=('spotlight', 'male artist')),
+    Special_Roll_Rule(_spotlight_roll(Rolls_Spotlight.MALE_VA, 'Male VA', 'artist_name'), contains=('spotlight', 'male va')),
+    Special_Roll_Rule(_spotlight_roll(Rolls_Spotlight.GROUP, 'Group', 'group_name'), contains=('spotlight', 'group')),
+    Special_Roll_Rule(_spotlight_roll(Rolls_Spotlight.COMPOSER, 'Composer', 'composer_name'), contains=('spotlight', 'composer')),
+    Special_Roll_Rule(_spotlight_roll(Rolls_Spotlight.FRANCHISE, 'Franchise', 'franchise_name'), contains=('spotlight', 'franchise')),
+    Special_Roll_Rule(_spotlight_roll(Rolls_Spotlight.STUDIO, 'Studio', 'studio_name'), contains=('spotlight', 'studio')),
+    Special_Roll_Rule(_spotlight_roll(Rolls_Spotlight.COMMUNITY, 'Community', 'community_name'), contains=('spotlight', 'community'))
+]
+
+
+def resolve_special_roll_rule(gamemode_name: str) -> Special_Roll_Rule | None:
+    """Return the first rule of `SPECIAL_ROLL_RULES` matching the gamemode with name `gamemode_name`, or `None` if it isn't a special gamemode."""
+    gamemode_name = gamemode_name.lower()
+    for rule in SPECIAL_ROLL_RULES:
+        if rule.matches(gamemode_name):
+            return rule
+    return None
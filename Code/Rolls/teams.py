@@ -1,16 +1,28 @@
+import time
 import random
 from copy import copy
 
 from Code.Rolls.enums import Roll_Teams
 from Code.Players.player import Player
 
+OPTIMAL_NODE_BUDGET = 70_000        # Max nodes explored searching for the optimal teams (the best teams found so far are returned afterwards)
+OPTIMAL_TIME_BUDGET = 5.0           # Safety cap (seconds) of the optimal teams search, only hit if the machine is way slower than expected
+LOCAL_SEARCH_SWAP_BUDGET = 200_000  # Max swaps evaluated improving the teams through local search
+LOCAL_SEARCH_TIME_BUDGET = 5.0      # Safety cap (seconds) of the local search, only hit if the machine is way slower than expected
+LOCAL_SEARCH_RESTARTS = 8           # Random teams used as starting points of the local search (besides the snake and greedy ones)
+OBJECTIVE_RANGE_WEIGHT = 1.0        # Weight of the difference between the strongest and the weakest team in the balance objective
+OBJECTIVE_VARIANCE_WEIGHT = 0.5     # Weight of the variance of the teams's total ranks in the balance objective
+OBJECTIVE_TOP_RANKS_WEIGHT = 2.0    # Weight of the top-rank players stacking in the balance objective
+
 class Teams_Roll:
     """Static class that contains the methods to split a list of players into different teams."""
 
     @staticmethod
-    def roll_teams(type: Roll_Teams, player_list: list[Player], num_teams: int = 2) -> tuple[list[list[Player]], str]:
+    def roll_teams(type: Roll_Teams, player_list: list[Player], num_teams: int = 2, rng: random.Random = random) -> tuple[list[list[Player]], str]:
         """
         Split the `player_list` into `num_teams` teams following a different criteria based on the `type` provided.\n
+        The rolls are made with `rng` (the `random` module by default, a `Roll_Session`'s one to make them reproducible).\n
+        NOTE the optimal and local search criteria may take a while (see their budgets), so call it from a separated thread when in the event loop.\n
         Return a tuple consisting of 2 elements:
         - `list[list[Player]]`: The list of the teams (as `list[Player]`) rolled.
         - `str`: A string representation of the teams rolled.
@@ -20,19 +32,27 @@ class Teams_Roll:
         match type:
 
             case Roll_Teams.FULL_RANDOM:
-                teams = Teams_Roll._roll_teams_random(player_list_copy, num_teams)
+                teams = Teams_Roll._roll_teams_random(player_list_copy, num_teams, rng)
                 teams_str = Teams_Roll._teams_as_str(teams, show_team_value=True)
             
             case Roll_Teams.BALANCED_SNAKE:
-                teams = Teams_Roll._roll_teams_balanced_snake(player_list_copy, num_teams)
+                teams = Teams_Roll._roll_teams_balanced_snake(player_list_copy, num_teams, rng)
                 teams_str = Teams_Roll._teams_as_str(teams, show_team_value=True)
 
             case Roll_Teams.BALANCED_GREEDY:
-                teams = Teams_Roll._roll_teams_balanced_greedy(player_list_copy, num_teams)
+                teams = Teams_Roll._roll_teams_balanced_greedy(player_list_copy, num_teams, rng)
                 teams_str = Teams_Roll._teams_as_str(teams, show_team_value=True)
             
+            case Roll_Teams.OPTIMAL:
+                teams = Teams_Roll._roll_teams_optimal(player_list_copy, num_teams, rng)
+                teams_str = Teams_Roll._teams_as_str(teams, show_team_value=True)
+
+            case Roll_Teams.BALANCED_LOCAL_SEARCH:
+                teams = Teams_Roll._roll_teams_local_search(player_list_copy, num_teams, rng)
+                teams_str = Teams_Roll._teams_as_str(teams, show_team_value=True)
+
             case Roll_Teams.GROUPED_BY_STRENGTH:
-                teams = Teams_Roll._roll_teams_grouped_by_strength(player_list_copy, num_teams)
+                teams = Teams_Roll._roll_teams_grouped_by_strength(player_list_copy, num_teams, rng)
                 teams_str = Teams_Roll._teams_as_str(teams, show_team_value=False)
 
             case _:
@@ -42,7 +62,7 @@ class Teams_Roll:
 
 
     @staticmethod
-    def _roll_teams_random(player_list: list[Player], num_teams: int) -> list[list[Player]]:
+    def _roll_teams_random(player_list: list[Player], num_teams: int, rng: random.Random = random) -> list[list[Player]]:
         """
         Split the `player_list` into `num_teams` teams.\n
         All teams will have the same number of players.\n
@@ -52,7 +72,7 @@ class Teams_Roll:
         num_players = len(player_list)
 
         for i in range(num_players):
-            player = random.choice(player_list)
+            player = rng.choice(player_list)
             teams[i%num_teams].append(player)
             player_list.remove(player)
 
@@ -60,7 +80,7 @@ class Teams_Roll:
 
 
     @staticmethod
-    def _roll_teams_balanced_snake(player_list: list[Player], num_teams: int) -> list[list[Player]]:
+    def _roll_teams_balanced_snake(player_list: list[Player], num_teams: int, rng: random.Random = random) -> list[list[Player]]:
         """
         Split the `player_list` into `num_teams` teams.\n
         All teams will have the same number of players.\n
@@ -69,7 +89,7 @@ class Teams_Roll:
         """
         # Manually sort the players to not take into account the `amq_name` value
         # Sorted based on `rank` and, for those with the same rank, random (so different results can be provided given the same arguments)
-        random.shuffle(player_list)
+        rng.shuffle(player_list)
         player_list = sorted(player_list, key=lambda x: x.rank)
     
         teams = [[] for _ in range(num_teams)]
@@ -89,7 +109,7 @@ class Teams_Roll:
     
 
     @staticmethod
-    def _roll_teams_balanced_greedy(player_list: list[Player], num_teams: int) -> list[list[Player]]:
+    def _roll_teams_balanced_greedy(player_list: list[Player], num_teams: int, rng: random.Random = random) -> list[list[Player]]:
         """
         Split the `player_list` into `num_teams` teams.\n
         All teams will have the same number of players.\n
@@ -98,7 +118,7 @@ class Teams_Roll:
         """
         # Manually sort the players to not take into account the `amq_name` value
         # Sorted based on `rank` and, for those with the same rank, random (so different results can be provided given the same arguments)
-        random.shuffle(player_list)
+        rng.shuffle(player_list)
         player_list = sorted(player_list, key=lambda x: x.rank)
 
         teams = [[] for _ in range(num_teams)]
@@ -122,70 +142,235 @@ class Teams_Roll:
         return teams
 
     @staticmethod
-    def _roll_teams_optimal(player_list: list[Player], num_teams: int) -> list[list[Player]]:
+    def _roll_teams_optimal(
+        player_list: list[Player],
+        num_teams: int,
+        rng: random.Random = random,
+        node_budget: int = OPTIMAL_NODE_BUDGET,
+        time_budget: float = OPTIMAL_TIME_BUDGET
+    ) -> list[list[Player]]:
         """
         Split the `player_list` into `num_teams` teams.\n
-        All teams will have the same number of players.\n
+        All teams will have the same number of players (or differ in 1 player if they can't be split evenly).\n
         All teams will have as similar strength as possible.\n
-        Balancing done via Optimal pattern, meaning that all possible combinations are evaluated to find the one that minimizes the difference in strength teams.\n
-
-        NOTE Very computationally expensive. Before using, improve it first / Limit it usage / Return early if a certain threshold is reached.
-        """
-        return NotImplementedError('Optimal team rolling is not implemented yet!')
+        Balancing done via Optimal pattern, meaning that the partitions are explored (branch and bound) to find the one that minimizes the
+        difference between the strongest and the weakest team, starting from the greedy one.\n
+        The search stops as soon as a perfect partition is found or `node_budget` nodes have been explored, returning the best partition found
+        (so the same `rng` state always leads to the same teams). `time_budget` is only a safety cap: if it is hit, the teams returned depend
+        on the machine's speed.
         """
         # Manually sort the players to not take into account the `amq_name` value
         # Sorted based on `rank` and, for those with the same rank, random (so different results can be provided given the same arguments)
-        random.shuffle(player_list)
+        rng.shuffle(player_list)
         players = sorted(player_list, key=lambda x: x.rank)
-        
-        best_teams = None
-        min_diff = float('inf')
+        values = [player.rank.value for player in players]
+
         num_players = len(players)
-        team_size = num_players // num_teams
-        current_teams = [[] for _ in range(num_teams)]
-        team_sums = [0] * num_teams
+        capacities = [num_players // num_teams + (i < num_players % num_teams) for i in range(num_teams)]
+        total = sum(values)
+        # NOTE the values are sorted from the highest to the lowest, so the `k` highest values of the players not assigned yet (from `idx`)
+        # are `prefix_sums[idx+k] - prefix_sums[idx]` and the `k` lowest ones are `prefix_sums[num_players] - prefix_sums[num_players-k]`
+        prefix_sums = [0]
+        for value in values:
+            prefix_sums.append(prefix_sums[-1] + value)
+        # The difference can't be lower than this, so the search stops if a partition with it is found
+        perfect_diff = 0 if total % num_teams == 0 else 1
+
+        # Start from the greedy partition (each player assigned to the weakest team that isn't full yet)
+        sizes, sums = [0] * num_teams, [0] * num_teams
+        best_assignment = []
+        for value in values:
+            team_idx = min((i for i in range(num_teams) if sizes[i] < capacities[i]), key=lambda i: sums[i])
+            best_assignment.append(team_idx)
+            sizes[team_idx] += 1
+            sums[team_idx] += value
+        best_diff = max(sums) - min(sums)
+
+        sizes, sums = [0] * num_teams, [0] * num_teams
+        assignment = [0] * num_players
+        deadline = time.perf_counter() + time_budget
+        nodes = 0
+        out_of_budget = timed_out = False
+
+        def search(idx: int) -> None:
+            nonlocal best_diff, best_assignment, nodes, out_of_budget, timed_out
 
-        def backtrack(idx: int) -> None:
-            nonlocal min_diff, best_teams
-            
-            # If we reached the end, we compare
             if idx == num_players:
-                diff = max(team_sums) - min(team_sums)
-                if diff < min_diff:
-                    min_diff = diff
-                    best_teams = [team[:] for team in current_teams]
+                diff = max(sums) - min(sums)
+                if diff < best_diff:
+                    best_diff = diff
+                    best_assignment = assignment[:]
                 return
 
-            player = players[idx]
-            val = player.rank.value
-
-            # We try to put the player in each team
-            for i in range(num_teams):
-                if len(current_teams[i]) < team_size:
-                    # Prunning: if the current sum of this team minus the current minimum already exceeds min_diff, it's unlikely to improve
-                    # but to be 100% optimal, we only prune if the "gap" is unsolvable.
-                    current_teams[i].append(player)
-                    team_sums[i] += val
-                    
-                    # Prunning: if the team was empty, we don't try to put the player in the next empty teams (avoids redundant permutations)
-                    is_empty = len(current_teams[i]) == 1
-                    
-                    backtrack(idx + 1)
-                    
-                    # Undo
-                    team_sums[i] -= val
-                    current_teams[i].pop()
-                    
-                    if is_empty: 
+            nodes += 1
+            if nodes >= node_budget:
+                out_of_budget = True
+            elif nodes % 1024 == 0 and time.perf_counter() > deadline:
+                out_of_budget = timed_out = True
+            if out_of_budget or best_diff <= perfect_diff:
+                return
+
+            # Prunning: bound the final difference with the lowest/highest total each team can still reach with the players left
+            highest_min = min(total // num_teams, min(
+                sums[i] + prefix_sums[idx + capacities[i] - sizes[i]] - prefix_sums[idx]
+                for i in range(num_teams)
+            ))
+            lowest_max = max(-(-total // num_teams), max(
+                sums[i] + prefix_sums[num_players] - prefix_sums[num_players - capacities[i] + sizes[i]]
+                for i in range(num_teams)
+            ))
+            if lowest_max - highest_min >= best_diff:
+                return
+
+            value = values[idx]
+            tried_states = set()
+            # Weakest teams first, so the good partitions are found early (and more branches are pruned afterwards)
+            for i in sorted(range(num_teams), key=lambda i: sums[i]):
+                # Prunning: teams in the same state lead to the same partitions (avoids redundant permutations, e.g. the empty teams)
+                state = (sizes[i], sums[i], capacities[i])
+                if sizes[i] == capacities[i] or state in tried_states:
+                    continue
+                tried_states.add(state)
+
+                assignment[idx] = i
+                sizes[i] += 1
+                sums[i] += value
+                search(idx + 1)
+                sizes[i] -= 1
+                sums[i] -= value
+
+        search(0)
+        if timed_out:
+            print(f'Optimal teams search stopped by its {time_budget}s safety cap after {nodes} nodes (the teams rolled are not reproducible)')
+
+        teams = [[] for _ in range(num_teams)]
+        for player, team_idx in zip(players, best_assignment):
+            teams[team_idx].append(player)
+        return teams
+    
+
+    @staticmethod
+    def _balance_objective(totals: list[int], top_counts: list[int]) -> float:
+        """
+        Return how unbalanced are some teams given the total rank (`totals`) and number of top-rank players (`top_counts`) of each team.\n
+        It weights the difference between the strongest and the weakest team, the variance of the teams's totals and how stacked the top-rank
+        players are (difference between the team with the most of them and the one with the fewest). The lower, the better.
+        """
+        mean = sum(totals) / len(totals)
+        variance = sum((total - mean) ** 2 for total in totals) / len(totals)
+        return (
+            OBJECTIVE_RANGE_WEIGHT * (max(totals) - min(totals))
+            + OBJECTIVE_VARIANCE_WEIGHT * variance
+            + OBJECTIVE_TOP_RANKS_WEIGHT * (max(top_counts) - min(top_counts))
+        )
+
+    @staticmethod
+    def _top_rank_value(players: list[Player], num_teams: int) -> int:
+        """Return the lowest rank value considered a top-rank: the one of the `num_teams`-th strongest player (ties included)."""
+        values = sorted((player.rank.value for player in players), reverse=True)
+        return values[min(num_teams, len(values)) - 1] if values else 0
+
+    @staticmethod
+    def _teams_objective(teams: list[list[Player]]) -> float:
+        """Return the balance objective (see `_balance_objective`) of the `teams`. The lower, the better."""
+        top_rank_value = Teams_Roll._top_rank_value([player for team in teams for player in team], len(teams))
+        totals = [sum(player.rank.value for player in team) for team in teams]
+        top_counts = [sum(player.rank.value >= top_rank_value for player in team) for team in teams]
+        return Teams_Roll._balance_objective(totals, top_counts)
+
+    @staticmethod
+    def _roll_teams_local_search(
+        player_list: list[Player],
+        num_teams: int,
+        rng: random.Random = random,
+        swap_budget: int = LOCAL_SEARCH_SWAP_BUDGET,
+        time_budget: float = LOCAL_SEARCH_TIME_BUDGET,
+        restarts: int = LOCAL_SEARCH_RESTARTS
+    ) -> list[list[Player]]:
+        """
+        Split the `player_list` into `num_teams` teams.\n
+        All teams will have the same number of players (or differ in 1 player if they can't be split evenly).\n
+        All teams will have as similar strength as possible, taking into account the balance objective (see `_balance_objective`) rather
+        than only the strength difference, so the top-rank players are not stacked in the same team.\n
+        Balancing done via Local Search, meaning that, starting from the snake and greedy teams (and `restarts` random ones), players are
+        swapped between teams while the objective improves. The best teams found are returned after evaluating `swap_budget` swaps at most
+        (so the same `rng` state always leads to the same teams). `time_budget` is only a safety cap: if it is hit, the teams returned depend
+        on the machine's speed.
+        """
+        deadline = time.perf_counter() + time_budget
+        swaps_evaluated = 0
+        out_of_budget = timed_out = False
+        num_players = len(player_list)
+        top_rank_value = Teams_Roll._top_rank_value(player_list, num_teams)
+
+        starting_teams = [Teams_Roll._roll_teams_balanced_snake(copy(player_list), num_teams, rng)]
+        # NOTE the greedy pattern requires the players to be split evenly
+        if num_players % num_teams == 0:
+            starting_teams.append(Teams_Roll._roll_teams_balanced_greedy(copy(player_list), num_teams, rng))
+        starting_teams += [Teams_Roll._roll_teams_random(copy(player_list), num_teams, rng) for _ in range(restarts)]
+
+        best_teams, best_objective = None, float('inf')
+        for teams in starting_teams:
+            totals = [sum(player.rank.value for player in team) for team in teams]
+            top_counts = [sum(player.rank.value >= top_rank_value for player in team) for team in teams]
+            objective = Teams_Roll._balance_objective(totals, top_counts)
+
+            improved = True
+            while improved and not out_of_budget:
+                improved = False
+                # Random order, so the same starting teams can lead to different (but as balanced) teams
+                swaps = [
+                    (i, a, j, b)
+                    for i in range(num_teams) for j in range(i + 1, num_teams)
+                    for a in range(len(teams[i])) for b in range(len(teams[j]))
+                ]
+                rng.shuffle(swaps)
+
+                for i, a, j, b in swaps:
+                    swaps_evaluated += 1
+                    if swaps_evaluated >= swap_budget:
+                        out_of_budget = True
+                    elif swaps_evaluated % 1024 == 0 and time.perf_counter() > deadline:
+                        out_of_budget = timed_out = True
+                    if out_of_budget:
                         break
 
-        backtrack(0)
+                    player_a, player_b = teams[i][a], teams[j][b]
+                    value_diff = player_b.rank.value - player_a.rank.value
+                    top_diff = (player_b.rank.value >= top_rank_value) - (player_a.rank.value >= top_rank_value)
+                    if value_diff == 0 and top_diff == 0:
+                        continue
+
+                    totals[i] += value_diff
+                    totals[j] -= value_diff
+                    top_counts[i] += top_diff
+                    top_counts[j] -= top_diff
+                    new_objective = Teams_Roll._balance_objective(totals, top_counts)
+
+                    if new_objective < objective:
+                        teams[i][a], teams[j][b] = player_b, player_a
+                        objective = new_objective
+                        improved = True
+                        break
+
+                    # Undo the swap
+                    totals[i] -= value_diff
+                    totals[j] += value_diff
+                    top_counts[i] -= top_diff
+                    top_counts[j] += top_diff
+
+            if objective < best_objective:
+                best_teams, best_objective = teams, objective
+            if out_of_budget:
+                break
+
+        if timed_out:
+            print(f'Local search stopped by its {time_budget}s safety cap after {swaps_evaluated} swaps (the teams rolled are not reproducible)')
         return best_teams
-        """
     
 
     @staticmethod
-    def _roll_teams_grouped_by_strength(player_list: list[Player], num_teams: int) -> list[list[Player]]:
+    def _roll_teams_grouped_by_strength(player_list: list[Player], num_teams: int, rng: random.Random = random) -> list[list[Player]]:
         """
         Split the `player_list` into `num_teams` teams.\n
         All teams will have the same number of players.\n
@@ -193,7 +378,7 @@ class Teams_Roll:
         """
         # Manually sort the players to not take into account the `amq_name` value
         # Sorted based on `rank` and, for those with the same rank, random (so different results can be provided given the same arguments)
-        random.shuffle(player_list)
+        rng.shuffle(player_list)
         player_list = sorted(player_list, key=lambda x: x.rank)
     
         teams = [[] for _ in range(num_teams)]
@@ -207,7 +392,10 @@ class Teams_Roll:
 
     @staticmethod
     def _teams_as_str(teams: list[list[Player]], show_team_value: bool = False) -> str:
-        """Return a string representation for the `teams` rolled."""
+        """
+        Return a string representation for the `teams` rolled.\n
+        If `show_team_value`, the total rank of each team and the balance objective of the teams (see `_balance_objective`) are added.
+        """
         teams_as_str = ''
 
         for i, team in enumerate(teams):
@@ -231,4 +419,7 @@ class Teams_Roll:
                 teams_as_str += ', '.join(team_players)
                 teams_as_str += '\n'
 
+            if any(teams):
+                teams_as_str += f'\n**Balance score:** {Teams_Roll._teams_objective(teams):.2f} (the lower, the better)\n'
+
         return teams_as_str
\ No newline at end of file
@@ -3,6 +3,7 @@ import discord
 from Code.Tours.Schedule.database import Scheduled_Tours_Database
 from Code.Tours.Schedule.schedule import Scheduled_Tour
 from Code.Utilities.error_handler import print_exception
+from Code.Utilities.database_executor import Database_Executor
 
 class Scheduled_Tour_Controller:
     """Controller to encapsule the Tour Scheduling Logic from the rest of the application."""
@@ -24,7 +25,7 @@ class Scheduled_Tour_Controller:
             self.scheduled_tours[id] = scheduled_tour
 
     
-    def add_scheduled_tour(self, guild_id: int, description: str, host: str, timestamp: int) -> tuple[bool, str]:
+    async def add_scheduled_tour(self, guild_id: int, description: str, host: str, timestamp: int) -> tuple[bool, str]:
         """
         Create a new Scheduled_Tour and add it into the database and the catalog.
         
@@ -32,7 +33,7 @@ class Scheduled_Tour_Controller:
         """
         try:
             created_at = int(discord.utils.utcnow().timestamp())
-            id = Scheduled_Tours_Database.add_scheduled_tour(guild_id, description, host, timestamp, created_at)
+            id = await Database_Executor().run(Scheduled_Tours_Database.add_scheduled_tour, guild_id, description, host, timestamp, created_at)
             new_scheduled_tour = Scheduled_Tour(id, guild_id, description, host, timestamp, created_at, None)
             self.scheduled_tours[id] = new_scheduled_tour
             return True, new_scheduled_tour.get_log_data()
@@ -42,7 +43,7 @@ class Scheduled_Tour_Controller:
             return False, ''
     
 
-    def delete_scheduled_tour(self, tour_id: int) -> tuple[bool, str]:
+    async def delete_scheduled_tour(self, tour_id: int) -> tuple[bool, str]:
         """
         Delete a Scheduled_Tour from the database and the catalog.
         
@@ -50,7 +51,7 @@ class Scheduled_Tour_Controller:
         """
         try:
             log_data = self.scheduled_tours[tour_id].get_log_data()
-            Scheduled_Tours_Database.delete_scheduled_tour(tour_id)
+            await Database_Executor().run(Scheduled_Tours_Database.delete_scheduled_tour, tour_id)
             del self.scheduled_tours[tour_id]
             return True, log_data
         
@@ -59,7 +60,7 @@ class Scheduled_Tour_Controller:
             return False, ''
         
     
-    def edit_scheduled_tour(self, tour_id: int, description: str = None, host: str = None, timestamp: int = None) -> tuple[bool, str]:
+    async def edit_scheduled_tour(self, tour_id: int, description: str = None, host: str = None, timestamp: int = None) -> tuple[bool, str]:
         """
         Delete a Scheduled_Tour in the database and in the catalog.
 
@@ -80,7 +81,7 @@ class Scheduled_Tour_Controller:
             new_updated_at = int(discord.utils.utcnow().timestamp())
             
             # Apply the changes
-            Scheduled_Tours_Database.edit_scheduled_tour(tour_id, new_description, new_host, new_timestamp, new_updated_at)
+            await Database_Executor().run(Scheduled_Tours_Database.edit_scheduled_tour, tour_id, new_description, new_host, new_timestamp, new_updated_at)
             tour.tour_description = new_description
             tour.tour_host = new_host
             tour.starts_at_timestamp = new_timestamp
@@ -1,6 +1,9 @@
+import asyncio
+
 import discord
 
 from Code.Tours.tour import Tour
+from Code.Players.player import Player
 from Code.Others.roles import Roles
 from Code.Utilities.error_handler import error_handler_decorator
 
@@ -21,6 +24,7 @@ class Tours_Controller:
         """Creates the active tours catalog."""
         self._tour_cont = 0
         self.tours: dict[int, Tour] = {}
+        self.teardown_tasks: dict[int, asyncio.Task] = {}     # Tours (by id) whose roles are still being removed after being ended
 
 
     def start_new_tour(
@@ -91,17 +95,53 @@ class Tours_Controller:
         return view.dropdown.selected_tour
     
 
-    async def end_current_tour(self, tour: Tour, guild: discord.Guild) -> None:
-        """Ends the tour that is currently active."""
-        # Remove the drafter roles from the players
-        [await Roles().remove_drafter_role(guild, player.discord_id) for player in tour.players]
+    def reindex_player_name(self, player: Player) -> None:
+        """Update the name of the player in the active tours's name indexes after they changed it (see `Tour.get_tour_player`)."""
+        for tour in self.tours.values():
+            if tour.is_tour_active:
+                tour.reindex_player_name(player)
 
-        # Remove the roles from the players
-        [await team.reset_roles(guild) for team in tour.teams]
-        
+
+    async def end_current_tour(self, tour: Tour, guild: discord.Guild, on_done: callable = None, on_failed: callable = None) -> asyncio.Task:
+        """
+        Ends the tour that is currently active.\n
+        The tour is closed right away, but the drafter and team roles are removed from its players in a background task (tracked in
+        `teardown_tasks` until it finishes), so ending a big tour doesn't block the host's interaction.
+        If provided, `on_done` is awaited with the discord ids of the players whose roles couldn't be removed once the task finishes,
+        and `on_failed` is awaited with the error if the task fails.\n
+        Returns the background task.
+        """
         # Prevent people for joining the ended tour
         tour.is_tour_active = False
         tour.is_tour_open = False
+        print(f'Tour {tour.tour_id} players message: {tour.players_message_updater}')
+
+        # Remove the roles from the players (the ones in the tour and the ones in a team, without duplicates)
+        player_ids = list(dict.fromkeys([player.discord_id for player in tour.players] + [player.discord_id for team in tour.teams for player in team.players]))
+        task = asyncio.create_task(self._teardown_tour(tour, guild, player_ids, on_done, on_failed))
+        self.teardown_tasks[tour.tour_id] = task
 
         # NOTE we do not remove the ended tour from self.tours dict
-        # TODO tours database?
\ No newline at end of file
+        # TODO tours database?
+        return task
+
+
+    async def _teardown_tour(self, tour: Tour, guild: discord.Guild, player_ids: list[int], on_done: callable, on_failed: callable) -> None:
+        """Remove the tour roles from the players and report the result through `on_done` / `on_failed` (see `end_current_tour`)."""
+        error = None
+        try:
+            failed_ids = await Roles().remove_tour_roles(guild, player_ids)
+            print(f'Tour {tour.tour_id} teardown finished ({len(player_ids) - len(failed_ids)}/{len(player_ids)} players cleared)')
+        except Exception as e:
+            error = e
+            print(f'Tour {tour.tour_id} teardown failed: {e}')
+        finally:
+            self.teardown_tasks.pop(tour.tour_id, None)
+
+        try:
+            if error is None and on_done is not None:
+                await on_done(failed_ids)
+            elif error is not None and on_failed is not None:
+                await on_failed(error)
+        except Exception as e:
+            print(f'Tour {tour.tour_id} teardown result couldn\'t be reported: {e}')
\ No newline at end of file
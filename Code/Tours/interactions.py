@@ -1,9 +1,11 @@
 import re
-from copy import copy
+import time
+import asyncio
 
 import discord
 
 from Code.Utilities.error_handler import error_handler_decorator
+from Code.Utilities.to_chunks import to_chunks
 from Code.Tours.controller import Tours_Controller
 from Code.Tours.tour import Tour
 from Code.Tours.team import Team
@@ -11,11 +13,25 @@ from Code.Players.controller import Players_Controller
 from Code.Players.player import Player
 from Code.Rolls.teams import Teams_Roll
 from Code.Rolls.blind_crews import Blind_Crews
+from Code.Rolls.session import Roll_Session
 from Code.Rolls.enums import Roll_Teams, Roll_Gamemode
 from Code.Others.channels import Channels
 from Code.Others.Emojis.controller import Emojis_Controller
 from Code.Others.roles import Roles
 
+PROGRESS_UPDATE_INTERVAL = 2.0   # Min seconds between the edits of a progress message
+SEARCH_CRITERIA = (Roll_Teams.OPTIMAL, Roll_Teams.BALANCED_LOCAL_SEARCH)    # Teams criteria that search the teams (taking up to their budgets)
+
+
+async def _roll_teams(type: Roll_Teams, player_list: list[Player], num_teams: int, session: Roll_Session) -> tuple[list[list[Player]], str]:
+    """
+    Auxiliar method to roll the teams (see `Teams_Roll.roll_teams`) with the `session`'s rng.\n
+    The search criteria are rolled in a separated thread, so the event loop isn't blocked while the teams are searched.
+    """
+    if type in SEARCH_CRITERIA:
+        return await asyncio.to_thread(Teams_Roll.roll_teams, type, player_list, num_teams, session.rng)
+    return Teams_Roll.roll_teams(type=type, player_list=player_list, num_teams=num_teams, rng=session.rng)
+
 
 async def _log_command(interaction: discord.Interaction, command_name: str, tour: Tour, args: list[str]):
     """
@@ -94,7 +110,7 @@ async def tour_create(interaction: discord.Interaction, timer: int = None, size:
                 return
             
             # Try to add the player to the tour and inform the user about the result
-            join_ok, in_players_list = self.tour.add_player(player)
+            join_ok, in_players_list = await self.tour.add_player(player)
             if not join_ok:
                 content = 'You couldn\'t join the tour. This can happen for one of the following reasons:\n'
                 content += '- You are already in the players\'s list / queue\n'
@@ -108,8 +124,7 @@ async def tour_create(interaction: discord.Interaction, timer: int = None, size:
             await new_interaction.followup.send(content=content, ephemeral=True)
 
             # Modify the player's message accordingly
-            players = tour.display_tour_players_and_queue()
-            await tour.players_message.edit(content=players)
+            tour.update_players_message()
 
 
         @discord.ui.button(label='Leave', emoji=leave_emoji, style=discord.ButtonStyle.green)
@@ -203,33 +218,16 @@ async def tour_edit(interaction: discord.Interaction, timer: int | None, max_siz
         content += '- Info modified successfully\n'
 
 
-    # Move some players to the queue if max size was reduced
-    if player_list_to_queue:
-        content += '\n**These players were moved from the players\'s list to the top of the queue:**\n'
-        moved_players = []
+    # Move some players to the queue if max size was reduced, or the queue to the players list if new timer, max size was increased or tour sign ups were reopened
+    if player_list_to_queue or queue_to_player_list:
+        moved_to_queue, _ = await tour.fit_players_list(interaction.client)
+        if moved_to_queue:
+            content += '\n**These players were moved from the players\'s list to the top of the queue:**\n'
+            content += ', '.join([discord.utils.escape_markdown(player.amq_name) for player in moved_to_queue])
+            content += '\n'
 
-        while len(tour.players) > max_size:
-            # Move the last players that joined the players's list to the top of the queue (priority over other queue people that were never in the players's list)
-            last_player = tour.players[-1]
-            moved_players.insert(0, discord.utils.escape_markdown(last_player.amq_name))
-            await tour.from_player_list_to_queue(interaction.client, last_player)
-        content += ', '.join(moved_players)
-        content += '\n'
-
-        # Display the players's list / queue changes
-        players = tour.display_tour_players_and_queue()
-        await tour.players_message.edit(content=players)
-
-
-    # Move queue to player list if new timer, max size was increased or tour sign ups were reopened
-    elif queue_to_player_list:
-        # We need to create a copy as tour.queue is going to be modified in tour.add_player()
-        queue_copy = copy(tour.queue)
-        [tour.add_player(player, privileged=True) for player in queue_copy]
-        
         # Display the players's list / queue changes
-        players = tour.display_tour_players_and_queue()
-        await tour.players_message.edit(content=players)
+        tour.update_players_message()
 
     # Check if there is any player with banned list that needs to be removed from the tour
     if check_player_lists:
@@ -285,8 +283,7 @@ async def tour_quit(interaction: discord.Interaction, tour: Tour = None):
         return
     
     # Modify the player's message accordingly
-    players = tour.display_tour_players_and_queue()
-    await tour.players_message.edit(content=players)
+    tour.update_players_message()
 
     # Inform the player
     content = 'You have successfully left the tour'
@@ -337,7 +334,7 @@ async def tour_players_add(interaction: discord.Interaction, players_str: str):
             continue
 
         # Add the players
-        join_ok, in_players_list = tour.add_player(player=player, privileged=True)
+        join_ok, in_players_list = await tour.add_player(player=player, privileged=True)
         player_name = discord.utils.escape_markdown(player.amq_name)
 
         if not join_ok:
@@ -360,8 +357,7 @@ async def tour_players_add(interaction: discord.Interaction, players_str: str):
     await interaction.followup.send(content=content, ephemeral=True)
 
     # Modify the player's message accordingly
-    tour_players = tour.display_tour_players_and_queue()
-    await tour.players_message.edit(content=tour_players)
+    tour.update_players_message()
 
     # Log the command usage
     args = [f'`players`: **{discord.utils.escape_markdown(players_str)}**']
@@ -414,8 +410,7 @@ async def tour_players_remove(interaction: discord.Interaction, players_str: str
     await interaction.followup.send(content=content, ephemeral=True)
 
     # Modify the player's message accordingly
-    tour_players = tour.display_tour_players_and_queue()
-    await tour.players_message.edit(content=tour_players)
+    tour.update_players_message()
 
     # Log the command usage
     args = [f'`players`: **{discord.utils.escape_markdown(players_str)}**']
@@ -494,16 +489,31 @@ async def tour_end(interaction: discord.Interaction):
                 await new_interaction.followup.send(content=f'The tour ({self.host_str}) has already been ended', ephemeral=True)
                 return
 
-            # End the tour
+            async def on_teardown_done(failed_ids: list[int]):
+                content = f'The roles of the tour ({self.host_str}) have been removed'
+                if failed_ids:
+                    content += f'\nCouldn\'t remove the roles of: {", ".join(f"<@{player_id}>" for player_id in failed_ids)}'
+                await new_interaction.followup.send(content=content, ephemeral=True)
+
+            async def on_teardown_failed(error: Exception):
+                content = f'Couldn\'t remove the roles of the tour ({self.host_str}), they may need to be removed manually: {error}'
+                await new_interaction.followup.send(content=content, ephemeral=True)
+
+            # End the tour (the roles are removed in the background)
             self.already_ended = True
-            await Tours_Controller().end_current_tour(tour=self.tour, guild=new_interaction.guild)
+            await Tours_Controller().end_current_tour(
+                tour=self.tour,
+                guild=new_interaction.guild,
+                on_done=on_teardown_done,
+                on_failed=on_teardown_failed
+            )
 
             # Modify the "Looking for players" join embed's field to False
             embed = self.tour.generate_join_embed()
             await self.tour.join_message.edit(embed=embed)
             
             # Send confirmation message
-            content = 'Tour ended successfully'
+            content = 'Tour ended successfully, removing the roles...'
             await new_interaction.followup.send(content=content, ephemeral=True)
 
             # Log the command usage
@@ -566,7 +576,7 @@ async def team_players_add(interaction: discord.Interaction, team_index: int, pl
     teams = [team.display_team() for team in tour.teams if len(team.players) > 0]
     content = '\n'.join(teams) + '\n\n' if len(teams) > 0 else ''
     if not_added:
-        content += f'- **Not added** (already in team?): {", ".join(not_added)}\n'
+        content += f'- **Not added** (already in team or left the tour?): {", ".join(not_added)}\n'
     if not_found:
         content += f'- **Couldn\'t find player from name provided in players\'s list:** {", ".join(not_found)}\n'
     
@@ -683,18 +693,22 @@ async def give_drafter_role(interaction: discord.Interaction, players_str: str):
 
 
 @error_handler_decorator()
-async def team_randomize(interaction: discord.Interaction, number_of_teams: int, criteria: int):
-    """Interaction to handle the `/team_randomize` command. It divides the players into groups and creates tour's teams based on the result."""
+async def team_randomize(interaction: discord.Interaction, number_of_teams: int, criteria: int, seed: int | None = None):
+    """
+    Interaction to handle the `/team_randomize` command. It divides the players into groups and creates tour's teams based on the result.\n
+    The teams are rolled from `seed` (a random one if not provided), which is displayed so the roll can be replayed.
+    """
 
     class Team_Randomize_View(discord.ui.View):
 
-        def __init__(self, tour: Tour, players: list[Player], type: Roll_Teams, number_of_teams: int, teams: list[list[Player]]):
+        def __init__(self, tour: Tour, players: list[Player], type: Roll_Teams, number_of_teams: int, teams: list[list[Player]], seed: int):
             super().__init__(timeout=180)
             self.tour = tour
             self.players = players
             self.type = type
             self.number_of_teams = number_of_teams
             self.teams = teams
+            self.seed = seed
             self.rerolled = False
 
         @discord.ui.button(label='Confirm', style=discord.ButtonStyle.green)
@@ -708,28 +722,37 @@ async def team_randomize(interaction: discord.Interaction, number_of_teams: int,
                 return
 
             content = 'Adding the roles...'
-            await new_interaction.followup.send(content=content, ephemeral=True)
-
-            # Make sure that teams are empty before adding the new players
-            for team in self.tour.teams:
-                for player in team.players:
-                    await team.remove_player(client=new_interaction.client, player=player)
-
-            # Creates the teams
-            for i, team in enumerate(self.teams):
-                for player in team:
-                    await self.tour.add_to_team(client=new_interaction.client, team_index=i, player=player)
+            progress_message = await new_interaction.followup.send(content=content, ephemeral=True, wait=True)
+            last_update = time.monotonic()
+
+            async def on_progress(done: int, total: int):
+                # NOTE editing the message at most once every PROGRESS_UPDATE_INTERVAL seconds so the progress doesn't get rate limited itself
+                nonlocal last_update
+                if done < total and time.monotonic() - last_update < PROGRESS_UPDATE_INTERVAL:
+                    return
+                last_update = time.monotonic()
+                try:
+                    await progress_message.edit(content=f'Adding the roles... ({done}/{total})')
+                except discord.HTTPException:
+                    pass
+
+            # Creates the teams (replacing the previous ones) and updates everyone's roles at once
+            failed_ids = await self.tour.set_teams(client=new_interaction.client, teams=self.teams, on_progress=on_progress)
 
             # Inform about the result
             real_teams = [team.display_team() for team in self.tour.teams if len(team.players) > 0]
             real_teams = '\n'.join(real_teams)
             await new_interaction.channel.send(real_teams)
-            await new_interaction.followup.send(content='Roles added successfully!', ephemeral=True)
+            content = 'Roles added successfully!'
+            if failed_ids:
+                content += f'\nCouldn\'t update the roles of: {", ".join(f"<@{player_id}>" for player_id in failed_ids)}'
+            await new_interaction.followup.send(content=content, ephemeral=True)
 
             # Log the command usage
             args = [
                 f'`number_of_teams`: **{number_of_teams}**',
-                f'`criteria`: **{criteria}**'
+                f'`criteria`: **{criteria}**',
+                f'`seed`: **{self.seed}**'
             ]
             await _log_command(interaction, 'team_randomize', tour, args)
 
@@ -745,9 +768,10 @@ async def team_randomize(interaction: discord.Interaction, number_of_teams: int,
                 return
             
             self.rerolled = True
-            rerolled_teams, results_str = Teams_Roll.roll_teams(type=self.type, player_list=self.players, num_teams=self.number_of_teams)
-            view = Team_Randomize_View(tour=self.tour, players=self.players, type=self.type, number_of_teams=self.number_of_teams, teams=rerolled_teams)
-            await interaction.followup.send(content=results_str, view=view, ephemeral=True)
+            session = Roll_Session()
+            rerolled_teams, results_str = await _roll_teams(self.type, self.players, self.number_of_teams, session)
+            view = Team_Randomize_View(tour=self.tour, players=self.players, type=self.type, number_of_teams=self.number_of_teams, teams=rerolled_teams, seed=session.seed)
+            await interaction.followup.send(content=f'**Seed:** {session.seed}\n\n{results_str}', view=view, ephemeral=True)
 
 
     await interaction.response.defer(ephemeral=True)
@@ -766,27 +790,32 @@ async def team_randomize(interaction: discord.Interaction, number_of_teams: int,
     
     # Split the players
     type = Roll_Teams(criteria)
-    player_list = tour.players
-    teams, results_str = Teams_Roll.roll_teams(type=type, player_list=player_list, num_teams=number_of_teams)
+    player_list = list(tour.players)
+    session = Roll_Session(seed)
+    teams, results_str = await _roll_teams(type, player_list, number_of_teams, session)
 
     # Inform the host
-    content = f'These are the teams rolled based on the {type.name.replace("_", " ").capitalize()} criteria:\n\n{results_str}'
-    view = Team_Randomize_View(tour=tour, players=player_list, type=type, number_of_teams=number_of_teams, teams=teams)
+    content = f'These are the teams rolled based on the {type.name.replace("_", " ").capitalize()} criteria (seed: {session.seed}):\n\n{results_str}'
+    view = Team_Randomize_View(tour=tour, players=player_list, type=type, number_of_teams=number_of_teams, teams=teams, seed=session.seed)
     await interaction.followup.send(content=content, view=view, ephemeral=True)
 
 
 @error_handler_decorator()
-async def roll_groups(interaction: discord.Interaction, number_of_groups: int, criteria: int):
-    """Interaction to handle the `/roll_groups` command. It divides the players into groups."""
+async def roll_groups(interaction: discord.Interaction, number_of_groups: int, criteria: int, seed: int | None = None):
+    """
+    Interaction to handle the `/roll_groups` command. It divides the players into groups.\n
+    The groups are rolled from `seed` (a random one if not provided), which is displayed so the roll can be replayed.
+    """
 
     class Roll_Groups_View(discord.ui.View):
 
-        def __init__(self, players: list[Player], type: Roll_Teams, number_of_groups: int, groups: str):
+        def __init__(self, players: list[Player], type: Roll_Teams, number_of_groups: int, groups: str, seed: int):
             super().__init__(timeout=180)
             self.players = players
             self.type = type
             self.number_of_groups = number_of_groups
             self.groups = groups
+            self.seed = seed
 
         @discord.ui.button(label='Confirm', style=discord.ButtonStyle.green)
         @error_handler_decorator()
@@ -798,7 +827,8 @@ async def roll_groups(interaction: discord.Interaction, number_of_groups: int, c
             # Log the command usage
             args = [
                 f'`number_of_groups`: **{number_of_groups}**',
-                f'`criteria`: **{criteria}**'
+                f'`criteria`: **{criteria}**',
+                f'`seed`: **{self.seed}**'
             ]
             await _log_command(interaction, 'roll_groups', tour, args)
 
@@ -807,9 +837,10 @@ async def roll_groups(interaction: discord.Interaction, number_of_groups: int, c
         @error_handler_decorator()
         async def reroll(self, new_interaction: discord.Interaction, _: discord.Button):
             await new_interaction.response.defer(ephemeral=True)
-            _, groups = Teams_Roll.roll_teams(type=self.type, player_list=self.players, num_teams=self.number_of_groups)
-            view = Roll_Groups_View(players=self.players, type=self.type, number_of_groups=self.number_of_groups, groups=groups)
-            await interaction.followup.send(content=groups, view=view, ephemeral=True)
+            session = Roll_Session()
+            _, groups = await _roll_teams(self.type, self.players, self.number_of_groups, session)
+            view = Roll_Groups_View(players=self.players, type=self.type, number_of_groups=self.number_of_groups, groups=groups, seed=session.seed)
+            await interaction.followup.send(content=f'**Seed:** {session.seed}\n\n{groups}', view=view, ephemeral=True)
 
 
     await interaction.response.defer(ephemeral=True)
@@ -828,49 +859,56 @@ async def roll_groups(interaction: discord.Interaction, number_of_groups: int, c
     
     # Split the players
     type = Roll_Teams(criteria)
-    player_list = tour.players
-    _, groups = Teams_Roll.roll_teams(type=type, player_list=player_list, num_teams=number_of_groups)
+    player_list = list(tour.players)
+    session = Roll_Session(seed)
+    _, groups = await _roll_teams(type, player_list, number_of_groups, session)
 
     # Inform the host
-    content = f'These are the teams rolled based on the {type.name.replace("_", " ").capitalize()} criteria:\n\n{groups}'
-    view = Roll_Groups_View(players=player_list, type=type, number_of_groups=number_of_groups, groups=groups)
+    content = f'These are the teams rolled based on the {type.name.replace("_", " ").capitalize()} criteria (seed: {session.seed}):\n\n{groups}'
+    view = Roll_Groups_View(players=player_list, type=type, number_of_groups=number_of_groups, groups=groups, seed=session.seed)
     await interaction.followup.send(content=content, view=view, ephemeral=True)
 
 
 @error_handler_decorator()
-async def roll_blind_crews(interaction: discord.Interaction, criteria: int, duels: bool):
-    """Interaction to handle the `/roll_blind_crews` command. It rolls a blind crews round."""
+async def roll_blind_crews(interaction: discord.Interaction, criteria: int, duels: bool, seed: int | None = None, round_robin: bool = False):
+    """
+    Interaction to handle the `/roll_blind_crews` command. It rolls a blind crews round.\n
+    The round is rolled from `seed` (a random one if not provided), which is displayed so the roll can be replayed.\n
+    If `round_robin`, a round is rolled for every pair of active teams (scheduled as a round robin) instead of for 2 of them.
+    """
     
 
     class Teams_Dropdown(discord.ui.Select):
         
-        def __init__(self, criteria: int, duels: bool, active_teams: list[Team]):
+        def __init__(self, criteria: int, duels: bool, active_teams: list[Team], seed: int | None):
             options = [discord.SelectOption(label=team.name, value=str(i)) for i, team in enumerate(active_teams)]
             super().__init__(placeholder='Choose 2 teams', options=options, min_values=2, max_values=2)
             self.teams = active_teams
             self.criteria = criteria
             self.duels = duels
+            self.seed = seed
 
         @error_handler_decorator()
         async def callback(self, new_interaction: discord.Interaction):
             await new_interaction.response.defer(ephemeral=True)
             team_1 = self.teams[int(self.values[0])]
             team_2 = self.teams[int(self.values[1])]
-            await roll_bc(new_interaction, self.criteria, self.duels, team_1, team_2, add_team_names=True)
+            await roll_bc(new_interaction, self.criteria, self.duels, team_1, team_2, self.seed, add_team_names=True)
     
 
     class Teams_Dropdown_View(discord.ui.View):
         
-        def __init__(self, criteria: int, duels: bool, active_teams: list[Team]):
+        def __init__(self, criteria: int, duels: bool, active_teams: list[Team], seed: int | None):
             super().__init__(timeout=180)
-            self.add_item(Teams_Dropdown(criteria, duels, active_teams))
+            self.add_item(Teams_Dropdown(criteria, duels, active_teams, seed))
             
 
-    async def roll_bc(interaction: discord.Interaction, criteria: int, duels: bool, team_1: Team, team_2: Team, add_team_names: bool = False):
+    async def roll_bc(interaction: discord.Interaction, criteria: int, duels: bool, team_1: Team, team_2: Team, seed: int | None, add_team_names: bool = False):
         """Roll a blind crews round for 2 teams."""
         # Create the BlindCrews
         type = Roll_Gamemode(criteria)
-        blind_crews = Blind_Crews(type=type, team_1=team_1.players, team_2=team_2.players)
+        session = Roll_Session(seed)
+        blind_crews = Blind_Crews(type=type, team_1=list(team_1.players), team_2=list(team_2.players), rng=session.rng)
 
         # Roll the blindcrews round
         blind_crews.roll_blind_crews()
@@ -881,6 +919,7 @@ async def roll_blind_crews(interaction: discord.Interaction, criteria: int, duel
         # Send the roll information
         if add_team_names:
             round_info = f'Blind Crews rolled for **{team_1.name}** vs **{team_2.name}**:\n\n' + round_info
+        round_info += f'**Seed:** {session.seed}'
         main_message = await interaction.channel.send(round_info)
         [await main_message.reply(additional_roll) for additional_roll in additional_rolls]
         content = f'Blind Crews with {type.name.replace("_", " ").capitalize()} rolled successfully!'
@@ -893,7 +932,43 @@ async def roll_blind_crews(interaction: discord.Interaction, criteria: int, duel
             pass
 
         # Log the command usage
-        args = [f'`criteria`: **{criteria}**', f'`duels`: **{duels}**']
+        args = [f'`criteria`: **{criteria}**', f'`duels`: **{duels}**', f'`seed`: **{session.seed}**']
+        await _log_command(interaction, 'roll_blind_crews', tour, args)
+
+
+    async def roll_bc_round_robin(interaction: discord.Interaction, criteria: int, duels: bool, teams: list[Team], seed: int | None):
+        """Roll a blind crews round for every pair of `teams`, scheduled as a round robin, and send them all in as few messages as possible."""
+        type = Roll_Gamemode(criteria)
+        session = Roll_Session(seed)
+        round_robin = session.roll_blind_crews_round_robin(type, [list(team.players) for team in teams])
+
+        # NOTE each match (and additional roll) is a separate element so to_chunks can split the rounds between messages without exceeding the limit
+        rounds_info = [f'Round robin Blind Crews rolled for {len(teams)} teams (**Seed:** {session.seed})\n']
+        results_templates = []
+        for round_number, pairings in enumerate(round_robin.rounds, start=1):
+            rounds_info.append(f'__**Round {round_number}**__\n')
+            for team_1, team_2, blind_crews in pairings:
+                pairing_name = f'**{teams[team_1].name}** vs **{teams[team_2].name}**'
+                rounds_info.append(f'{pairing_name}:\n')
+                rounds_info += [match_info.rstrip('\n') + '\n' for match_info in blind_crews.get_matches_information()]
+                rounds_info += [additional_roll + '\n' for additional_roll in blind_crews.special_rolls_list]
+                results_templates.append(f'Round {round_number} - {pairing_name}:\n{blind_crews.get_results_template(duels)}')
+
+        # Send the roll information
+        for message in to_chunks(rounds_info):
+            await interaction.channel.send(message)
+        content = f'Round robin Blind Crews with {type.name.replace("_", " ").capitalize()} rolled successfully!'
+        await interaction.followup.send(content=content, ephemeral=True)
+
+        try:
+            for message in to_chunks(results_templates):
+                await interaction.user.send(message)
+        except discord.errors.Forbidden:
+            # host has dms closed, we don't send them the templates then
+            pass
+
+        # Log the command usage
+        args = [f'`criteria`: **{criteria}**', f'`duels`: **{duels}**', f'`seed`: **{session.seed}**', f'`round_robin`: **{True}**']
         await _log_command(interaction, 'roll_blind_crews', tour, args)
 
         
@@ -914,10 +989,13 @@ async def roll_blind_crews(interaction: discord.Interaction, criteria: int, duel
     if len(active_teams) < 2:
         content = 'Blind Crews requires players to be splitted into at least 2 teams!'
         await interaction.followup.send(content=content, ephemeral=True)
+
+    elif round_robin:
+        await roll_bc_round_robin(interaction, criteria, duels, active_teams, seed)
     
     elif len(active_teams) == 2:
-        await roll_bc(interaction, criteria, duels, active_teams[0], active_teams[1])
+        await roll_bc(interaction, criteria, duels, active_teams[0], active_teams[1], seed)
     
     else:
-        view = Teams_Dropdown_View(criteria, duels, active_teams)
+        view = Teams_Dropdown_View(criteria, duels, active_teams, seed)
         await interaction.followup.send(view=view, ephemeral=True)
\ No newline at end of file
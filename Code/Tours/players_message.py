@@ -0,0 +1,85 @@
+import os
+import time
+import asyncio
+
+import discord
+
+FLUSH_WINDOW = 1.5          # Min seconds between the edits of a tour players message (overridden by the `TOUR_PLAYERS_MESSAGE_WINDOW` environment variable)
+
+
+class Players_Message_Updater:
+    """
+    Keeps a tour's players message (the one with the players's list and queue) up to date without editing it on every change.\n
+    Changes only mark the message as outdated (`request_update`): the message is edited right away if it wasn't edited during the last
+    `window` seconds, otherwise once the window ends. Every edit renders the latest state, so a burst of joins / leaves is coalesced into
+    a single edit instead of one per change (which would hit the channel's rate limits and display the changes with lag).\n
+    `render` is the function returning the content of the message (i.e. `Tour.display_tour_players_and_queue`).
+    """
+
+    def __init__(self, render: callable, window: float | None = None) -> None:
+        self.render = render
+        self.window = window if window is not None else float(os.getenv('TOUR_PLAYERS_MESSAGE_WINDOW', FLUSH_WINDOW))
+        self.message: discord.Message | None = None
+
+        self._outdated = False
+        self._last_content: str | None = None
+        self._last_edit = float('-inf')
+        self._task: asyncio.Task | None = None
+        self._edit_lock = asyncio.Lock()    # one edit at a time, so an older content can never overwrite a newer one
+
+        # Metrics
+        self.requested_updates = 0      # Times the message was marked as outdated
+        self.edits = 0                  # Times the message was actually edited
+
+
+    @property
+    def edits_saved(self) -> int:
+        """Return the number of edits avoided by coalescing the updates requested."""
+        return self.requested_updates - self.edits
+
+
+    def request_update(self) -> None:
+        """Mark the message as outdated, so it is edited (with the latest state) as soon as the window allows it."""
+        self.requested_updates += 1
+        self._outdated = True
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._flush_updates())
+
+
+    async def flush(self) -> None:
+        """Edit the message right away if it doesn't display the latest state (ignoring the window), waiting for any edit in progress first."""
+        await self._edit()
+
+
+    async def _flush_updates(self) -> None:
+        """Edit the message until it is no longer outdated, at most once per window."""
+        while self._outdated:
+            delay = self._last_edit + self.window - time.monotonic()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            if self._outdated:
+                await self._edit()
+
+
+    async def _edit(self) -> None:
+        async with self._edit_lock:
+            # NOTE marking the message as updated before rendering, so the changes made while the edit is being sent are flushed in the next edit
+            self._outdated = False
+            self._last_edit = time.monotonic()
+            if self.message is None:
+                return
+
+            content = self.render()
+            if content == self._last_content:
+                return
+            try:
+                await self.message.edit(content=content)
+                self._last_content = content
+                self.edits += 1
+            except discord.HTTPException as e:
+                print(f'Couldn\'t edit the tour players message: {e}')
+
+
+    def __str__(self) -> str:
+        """Return a summary of the updates requested and the edits made."""
+        return f'{self.requested_updates} updates requested, {self.edits} edits made ({self.edits_saved} saved)'
@@ -0,0 +1,94 @@
+from collections import OrderedDict
+
+from Code.Players.player import Player
+
+
+class Roster:
+    """
+    Ordered collection of players (i.e. a tour's players's list or queue, or a team's players) without duplicates.\n
+    The players are stored in an insertion-ordered dict keyed by their discord id, so checking whether a player is in the roster, removing
+    them, adding them to either end and popping the first one are O(1) (instead of O(n) as in a list).\n
+    It can be read as a list (iterated, indexed, `len`, `in`, `+`...), but it can only be modified through its own methods.
+    """
+
+    def __init__(self, players: list[Player] = ()) -> None:
+        self._players: OrderedDict[int, Player] = OrderedDict()
+        for player in players:
+            self.append(player)
+
+
+    def append(self, player: Player) -> bool:
+        """Add the player to the end of the roster. Return whether they were added (False if they were already in the roster)."""
+        if player.discord_id in self._players:
+            return False
+        self._players[player.discord_id] = player
+        return True
+
+    def push_first(self, player: Player) -> None:
+        """Add the player to the start of the roster (moving them there if they were already in it)."""
+        self._players[player.discord_id] = player
+        self._players.move_to_end(player.discord_id, last=False)
+
+    def remove(self, player: Player) -> None:
+        """
+        Remove the player from the roster.
+
+        Raise:
+        ------
+        - `ValueError`: If the player is not in the roster.
+        """
+        if self._players.pop(player.discord_id, None) is None:
+            raise ValueError(f'{player.amq_name} is not in the roster')
+
+    def discard(self, player: Player) -> bool:
+        """Remove the player from the roster if they are in it. Return whether they were removed."""
+        return self._players.pop(player.discord_id, None) is not None
+
+    def pop_first(self) -> Player:
+        """
+        Remove and return the first player of the roster.
+
+        Raise:
+        ------
+        - `IndexError`: If the roster is empty.
+        """
+        if not self._players:
+            raise IndexError('pop from an empty roster')
+        return self._players.popitem(last=False)[1]
+
+    def clear(self) -> None:
+        self._players.clear()
+
+
+    def get(self, discord_id: int) -> Player | None:
+        """Return the player of the roster with the discord id provided (or `None` if there isn't)."""
+        return self._players.get(discord_id)
+
+    def __contains__(self, player: object) -> bool:
+        return isinstance(player, Player) and player.discord_id in self._players
+
+    def __len__(self) -> int:
+        return len(self._players)
+
+    def __iter__(self):
+        return iter(self._players.values())
+
+    def __reversed__(self):
+        return reversed(self._players.values())
+
+    def __getitem__(self, index: int | slice) -> Player | list[Player]:
+        # NOTE the first and last players are returned in O(1), any other index needs to walk the roster
+        if index == 0 and self._players:
+            return next(iter(self._players.values()))
+        if index == -1 and self._players:
+            return next(reversed(self._players.values()))
+        return list(self._players.values())[index]
+
+    def __add__(self, other: 'Roster | list[Player]') -> list[Player]:
+        return list(self) + list(other)
+
+    def __radd__(self, other: list[Player]) -> list[Player]:
+        return list(other) + list(self)
+
+    def __repr__(self) -> str:
+        return f'Roster({list(self)!r})'
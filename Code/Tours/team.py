@@ -2,6 +2,7 @@ import discord
 
 from Code.Tours.enums import Teams
 from Code.Players.player import Player
+from Code.Tours.roster import Roster
 from Code.Others.roles import Roles
 
 class Team:
@@ -10,7 +11,7 @@ class Team:
         self._name = Teams(team_id).name.replace('_', ' ')
         self._role_index = team_id
         self._guild_id = guild_id
-        self._players = []
+        self._players = Roster()
 
 
     @property
@@ -18,9 +19,17 @@ class Team:
         return self._name
 
     @property
-    def players(self) -> list[Player]:
+    def players(self) -> Roster:
         return self._players
 
+    @property
+    def role_index(self) -> int:
+        return self._role_index
+
+
+    def set_players(self, players: list[Player]) -> None:
+        """Replace the players of the team without updating their roles (see `Tour.set_teams`, which updates them all at once)."""
+        self._players = Roster(players)
 
     async def add_player(self, client: discord.Client, player: Player) -> bool:
         """Add a player to the team. Return whether the player was added (False if they were already in the team)."""
@@ -42,11 +51,6 @@ class Team:
         self.players.remove(player)
         return True
 
-    async def reset_roles(self, guild: discord.Guild) -> None:
-        """Clear all the roles from the players without removing them from their team."""
-        for player in self.players:
-            await Roles().remove_team_roles(guild, player.discord_id)
-
     def display_team(self, sort: bool = True) -> str:
         """Return a `str` with the information about the team's players list escaping markdown characters."""
         players_count = len(self.players)
@@ -1,4 +1,3 @@
-import difflib
 import asyncio
 from datetime import datetime
 
@@ -6,7 +5,11 @@ import discord
 
 from Code.Players.player import Player
 from Code.Tours.team import Team
+from Code.Tours.roster import Roster
+from Code.Tours.players_message import Players_Message_Updater
 from Code.Tours.enums import Teams
+from Code.Utilities.fuzzy_index import Fuzzy_Index
+from Code.Others.roles import Roles
 
 class Tour:
     """Class that instanciates a Tour object."""
@@ -39,11 +42,18 @@ class Tour:
         self._tour_info = tour_info
 
         self._join_message = None
-        self._players_message = None
-
-        self._players = []
-        self._queue = []
+        self._players_message_updater = Players_Message_Updater(render=self.display_tour_players_and_queue)
+
+        self._players = Roster()
+        self._queue = Roster()
+        self._players_by_names: dict[str, set[int]] = {}    # discord ids of the players's list by their amq name (lower case), kept up to date as they join / leave
+        self._players_names_keys: dict[int, str] = {}       # name each player (by their discord id) was indexed with
+        self._players_join_order: dict[int, int] = {}       # position in which each player (by their discord id) joined the players's list
+        self._joins_count = 0
+        self._players_names_index = Fuzzy_Index()
+        self._lock = asyncio.Lock()       # serializes the changes of the players's list / queue / teams (see `lock`)
         self._teams = [Team(guild_id=self._guild_id, team_id=team_id) for team_id in range(len(Teams))]
+        self._teams_by_player_id: dict[int, Team] = {}     # team of each player in a team (by their discord id)
 
 
     # No setter, final
@@ -137,20 +147,33 @@ class Tour:
 
     @property
     def players_message(self) -> discord.Message | None:
-        return self._players_message
+        return self._players_message_updater.message
     
     @players_message.setter
     def players_message(self, new_player_message: discord.Message) -> None:
-        self._players_message = new_player_message
+        self._players_message_updater.message = new_player_message
+
+    @property
+    def players_message_updater(self) -> Players_Message_Updater:
+        return self._players_message_updater
     
 
+    @property
+    def lock(self) -> asyncio.Lock:
+        """
+        Lock held while the players's list / queue / teams are being modified (`add_player`, `remove_player`, `add_to_team`, etc.), so the changes requested at
+        once by many interactions are applied one after another, in the order they were requested, instead of interleaving between their awaits.
+        """
+        return self._lock
+
+
     # No setter, add players one by one using `self.add_player()` 
     @property
-    def players(self) -> list[Player]:
+    def players(self) -> Roster:
         return self._players
     
     @property
-    def queue(self) -> list[Player]:
+    def queue(self) -> Roster:
         return self._queue
     
     @property
@@ -241,6 +264,10 @@ class Tour:
         """Return a `str` with the information about the players's list and queue escaping markdown characters."""
         return f'{self._display_tour_players(sort)}\n{self._display_tour_queue(sort)}'
 
+    def update_players_message(self) -> None:
+        """Update the players message with the current players's list and queue (coalescing the updates requested in a short time, see `Players_Message_Updater`)."""
+        self._players_message_updater.request_update()
+
     def display_tour_players_mentions(self) -> str:
         """Return a `str` with the discord mentions from the players's list."""
         return ' '.join([player.discord_ping for player in self.players])
@@ -248,17 +275,56 @@ class Tour:
 
     def get_tour_player(self, player_name: str) -> Player | None:
         """Given the name of a player, return the closest match among all the tours players to `player.amq_name` (or `None` if a close enough match couldn't be found)."""
-        players_by_names = {player.amq_name.lower(): player for player in self.players}
-        possibilities = [player.amq_name.lower() for player in self.players]
-        closest_matches = difflib.get_close_matches(player_name.lower(), possibilities)
-        
-        if not closest_matches:
+        closest_match = self._players_names_index.get_closest(player_name.lower())
+        if closest_match is None:
             return None
-        closest_match = players_by_names.get(closest_matches[0])
-        return closest_match
+        # NOTE if several players share the name, the one who joined the players's list first is returned
+        discord_id = min(self._players_by_names[closest_match], key=self._players_join_order.__getitem__)
+        return self.players.get(discord_id)
+
+    def reindex_player_name(self, player: Player) -> None:
+        """Index again the name of the player if they changed it while in the players's list (see `Tours_Controller.reindex_player_name`)."""
+        if player in self.players and self._players_names_keys.get(player.discord_id) != player.amq_name.lower():
+            self._unindex_player_name(player.discord_id)
+            self._index_player_name(player)
+
+
+    def _index_player_name(self, player: Player) -> None:
+        """Index the player's current name (see `get_tour_player`)."""
+        name = player.amq_name.lower()
+        self._players_names_keys[player.discord_id] = name
+        discord_ids = self._players_by_names.setdefault(name, set())
+        if not discord_ids:
+            self._players_names_index.add(name)
+        discord_ids.add(player.discord_id)
+
+    def _unindex_player_name(self, discord_id: int) -> None:
+        """Remove the name the player (by their discord id) was indexed with, which is no longer indexed once no player has it."""
+        name = self._players_names_keys.pop(discord_id, None)
+        if name is None:
+            return
+        discord_ids = self._players_by_names[name]
+        discord_ids.discard(discord_id)
+        if not discord_ids:
+            del self._players_by_names[name]
+            self._players_names_index.remove(name)
+
+    def _append_to_players_list(self, player: Player) -> None:
+        """Add the player to the end of the players's list and index their name (see `get_tour_player`)."""
+        self.players.append(player)
+        self._players_join_order[player.discord_id] = self._joins_count
+        self._joins_count += 1
+        self._index_player_name(player)
+
+    def _remove_from_players_list(self, player: Player) -> None:
+        """Remove the player from the players's list and their name from the index (see `get_tour_player`)."""
+        self.players.remove(player)
+        del self._players_join_order[player.discord_id]
+        # NOTE removing the name the player was indexed with, in case they changed it while in the tour
+        self._unindex_player_name(player.discord_id)
 
 
-    def add_player(self, player: Player, privileged: bool = False) -> tuple[bool, bool]:
+    async def add_player(self, player: Player, privileged: bool = False) -> tuple[bool, bool]:
         """
         Add a player to the tour's player list.\n
         `privileged` value can be set in order to ignore some restrictions (i.e. the timer).\n
@@ -266,6 +332,11 @@ class Tour:
         - Whether the player entered the tour.
         - Whether the player joined the tour's players list (instead of the queue).
         """
+        async with self.lock:
+            return self._add_player(player, privileged)
+
+    def _add_player(self, player: Player, privileged: bool = False) -> tuple[bool, bool]:
+        """Same as `add_player`, but without acquiring the lock (the caller must hold it)."""
         # NOTE Splitting privileged and not privileged completely for easier understanding
         if not privileged:
             # CASE 1: Player don't join neither players's list nor queue:
@@ -284,7 +355,7 @@ class Tour:
             if player in self.queue:        # Check if the player was already in the queue, and remove them from the queue if so
                 self.queue.remove(player)
             
-            self.players.append(player)
+            self._append_to_players_list(player)
 
             # Check if the max player limit has been reached
             if self.max_players_size is not None and self.max_players_size == len(self.players):
@@ -310,7 +381,7 @@ class Tour:
             if player in self.queue:
                 self.queue.remove(player)
             
-            self.players.append(player)
+            self._append_to_players_list(player)
             return True, True
     
 
@@ -321,6 +392,11 @@ class Tour:
         - First one: True if the player was successfully removed and False otherwise.
         - Second one: True if the removed player was in the player list and False if it was in the queue.
         """
+        async with self.lock:
+            return await self._remove_player(client, player)
+
+    async def _remove_player(self, client: discord.Client, player: Player) -> tuple[bool, bool]:
+        """Same as `remove_player`, but without acquiring the lock (the caller must hold it)."""
         # CASE 1: Player not in tour
         if player not in self.players and player not in self.queue:
             return False, False
@@ -332,15 +408,17 @@ class Tour:
 
         # CASE 3: Player in players's list
         # 1.- Remove player from teams and remove their team role (if proceed)
-        [await team.remove_player(client, player) for team in self.teams if player in team.players]
+        team = self._teams_by_player_id.pop(player.discord_id, None)
+        if team is not None:
+            await team.remove_player(client, player)
 
         # 2.- Remove the player
-        self.players.remove(player)
+        self._remove_from_players_list(player)
 
         # 3.- Add to the players list the player who has been waiting the most in queue
         if self.is_tour_open and len(self.queue) > 0 and self.timer_restriction_ok:
-            player_in_queue = self.queue.pop(0)
-            self.players.append(player_in_queue)
+            player_in_queue = self.queue.pop_first()
+            self._append_to_players_list(player_in_queue)
 
         return True, True
     
@@ -351,57 +429,123 @@ class Tour:
         It also removes the player from the team, if they were in one.\n
         Return True if the player was moved to the queue, and False otherwise (this is, the player was not in the players's list before).
         """
+        async with self.lock:
+            return await self._from_player_list_to_queue(client, player)
+
+    async def _from_player_list_to_queue(self, client: discord.Client, player: Player) -> bool:
+        """Same as `from_player_list_to_queue`, but without acquiring the lock (the caller must hold it)."""
         if player not in self.players:
             return False
         
         # Move the player to the top of the queue
-        self.players.remove(player)
-        self.queue.insert(0, player)
+        self._remove_from_players_list(player)
+        self.queue.push_first(player)
 
         # Remove the player from the teams
-        [await team.remove_player(client, player) for team in self.teams if player in team.players]
+        team = self._teams_by_player_id.pop(player.discord_id, None)
+        if team is not None:
+            await team.remove_player(client, player)
 
         return True
     
 
+    async def fit_players_list(self, client: discord.Client) -> tuple[list[Player], list[Player]]:
+        """
+        Make the players's list and queue fit the current restrictions (i.e. after the host edited the tour):
+        - While the players's list exceeds the max size, its last players are moved to the top of the queue (priority over the queue people
+        that were never in the players's list).
+        - Otherwise, the queue people are moved to the players's list while there is space left (ignoring the timer, as the host requested it).\n
+        Return the players moved to the queue and the players moved to the players's list.
+        """
+        async with self.lock:
+            moved_to_queue = []
+            while self.max_players_size is not None and len(self.players) > self.max_players_size:
+                last_player = self.players[-1]
+                await self._from_player_list_to_queue(client, last_player)
+                moved_to_queue.insert(0, last_player)
+
+            moved_to_players_list = []
+            if not moved_to_queue:
+                # We need to create a copy as self.queue is going to be modified in self._add_player()
+                for player in list(self.queue):
+                    _, in_players_list = self._add_player(player, privileged=True)
+                    if in_players_list:
+                        moved_to_players_list.append(player)
+
+            return moved_to_queue, moved_to_players_list
+
+
+    def get_player_team(self, player: Player) -> Team | None:
+        """Return the team the player is in (or `None` if they are not in any team)."""
+        return self._teams_by_player_id.get(player.discord_id)
+
+
     async def add_to_team(self, client: discord.Client, team_index: int, player: Player) -> bool:
-        """Add a player to a team. Return whether the player was added (False if they were already in the team)."""
-        # Make sure the player doesn't end up in more than one team
-        for index, team in enumerate(self.teams):
-            if index == team_index:
-                continue
-
-            if player in team.players:
-                await team.remove_player(client, player)
-        
-        return await self.teams[team_index].add_player(client, player)
+        """
+        Add a player to a team.\n
+        Return whether the player was added (False if they were already in the team or they are no longer in the players's list).
+        """
+        async with self.lock:
+            # NOTE the player may have left the tour since the host looked them up
+            if player not in self.players:
+                return False
+
+            team = self.teams[team_index]
+
+            # Make sure the player doesn't end up in more than one team
+            current_team = self._teams_by_player_id.get(player.discord_id)
+            if current_team is not None and current_team is not team:
+                await current_team.remove_player(client, player)
+                del self._teams_by_player_id[player.discord_id]
+
+            added = await team.add_player(client, player)
+            if added:
+                self._teams_by_player_id[player.discord_id] = team
+            return added
     
 
+    async def set_teams(self, client: discord.Client, teams: list[list[Player]], on_progress: callable = None) -> list[int]:
+        """
+        Replace the players of the tour's teams by `teams` (the first list of players goes to the first team and so on, the teams left are emptied).\n
+        The players who left the players's list since the teams were rolled are left out of them.\n
+        The team roles of all the players involved are updated at once (see `Roles.sync_team_roles`), instead of one player at a time.
+        If provided, `on_progress` is awaited with the number of players updated and the total after each update.\n
+        Return the discord ids of the players whose roles couldn't be updated.
+
+        NOTE the joins / leaves wait until the roles are updated, so a player leaving can't keep the role of a team they are no longer in.
+        """
+        async with self.lock:
+            # Players removed from every team lose their team role, the rest get the one of their new team
+            role_indexes: dict[int, int | None] = {player.discord_id: None for team in self.teams for player in team.players}
+            self._teams_by_player_id.clear()
+            for index, team in enumerate(self.teams):
+                players = [player for player in teams[index] if player in self.players] if index < len(teams) else []
+                team.set_players(players)
+                for player in players:
+                    role_indexes[player.discord_id] = team.role_index
+                    self._teams_by_player_id[player.discord_id] = team
+
+            guild = client.get_guild(self._guild_id)
+            return await Roles().sync_team_roles(guild, role_indexes, on_progress)
+
+
     async def remove_from_team(self, client: discord.Client, team_index: int, player: Player) -> bool:
         """Remove a player from a team. Return whether the player was removed (False if they were not in the team)."""
-        try:
-            team = self.teams[team_index]
-            return await team.remove_player(client, player)
-        
-        except IndexError:
-            return False
+        async with self.lock:
+            try:
+                team = self.teams[team_index]
+                removed = await team.remove_player(client, player)
+                if removed:
+                    self._teams_by_player_id.pop(player.discord_id, None)
+                return removed
+
+            except IndexError:
+                return False
         
 
     def get_players_not_in_team(self) -> str:
         """Return a string containing all the players that are in the tour players list but that haven't been added yet to any team."""
-        players = []
-        for player in self.players:
-            in_team = False
-
-            for team in self.teams:
-                if player in team.players:
-                    in_team = True
-                    break
-
-            if not in_team:
-                players.append(player)
-        
-        players = sorted(players)
+        players = sorted([player for player in self.players if player.discord_id not in self._teams_by_player_id])
         players_data = [f'{discord.utils.escape_markdown(player.amq_name)} ({player.rank.name})' for player in players]
         players_str = ', '.join(players_data)
         answer = f'**Not in team ({len(players)})**: {players_str}'
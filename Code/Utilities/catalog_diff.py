@@ -0,0 +1,66 @@
+class Catalog_Changes:
+    """Summary of the changes applied into a catalog when refreshing it with new data."""
+
+    def __init__(self, catalog_name: str) -> None:
+        self.catalog_name = catalog_name
+        self.added: list[str] = []
+        self.updated: list[str] = []
+        self.deleted: list[str] = []
+
+    def __bool__(self) -> bool:
+        """Return whether any change was applied into the catalog."""
+        return bool(self.added or self.updated or self.deleted)
+
+    def __str__(self) -> str:
+        """Return a one line summary of the changes (e.g. to display it to the admins)."""
+        return f'**{self.catalog_name}:** {len(self.added)} added, {len(self.updated)} updated, {len(self.deleted)} deleted'
+
+
+def apply_rows(
+    catalog_name: str,
+    catalog: dict[str, object],
+    row_hashes: dict[str, int],
+    rows: list[tuple],
+    factory: callable
+) -> Catalog_Changes:
+    """
+    Update the `catalog` (key -> object) in place so it contains the objects built from `rows`, being `row[0]` the key of each of them.\n
+    `row_hashes` must hold the content hash of the row each object of the catalog was built from (it is updated along with the catalog).\n
+    Only the new and modified rows are turned into objects (through `factory(*row)`), and the keys missing in `rows` are deleted.
+    The objects of the rows that didn't change are kept, so whoever holds a reference to them (live tours, views...) keeps a valid one.\n
+    Return a summary of the changes applied. As when building the catalogs from scratch, if a key is repeated, the last row prevails.
+    """
+    changes = Catalog_Changes(catalog_name)
+
+    new_rows = {row[0]: row for row in rows}
+
+    for key in list(catalog):
+        if key not in new_rows:
+            del catalog[key]
+            del row_hashes[key]
+            changes.deleted.append(key)
+
+    for key, row in new_rows.items():
+        row_hash = hash(row)
+        if key not in catalog:
+            changes.added.append(key)
+        elif row_hashes[key] != row_hash:
+            changes.updated.append(key)
+        else:
+            continue
+        catalog[key] = factory(*row)
+        row_hashes[key] = row_hash
+
+    return changes
+
+
+def apply_values(catalog_name: str, current_values: list[str], new_values: list[str]) -> Catalog_Changes:
+    """
+    Return a summary of the changes between the `current_values` and the `new_values` of a plain catalog of strings (metronomes, items...).\n
+    As strings are immutable, there are no references to keep: the caller just replaces the old list with the new one.
+    """
+    changes = Catalog_Changes(catalog_name)
+    current_set, new_set = set(current_values), set(new_values)
+    changes.added = [value for value in new_values if value not in current_set]
+    changes.deleted = [value for value in current_values if value not in new_set]
+    return changes
@@ -1,20 +1,125 @@
 import os
+import queue
 import sqlite3
+import threading
 
 DB_PATH = os.path.join('Database', 'database.db')
+POOL_SIZE = 4               # Max number of idle connections kept alive
+BUSY_TIMEOUT = 5.0          # Seconds a connection waits for a lock before raising `sqlite3.OperationalError`
+CACHED_STATEMENTS = 128     # Prepared statements cached per connection
 
-def _connect_to_database() -> tuple[sqlite3.Connection, sqlite3.Cursor]:
-    conn = sqlite3.connect(DB_PATH)
-    cur = conn.cursor()
-    return conn, cur
 
-def _close_connection(conn: sqlite3.Connection, cur: sqlite3.Cursor) -> None:
-    cur.close()
-    conn.close()
+class _Connection_Pool:
+    """
+    Pool of long-lived connections with the SQLite Database.\n
+    Connections are opened lazily (up to `pool_size` idle connections are kept) and reused between calls, so the prepared statements cached
+    by each connection survive from one call to the next instead of being compiled again every time.
+    """
+
+    def __init__(self, db_path: str, pool_size: int, busy_timeout: float, cached_statements: int) -> None:
+        self.db_path = db_path
+        self.pool_size = pool_size
+        self.busy_timeout = busy_timeout
+        self.cached_statements = cached_statements
+
+        self._idle_connections: queue.LifoQueue[sqlite3.Connection] = queue.LifoQueue()
+        self._all_connections: list[sqlite3.Connection] = []
+        self._lock = threading.Lock()
+
+    def _create_connection(self) -> sqlite3.Connection:
+        """Open a new connection in WAL mode (readers don't block the writer and vice versa)."""
+        conn = sqlite3.connect(
+            self.db_path,
+            timeout=self.busy_timeout,
+            cached_statements=self.cached_statements,
+            check_same_thread=False     # Connections are handed to one thread at a time by the pool
+        )
+        conn.execute('PRAGMA journal_mode = WAL')
+        conn.execute('PRAGMA synchronous = NORMAL')
+        conn.execute(f'PRAGMA busy_timeout = {int(self.busy_timeout * 1000)}')
+        return conn
+
+    def acquire(self) -> sqlite3.Connection:
+        """Return an idle connection, or open a new one if all of them are in use."""
+        try:
+            return self._idle_connections.get_nowait()
+        except queue.Empty:
+            conn = self._create_connection()
+            with self._lock:
+                self._all_connections.append(conn)
+            return conn
+
+    def release(self, conn: sqlite3.Connection) -> None:
+        """Give back a connection to the pool, closing it if there are already `pool_size` idle connections."""
+        if self._idle_connections.qsize() < self.pool_size:
+            self._idle_connections.put(conn)
+            return
+
+        with self._lock:
+            self._all_connections.remove(conn)
+        conn.close()
+
+    def close_all(self) -> None:
+        """Close every connection opened by the pool."""
+        with self._lock:
+            for conn in self._all_connections:
+                conn.close()
+            self._all_connections.clear()
+        self._idle_connections = queue.LifoQueue()
+
+
+_pool: _Connection_Pool | None = None
+_pool_lock = threading.Lock()
+
+def _get_pool() -> _Connection_Pool:
+    """Return the shared connection pool, creating it with the module's default values the first time it is needed."""
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = _Connection_Pool(DB_PATH, POOL_SIZE, BUSY_TIMEOUT, CACHED_STATEMENTS)
+    return _pool
+
+def configure_connection_pool(
+    db_path: str = DB_PATH,
+    pool_size: int = POOL_SIZE,
+    busy_timeout: float = BUSY_TIMEOUT,
+    cached_statements: int = CACHED_STATEMENTS
+) -> None:
+    """
+    Replace the shared connection pool with a new one using the values provided, closing the connections of the previous one.\n
+    Not needed for the default setup (the pool is created on first use), but useful to tune the `busy_timeout` or to point the Database
+    layer to another file (benchmarks, maintenance scripts...).
+    """
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.close_all()
+        _pool = _Connection_Pool(db_path, pool_size, busy_timeout, cached_statements)
+
+def close_connection_pool() -> None:
+    """Close all the connections with the Database (call it before shutting down the bot)."""
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.close_all()
+            _pool = None
+
 
 def connection_manager(func: callable) -> callable:
+    """
+    Decorator to handle connections with the Database.
+    :param func: The function to decorate
+    :return: The decorated function
+
+    This decorator borrows a connection from the pool, creates a cursor, and passes it to the decorated function.
+    It then commits the changes and returns the connection to the pool after the function has completed.
+    If an exception is raised, it rolls back the changes and raises the exception.
+    """
     def wrapper(*args, **kwargs):
-        conn, cur = _connect_to_database()
+        pool = _get_pool()
+        conn = pool.acquire()
+        cur = conn.cursor()
         try:
             result = func(*args, **kwargs, cur=cur)
             conn.commit()
@@ -22,6 +127,7 @@ def connection_manager(func: callable) -> callable:
             conn.rollback()
             raise e
         finally:
-            _close_connection(conn, cur)
+            cur.close()
+            pool.release(conn)
         return result
     return wrapper
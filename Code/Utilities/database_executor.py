@@ -0,0 +1,31 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+class Database_Executor:
+    """
+    Singleton class that runs the Database's operations outside of the event loop.\n
+    All the operations are queued and applied one by one by a single writer thread, so:
+    - Awaiting an operation doesn't block the gateway heartbeat nor the rest of the interactions while the disk I/O happens.
+    - Operations are applied in the same order they were submitted (which also means that they are ordered per table).
+    """
+    _instance = None
+    def __new__(cls) -> 'Database_Executor':
+        """Override the __new__ method to return the existing instance of the class if it exists or create a new instance if it doesn't exist yet.\n"""
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+            cls._instance._set_data()
+        return cls._instance
+
+    def _set_data(self) -> None:
+        """Create the writer thread (started lazily by the executor on the first submission)."""
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='database_writer')
+
+
+    async def run(self, func: callable, *args, **kwargs):
+        """Queue `func(*args, **kwargs)` to be executed by the writer thread and wait for its result without blocking the event loop."""
+        future = self._executor.submit(func, *args, **kwargs)
+        return await asyncio.wrap_future(future)
+
+    async def drain(self) -> None:
+        """Wait until all the queued operations are applied and stop the writer thread. Meant to be called when the bot shuts down."""
+        await asyncio.to_thread(self._executor.shutdown, wait=True)
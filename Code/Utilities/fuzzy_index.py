@@ -0,0 +1,211 @@
+import bisect
+from difflib import SequenceMatcher
+from collections import Counter, OrderedDict
+
+CUTOFF = 0.6                # Same default as `difflib.get_close_matches`
+MAX_CANDIDATES = 64         # Keys (sharing the most bigrams with the query) scored first with `SequenceMatcher` per lookup
+CACHE_SIZE = 1024           # Queries whose result is kept in the LRU cache
+COMPLETE_LIMIT = 25         # Max number of suggestions returned by `complete` (Discord's autocomplete limit)
+
+_MISSING = object()
+
+
+class Fuzzy_Index:
+    """
+    In-memory index to find the key most similar to a query without comparing the query against every key.\n
+    Keys are split into bigrams (padded with start/end markers so the first and last characters weight as much as the rest) and stored in
+    an inverted index. A lookup first scores with `difflib.SequenceMatcher` the `max_candidates` keys that share the most bigrams with
+    the query, which usually finds the closest key right away.\n
+    Keys are also indexed by their length and characters (each occurrence of a character is a token: the second "a" of a key is `('a', 2)`).
+    As the score of a key is bounded by the characters it shares with the query (`SequenceMatcher.quick_ratio`), only the keys containing
+    one of the query's rarest tokens can still reach the best score found, and only those whose bound reaches it are scored. So the
+    result is always the one of `difflib.get_close_matches(query, keys)[0]` over all the keys (same scores, cutoff and tie-break).\n
+    The index is updated incrementally through `add` / `remove`, so it never needs to be rebuilt when a catalog changes.\n
+    The last `cache_size` results are kept in an LRU cache (query -> closest key), so repeated queries are answered in O(1). Any change in
+    the keys (`add` / `remove` / `clear`) invalidates the cache, as the closest key of any query may have changed.\n
+    The keys are also kept sorted, so `complete` can suggest the keys starting with a prefix through a binary search (and fill the rest
+    of the suggestions with the keys sharing the most bigrams with it), fast enough for autocompletion over tens of thousands of keys.
+
+    NOTE Keys are stored as provided: normalize them (i.e. `.lower()`) before adding them, and normalize the queries the same way.
+    """
+
+    def __init__(self, keys: list[str] = (), cutoff: float = CUTOFF, max_candidates: int = MAX_CANDIDATES, cache_size: int = CACHE_SIZE) -> None:
+        self.cutoff = cutoff
+        self.max_candidates = max_candidates
+        self.cache_size = cache_size
+
+        self._cache: OrderedDict[str, str | None] = OrderedDict()
+
+        self._grams_by_key: dict[str, frozenset[str]] = {}
+        self._keys_by_gram: dict[str, set[str]] = {}
+        self._keys_by_char: dict[int, dict[tuple[str, int], set[str]]] = {}     # length -> character token -> keys
+        self._sorted_keys: list[str] = []
+
+        for key in keys:
+            self.add(key)
+
+
+    @staticmethod
+    def _grams(text: str) -> frozenset[str]:
+        """Return the padded bigrams of `text`."""
+        padded = f'\x02{text}\x03'
+        return frozenset(padded[i:i+2] for i in range(len(padded) - 1))
+
+    @staticmethod
+    def _char_tokens(text: str) -> list[tuple[str, int]]:
+        """Return the character tokens of `text`: `(character, n)` for every n-th occurrence of each character."""
+        return [(char, n) for char, count in Counter(text).items() for n in range(1, count + 1)]
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._grams_by_key
+
+    def __len__(self) -> int:
+        return len(self._grams_by_key)
+
+
+    def add(self, key: str) -> None:
+        """Add `key` to the index (nothing happens if it was already indexed)."""
+        if key in self._grams_by_key:
+            return
+
+        self._cache.clear()
+        grams = self._grams(key)
+        self._grams_by_key[key] = grams
+        for gram in grams:
+            self._keys_by_gram.setdefault(gram, set()).add(key)
+        keys_by_char = self._keys_by_char.setdefault(len(key), {})
+        for token in self._char_tokens(key):
+            keys_by_char.setdefault(token, set()).add(key)
+        bisect.insort(self._sorted_keys, key)
+
+    def remove(self, key: str) -> None:
+        """Remove `key` from the index (nothing happens if it wasn't indexed)."""
+        grams = self._grams_by_key.pop(key, None)
+        if grams is None:
+            return
+
+        self._cache.clear()
+        for gram in grams:
+            keys = self._keys_by_gram[gram]
+            keys.discard(key)
+            if not keys:
+                del self._keys_by_gram[gram]
+        keys_by_char = self._keys_by_char[len(key)]
+        for token in self._char_tokens(key):
+            keys = keys_by_char[token]
+            keys.discard(key)
+            if not keys:
+                del keys_by_char[token]
+        if not keys_by_char:
+            del self._keys_by_char[len(key)]
+        del self._sorted_keys[bisect.bisect_left(self._sorted_keys, key)]
+
+    def clear(self) -> None:
+        """Remove all the keys from the index."""
+        self._cache.clear()
+        self._grams_by_key.clear()
+        self._keys_by_gram.clear()
+        self._keys_by_char.clear()
+        self._sorted_keys.clear()
+
+
+    def _candidates(self, query: str) -> list[str]:
+        """Return the (up to `max_candidates`) keys sharing the most bigrams with `query`, sorted by the number of bigrams shared."""
+        shared_grams = Counter()
+        for gram in self._grams(query):
+            keys = self._keys_by_gram.get(gram)
+            if keys:
+                shared_grams.update(keys)
+
+        return [key for key, _ in shared_grams.most_common(self.max_candidates)]
+
+    def get_closest(self, query: str) -> str | None:
+        """Return the indexed key most similar to `query`, or `None` if none of them has a similarity score of at least `cutoff`."""
+        closest = self._cache.get(query, _MISSING)
+        if closest is not _MISSING:
+            self._cache.move_to_end(query)
+            return closest
+
+        closest = self._search_closest(query)
+        self._cache[query] = closest
+        if len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+        return closest
+
+    def _search_closest(self, query: str) -> str | None:
+        """Return the indexed key most similar to `query` without looking at the cache (see `get_closest`)."""
+        # Exact match fast path (no other key can score higher than 1.0)
+        if query in self._grams_by_key:
+            return query
+
+        matcher = SequenceMatcher()
+        matcher.set_seq2(query)
+        best = None
+
+        def score(key: str) -> None:
+            nonlocal best
+            matcher.set_seq1(key)
+            key_score = matcher.ratio()
+            if key_score >= self.cutoff and (best is None or (key_score, key) > best):
+                best = (key_score, key)
+
+        # The keys sharing the most bigrams usually include the closest one, which makes the bound below discard most of the keys
+        candidates = self._candidates(query)
+        for key in candidates:
+            score(key)
+
+        # NOTE `ratio() <= quick_ratio() = 2 * shared characters / (len(key) + len(query))`, so a key can't beat (or tie with) the best
+        # score found if this bound is lower than it. With a cutoff of 0, even the keys sharing no characters would be matches
+        already_scored = set(candidates)
+        bounds = []
+        if self.cutoff <= 0:
+            bounds = [(1.0, key) for key in self._grams_by_key if key not in already_scored]
+        else:
+            query_tokens = self._char_tokens(query)
+            for length, keys_by_char in self._keys_by_char.items():
+                threshold = best[0] if best is not None else self.cutoff
+                total_length = length + len(query)
+                # Characters a key of this length must share with the query for its bound to reach the threshold
+                needed = next((shared for shared in range(min(length, len(query)) + 1) if 2.0 * shared / total_length >= threshold), None)
+                if not needed:
+                    continue
+                # Prefix filtering: a key sharing `needed` of the query's tokens shares at least one of any `len(tokens) - needed + 1` of
+                # them, so only the keys with one of the rarest ones are bounded
+                tokens_keys = sorted((keys_by_char.get(token, set()) for token in query_tokens), key=len)
+                bounded_keys = set().union(*tokens_keys[:len(query_tokens) - needed + 1]) - already_scored
+                for key in bounded_keys:
+                    shared = sum(key in keys for keys in tokens_keys)
+                    if shared >= needed:
+                        bounds.append((2.0 * shared / total_length, key))
+
+        bounds.sort(reverse=True)
+        for bound, key in bounds:
+            if bound < (best[0] if best is not None else self.cutoff):
+                break
+            score(key)
+
+        return best[1] if best is not None else None
+
+
+    def complete(self, query: str, limit: int = COMPLETE_LIMIT) -> list[str]:
+        """
+        Return up to `limit` keys to suggest while `query` is being typed:
+        - First, the keys starting with `query` (sorted alphabetically).
+        - Then, the keys sharing the most bigrams with `query` (so typos and words in the middle of the key are also suggested).
+        """
+        start = bisect.bisect_left(self._sorted_keys, query)
+        suggestions = []
+        for key in self._sorted_keys[start:start+limit]:
+            if not key.startswith(query):
+                break
+            suggestions.append(key)
+
+        if len(suggestions) < limit and query:
+            already_suggested = set(suggestions)
+            for key in self._candidates(query):
+                if key not in already_suggested:
+                    suggestions.append(key)
+                    if len(suggestions) == limit:
+                        break
+
+        return suggestions
@@ -0,0 +1,126 @@
+import os
+import time
+import asyncio
+
+import discord
+
+MAX_CONCURRENCY = 5         # Requests in flight at once per bucket (overridden by the `DISCORD_MAX_CONCURRENCY` environment variable)
+BUCKET_RATE = 10            # Requests allowed per bucket every `BUCKET_PERIOD` seconds (overridden by the `DISCORD_BUCKET_RATE` environment variable)
+BUCKET_PERIOD = 10.0        # Seconds in which the bucket fully refills
+MAX_RETRIES = 3             # Times a request is retried after a 429 (too many requests) response before giving up
+RETRY_DELAY = 1.0           # Seconds waited before retrying if the 429 response doesn't tell how long to wait (doubled on every retry)
+
+
+class _Bucket:
+    """Token bucket with the requests that can still be made for a single rate limit bucket, and the requests in flight for it."""
+
+    def __init__(self, rate: int, period: float, max_concurrency: int) -> None:
+        self.rate = rate
+        self.period = period
+        self.tokens = float(rate)
+        self.updated_at = time.monotonic()
+        self.lock = asyncio.Lock()
+        self.semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def acquire(self) -> None:
+        """Wait until a token is available and take it."""
+        async with self.lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(self.rate, self.tokens + (now - self.updated_at) * self.rate / self.period)
+                self.updated_at = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await asyncio.sleep((1 - self.tokens) * self.period / self.rate)
+
+    def empty(self, delay: float) -> None:
+        """Drop the tokens left so no request is made for the next `delay` seconds (the API told us we are being rate limited)."""
+        self.tokens = -delay * self.rate / self.period
+        self.updated_at = time.monotonic()
+
+
+class Rate_Limiter:
+    """
+    Limiter to run many Discord API requests concurrently without being rate limited.\n
+    Requests are grouped in buckets (i.e. the guild they modify, as Discord rate limits the member edits per guild) and each bucket allows at
+    most `rate` requests every `period` seconds and `max_concurrency` of them in flight at once.\n
+    If a request still gets a 429 (too many requests) response, the bucket is paused for as long as the response tells and the request is
+    retried (up to `max_retries` times).
+    """
+
+    def __init__(
+        self,
+        rate: int | None = None,
+        period: float = BUCKET_PERIOD,
+        max_concurrency: int | None = None,
+        max_retries: int = MAX_RETRIES
+    ) -> None:
+        self.rate = rate if rate is not None else int(os.getenv('DISCORD_BUCKET_RATE', BUCKET_RATE))
+        self.period = period
+        self.max_concurrency = max_concurrency if max_concurrency is not None else int(os.getenv('DISCORD_MAX_CONCURRENCY', MAX_CONCURRENCY))
+        self.max_retries = max_retries
+        self._buckets: dict[object, _Bucket] = {}
+
+
+    def _get_bucket(self, bucket_key: object) -> _Bucket:
+        bucket = self._buckets.get(bucket_key)
+        if bucket is None:
+            bucket = self._buckets[bucket_key] = _Bucket(self.rate, self.period, self.max_concurrency)
+        return bucket
+
+
+    @staticmethod
+    def _get_retry_after(error: discord.HTTPException, retry: int) -> float:
+        """Return the seconds to wait before retrying the request that failed with `error` (as told by the response if possible)."""
+        try:
+            return float(error.response.headers['Retry-After'])
+        except (AttributeError, KeyError, TypeError, ValueError):
+            return RETRY_DELAY * 2**retry
+
+
+    async def run(self, bucket_key: object, request: callable) -> object:
+        """
+        Run the `request` (a function returning the coroutine that makes the request, so it can be retried) within the bucket
+        `bucket_key` limits. Return the request's result.
+
+        Raise:
+        ------
+        - `discord.HTTPException`: If the request fails, or is still rate limited after `max_retries` retries.
+        """
+        bucket = self._get_bucket(bucket_key)
+        async with bucket.semaphore:
+            for retry in range(self.max_retries + 1):
+                await bucket.acquire()
+                try:
+                    return await request()
+                except discord.HTTPException as e:
+                    if e.status != 429 or retry == self.max_retries:
+                        raise
+                    delay = self._get_retry_after(e, retry)
+                    print(f'Rate limited on bucket {bucket_key}, retrying in {delay:.2f}s')
+                    bucket.empty(delay)
+
+
+    async def run_all(self, requests: dict[object, tuple[object, callable]], on_progress: callable = None) -> dict[object, Exception]:
+        """
+        Run all the `requests` concurrently, each of them within its bucket limits.\n
+        `requests` maps an identifier of the request (i.e. the discord id of the member edited) to its bucket key and the request itself (see `run`).
+        If provided, `on_progress` is awaited with the number of requests finished and the total every time one of them finishes.\n
+        Return the identifiers of the requests that failed, mapped to their error.
+        """
+        failures: dict[object, Exception] = {}
+        done = 0
+
+        async def run_one(request_id: object, bucket_key: object, request: callable) -> None:
+            nonlocal done
+            try:
+                await self.run(bucket_key, request)
+            except Exception as e:
+                failures[request_id] = e
+            done += 1
+            if on_progress is not None:
+                await on_progress(done, len(requests))
+
+        await asyncio.gather(*[run_one(request_id, bucket_key, request) for request_id, (bucket_key, request) in requests.items()])
+        return failures
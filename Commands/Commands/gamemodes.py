@@ -58,6 +58,7 @@ class Gamemodes_Commands(Commands):
 
         @client.tree.command(name='gamemode_delete', description='Delete a gamemode from the list of gamemodes')
         @app_commands.describe(gamemode_name='The name of the gamemode to delete')
+        @app_commands.autocomplete(gamemode_name=self.gamemode_name_autocomplete)
         @app_commands.guild_only
         @app_commands.check(self.is_user_admin)
         async def gamemode_delete(interaction: discord.Interaction, gamemode_name: str):
@@ -73,6 +74,7 @@ class Gamemodes_Commands(Commands):
             new_weighted_song_distribution='Whether weighted is now a rollable watched distribution',
             new_equal_song_distribution='Whether equal is now a rollable watched distribution'
         )
+        @app_commands.autocomplete(gamemode_name=self.gamemode_name_autocomplete)
         @app_commands.choices(new_random_song_distribution=[app_commands.Choice(name=str(i), value=int(i)) for i in [True, False]])
         @app_commands.choices(new_weighted_song_distribution=[app_commands.Choice(name=str(i), value=int(i)) for i in [True, False]])
         @app_commands.choices(new_equal_song_distribution=[app_commands.Choice(name=str(i), value=int(i)) for i in [True, False]])
@@ -97,12 +99,14 @@ class Gamemodes_Commands(Commands):
 
         @client.tree.command(name='gamemode_code', description='Gives you the amq code (room settings) of a gamemode')
         @app_commands.describe(gamemode_name='The name of the gamemode which code you want to get')
+        @app_commands.autocomplete(gamemode_name=self.gamemode_name_autocomplete)
         async def gamemode_code(interaction: discord.Interaction, gamemode_name: str):
             await interactions.get_code(interaction, gamemode_name)
 
 
         @client.tree.command(name='gamemode_info', description='Gives you the description of a gamemode')
         @app_commands.describe(gamemode_name='The name of the gamemode which description you want to get')
+        @app_commands.autocomplete(gamemode_name=self.gamemode_name_autocomplete)
         async def gamemode_code(interaction: discord.Interaction, gamemode_name: str):
             await interactions.get_info(interaction, gamemode_name)
 
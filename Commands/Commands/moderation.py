@@ -19,8 +19,9 @@ class Moderation_Commands(Commands):
         - `/list_banned_players`
         - `/ban_player_list`
         - `/list_watched_banned_players`
+        - `/simulate_teams`
         """
-        @client.tree.command(name='reset_data', description='Retrieve again the information from the sheets to keep it updated')
+        @client.tree.command(name='reset_data', description='Retrieve again the information from the sheets and the gamemodes from the database')
         @app_commands.guild_only
         @app_commands.check(self.is_user_tour_helper)
         async def reset_data(interaction: discord.Interaction):
@@ -64,4 +65,26 @@ class Moderation_Commands(Commands):
         @app_commands.guild_only
         @app_commands.check(self.is_user_tour_helper)
         async def list_watched_banned_players(interaction: discord.Interaction):
-            await interactions.list_watched_banned_players(interaction)
\ No newline at end of file
+            await interactions.list_watched_banned_players(interaction)
+
+
+        @client.tree.command(name='simulate_teams', description='Simulate many team splits to measure how balanced each teams criteria is')
+        @app_commands.describe(
+            number_of_players='Number of players to split in each simulated split',
+            number_of_teams='Number of teams to split the players into',
+            splits='Number of splits to simulate for each criteria',
+            synthetic='Whether to use a synthetic rank distribution instead of the registered players\'s one'
+        )
+        @app_commands.choices(number_of_teams=[app_commands.Choice(name=i, value=i) for i in [2, 3, 4, 5, 6, 7, 8]])
+        @app_commands.choices(synthetic=[app_commands.Choice(name=str(i), value=int(i)) for i in [True, False]])
+        @app_commands.guild_only
+        @app_commands.check(self.is_user_admin)
+        async def simulate_teams(
+            interaction: discord.Interaction,
+            number_of_players: app_commands.Range[int, 2, 128],
+            number_of_teams: app_commands.Choice[int],
+            splits: app_commands.Range[int, 1, 1_000_000] = 100_000,
+            synthetic: app_commands.Choice[int] = None
+        ):
+            synthetic = synthetic is not None and bool(synthetic.value)
+            await interactions.simulate_teams(interaction, number_of_players, number_of_teams.value, splits, synthetic)
@@ -47,6 +47,7 @@ class Players_Commands(Commands):
 
         @client.tree.command(name='player_get_profile', description='Get the profile of a given user')
         @app_commands.describe(amq_name='The amq name of the user', discord_member='The discord member of the server')
+        @app_commands.autocomplete(amq_name=self.player_name_autocomplete)
         @app_commands.guild_only
         async def player_get_profile(interaction: discord.Interaction, amq_name: str = '', discord_member: discord.Member = None):
             await interactions.player_get_profile(interaction, amq_name, discord_member)
@@ -57,6 +58,7 @@ class Players_Commands(Commands):
             amq_name='The AMQ name of the player',
             new_rank = 'The new rank of the player'
         )
+        @app_commands.autocomplete(amq_name=self.player_name_autocomplete)
         @app_commands.choices(new_rank = [app_commands.Choice(name=rank_name, value=rank_name) for rank_name in Ranking().rank_names])
         @app_commands.guild_only
         @app_commands.check(self.is_user_tour_helper)
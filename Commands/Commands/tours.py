@@ -149,13 +149,17 @@ class Tours_Commands(Commands):
 
 
         @client.tree.command(name='team_randomize', description='Split the players into teams based on the selected criteria')
-        @app_commands.describe(number_of_teams='Number of teams to split the players into', criteria='Type of randomization to apply')
+        @app_commands.describe(
+            number_of_teams='Number of teams to split the players into',
+            criteria='Type of randomization to apply',
+            seed='Seed of a previous roll to replay it (a random one is used if not provided)'
+        )
         @app_commands.choices(number_of_teams=[app_commands.Choice(name=i, value=i) for i in [2, 3, 4, 5, 6, 7, 8]])
         @app_commands.choices(criteria=[app_commands.Choice(name=type.name.replace('_', ' ').capitalize(), value=type.value) for type in Roll_Teams])
         @app_commands.guild_only
         @app_commands.check(self.is_user_tour_helper)
-        async def team_randomize(interaction: discord.Interaction, number_of_teams: app_commands.Choice[int], criteria: app_commands.Choice[int]):
-            await interactions.team_randomize(interaction, number_of_teams.value, criteria.value)
+        async def team_randomize(interaction: discord.Interaction, number_of_teams: app_commands.Choice[int], criteria: app_commands.Choice[int], seed: int = None):
+            await interactions.team_randomize(interaction, number_of_teams.value, criteria.value, seed)
 
 
         @client.tree.command(name='team_get_all_roles', description='Add all team roles to the user')
@@ -174,26 +178,40 @@ class Tours_Commands(Commands):
 
 
         @client.tree.command(name='roll_groups', description='Split the players into groups based on the selected criteria')
-        @app_commands.describe(number_of_groups='Number of groups to split the players into', criteria='Type of randomization to apply')
+        @app_commands.describe(
+            number_of_groups='Number of groups to split the players into',
+            criteria='Type of randomization to apply',
+            seed='Seed of a previous roll to replay it (a random one is used if not provided)'
+        )
         @app_commands.choices(criteria=[app_commands.Choice(name=type.name.replace('_', ' ').capitalize(), value=type.value) for type in Roll_Teams])
         @app_commands.guild_only
         @app_commands.check(self.is_user_tour_helper)
-        async def roll_groups(interaction: discord.Interaction, number_of_groups: int, criteria: app_commands.Choice[int]):
-            await interactions.roll_groups(interaction, number_of_groups, criteria.value)
+        async def roll_groups(interaction: discord.Interaction, number_of_groups: int, criteria: app_commands.Choice[int], seed: int = None):
+            await interactions.roll_groups(interaction, number_of_groups, criteria.value, seed)
 
 
         @client.tree.command(name='roll_blind_crews', description='Roll a blind crews round')
         @app_commands.describe(
             gamemodes='Which gamemodes to roll',
-            duels='Whether to add the players to each mode in the DM results template'
+            duels='Whether to add the players to each mode in the DM results template',
+            seed='Seed of a previous roll to replay it (a random one is used if not provided)',
+            round_robin='Whether to roll a round for every pair of teams (round robin) instead of choosing 2 teams'
         )
         @app_commands.choices(gamemodes=[app_commands.Choice(name=type.name.replace('_', ' ').capitalize(), value=type.value) for type in Roll_Gamemode])
         @app_commands.choices(duels=[app_commands.Choice(name=str(i), value=int(i)) for i in [True, False]])
+        @app_commands.choices(round_robin=[app_commands.Choice(name=str(i), value=int(i)) for i in [True, False]])
         @app_commands.guild_only
         @app_commands.check(self.is_user_tour_helper)
-        async def roll_blind_crews(interaction: discord.Interaction, gamemodes: app_commands.Choice[int], duels: app_commands.Choice[int]):
+        async def roll_blind_crews(
+            interaction: discord.Interaction,
+            gamemodes: app_commands.Choice[int],
+            duels: app_commands.Choice[int],
+            seed: int = None,
+            round_robin: app_commands.Choice[int] = None
+        ):
             duels = bool(duels.value)
-            await interactions.roll_blind_crews(interaction, gamemodes.value, duels)
+            round_robin = bool(round_robin.value) if round_robin is not None else False
+            await interactions.roll_blind_crews(interaction, gamemodes.value, duels, seed, round_robin)
         
 
         @client.tree.command(name='schedule_tour_add', description='Schedule a new tour')
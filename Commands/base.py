@@ -1,8 +1,11 @@
 from abc import ABC, abstractmethod
 
 from Commands.utilities import Tour_Helpers
+from Code.Gamemodes.controller import Main_Controller
+from Code.Players.controller import Players_Controller
 
 import discord
+from discord import app_commands
 
 class Commands(ABC):
     """Commands's Abstract Base Class. All Commands classes must inherit from this one."""
@@ -22,6 +25,16 @@ class Commands(ABC):
         helpers = Tour_Helpers().get_helpers()
         return interaction.user.id in admins or interaction.user.id in helpers
     
+    async def gamemode_name_autocomplete(self, interaction: discord.Interaction, current: str) -> list[app_commands.Choice[str]]:
+        """Return the gamemodes's names to suggest while the user is typing `current` as a gamemode's name."""
+        names = Main_Controller().complete_gamemode_names(current)
+        return [app_commands.Choice(name=name[:100], value=name[:100]) for name in names]
+
+    async def player_name_autocomplete(self, interaction: discord.Interaction, current: str) -> list[app_commands.Choice[str]]:
+        """Return the players's amq names to suggest while the user is typing `current` as a player's amq name."""
+        names = Players_Controller().complete_player_names(current)
+        return [app_commands.Choice(name=name[:100], value=name[:100]) for name in names]
+    
     @abstractmethod
     def load_commands(self, client: discord.Client) -> None:
         pass
\ No newline at end of file
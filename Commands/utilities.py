@@ -7,6 +7,7 @@ import discord
 from Code.Utilities.read_yaml import load_yaml_content
 from Code.Utilities.error_handler import print_exception
 from Code.Gamemodes.controller import Main_Controller
+from Code.Gamemodes.Sheet.sync import Sheet_Sync
 from Code.Tours.controller import Tours_Controller
 from Code.Tours.Schedule.controller import Scheduled_Tour_Controller
 from Code.Players.controller import Players_Controller
@@ -58,6 +59,9 @@ async def load_controllers(client: discord.Client) -> None:
     """Auxiliar function to load the singleton controllers so that delay is not introduced when they are first needed."""
     # Saving the references is not needed
     Main_Controller()
+    if Main_Controller().loaded_from_snapshot:
+        Main_Controller().schedule_refresh()
+    Sheet_Sync().start()
     Tours_Controller()
     Scheduled_Tour_Controller()
     Players_Controller()
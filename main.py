@@ -4,6 +4,10 @@ import dotenv
 import discord
 
 from Commands.utilities import load_app_commands, load_controllers
+from Code.Utilities.database_connection_sqlite3 import close_connection_pool
+from Code.Utilities.database_executor import Database_Executor
+from Code.Players.controller import Players_Controller
+from Code.Gamemodes.Sheet.sync import Sheet_Sync
 
 class BotGius(discord.Client):
     """A custom Discord client class for hosting AMQ tours."""
@@ -45,6 +49,15 @@ class BotGius(discord.Client):
         print(f'Logged in as {self.user} (ID: {self.user.id})')
 
 
+    async def close(self):
+        """Apply the pending Database operations and close the connections with the Database before closing the client."""
+        Sheet_Sync().stop()
+        await Players_Controller().close()
+        await Database_Executor().drain()
+        close_connection_pool()
+        await super().close()
+
+
 dotenv.load_dotenv('.env')
 TOKEN = os.getenv('DISCORD_TOKEN')
 client = BotGius()